@@ -0,0 +1,78 @@
+"""Generated FEWS data shared by the benchmarks in this directory."""
+
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+
+from fewspy.time_series import ColumnarStore, Events, Header, TimeSeries, TimeSeriesSet
+
+
+def time_series_set(n_series: int, n_events: int = 20_000, columnar: bool = False) -> TimeSeriesSet:
+    """TimeSeriesSet of n_series 15-minute water level series with n_events random values each.
+
+    With columnar=True the time series are held in a ColumnarStore, as read by from_ipc."""
+    datetimes = pd.date_range("2000-01-01", periods=n_events, freq="15min")
+    time_series = []
+    for idx in range(n_series):
+        header = Header(
+            type="instantaneous",
+            module_instance_id="import",
+            location_id=f"location_{idx}",
+            parameter_id="H.meting",
+            time_step={"unit": "second", "multiplier": 900},
+            start_date=datetimes[0],
+            end_date=datetimes[-1],
+            miss_val=-999.0,
+        )
+        events = pd.DataFrame(
+            {
+                "value": np.random.default_rng(idx).random(n_events).round(3),
+                "flag": np.zeros(n_events, dtype="int64"),
+            },
+            index=pd.Index(datetimes, name="datetime"),
+        )
+        time_series += [TimeSeries(header=header, events=Events(events))]
+    time_series_set = TimeSeriesSet(version="1.34", time_zone=0.0, time_series=time_series)
+    if columnar:
+        time_series_set.time_series = ColumnarStore.from_time_series(time_series)
+    return time_series_set
+
+
+def pi_events(n_events: int) -> list:
+    """PI_JSON events of a 15-minute series, as returned by the FEWS PI REST API."""
+    start = datetime(2000, 1, 1)
+    datetimes = (start + timedelta(minutes=15 * i) for i in range(n_events))
+    return [
+        {
+            "date": i.strftime("%Y-%m-%d"),
+            "time": i.strftime("%H:%M:%S"),
+            "value": f"{idx % 1000 / 4:.2f}",
+            "flag": "0",
+        }
+        for idx, i in enumerate(datetimes)
+    ]
+
+
+def pi_time_series_set(n_series: int, n_events: int) -> dict:
+    """PI_JSON TimeSeriesSet of n_series water level series sharing the same n_events events."""
+    events = pi_events(n_events)
+    end = datetime(2000, 1, 1) + timedelta(minutes=15 * (n_events - 1))
+    header = {
+        "type": "instantaneous",
+        "moduleInstanceId": "import",
+        "parameterId": "H.meting",
+        "timeStep": {"unit": "second", "multiplier": "900"},
+        "startDate": {"date": "2000-01-01", "time": "00:00:00"},
+        "endDate": {"date": end.strftime("%Y-%m-%d"), "time": end.strftime("%H:%M:%S")},
+        "missVal": "-999.0",
+        "units": "m",
+    }
+    return {
+        "version": "1.34",
+        "timeZone": "0.0",
+        "timeSeries": [
+            {"header": {**header, "locationId": f"location_{idx}"}, "events": events}
+            for idx in range(n_series)
+        ],
+    }
@@ -0,0 +1,58 @@
+# %%
+"""Benchmark parsing FEWS PI events into fewspy Events, in events per second.
+
+Compares Events.from_dict to the DataFrame-based parser it replaced. Run from the repository root:
+
+    python benchmarks/events_from_dict.py
+"""
+
+import time
+
+import pandas as pd
+
+from fewspy.time_series import EVENT_COLUMNS, Events
+
+from _data import pi_events
+
+N_EVENTS = 1_000_000
+REPEAT = 3
+
+
+def from_dict_dataframe(pi_events, missing_value=None, tz_offset=None):
+    """Events.from_dict before vectorization, for reference."""
+    df = pd.DataFrame(pi_events)
+    if df.empty:
+        return pd.DataFrame(columns=EVENT_COLUMNS).set_index("datetime")
+    if tz_offset is not None:
+        df["datetime"] = pd.to_datetime(df["date"] + " " + df["time"]) - pd.Timedelta(
+            hours=tz_offset
+        )
+    else:
+        df["datetime"] = pd.to_datetime(df["date"] + " " + df["time"])
+    df.drop(columns=[i for i in df.columns if i not in EVENT_COLUMNS], inplace=True)
+    df["flag"] = df["flag"].astype("int")
+    df["value"] = pd.to_numeric(df["value"], downcast="float")
+    if missing_value is not None:
+        df = df.loc[df["value"] != missing_value]
+    df.set_index("datetime", inplace=True)
+    return df
+
+
+def events_per_second(parser, events) -> float:
+    best = float("inf")
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        parser(events, missing_value=-999.0, tz_offset=1.0)
+        best = min(best, time.perf_counter() - start)
+    return len(events) / best
+
+
+if __name__ == "__main__":
+    events = pi_events(N_EVENTS)
+    assert Events.from_dict(events, -999.0, 1.0).equals(
+        from_dict_dataframe(events, -999.0, 1.0)
+    )
+    before = events_per_second(from_dict_dataframe, events)
+    after = events_per_second(Events.from_dict, events)
+    print(f"before: {before:,.0f} events/s")
+    print(f"after:  {after:,.0f} events/s ({after / before:.1f}x)")
@@ -0,0 +1,49 @@
+# %%
+"""Benchmark passing a fewspy TimeSeriesSet between processes or caching it on disk.
+
+Compares TimeSeriesSet.to_ipc/from_ipc to pickle, in seconds and bytes. Run from the repository root:
+
+    python benchmarks/ipc.py
+"""
+
+import pickle
+import tempfile
+import time
+from pathlib import Path
+
+from fewspy.time_series import TimeSeriesSet
+
+from _data import pi_time_series_set
+
+N_SERIES = 1_000
+N_EVENTS = 5_000
+REPEAT = 3
+
+
+def seconds(method, *args) -> float:
+    best = float("inf")
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        method(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+if __name__ == "__main__":
+    tss = TimeSeriesSet.from_dict(pi_time_series_set(N_SERIES, N_EVENTS))
+    pickled = pickle.dumps(tss)
+    content = tss.to_ipc()
+    print(f"pickle: {len(pickled) / 1e6:,.0f} MB")
+    print(f"ipc:    {content.size / 1e6:,.0f} MB")
+    print(f"pickle.dumps:   {seconds(pickle.dumps, tss):.3f} s")
+    print(f"to_ipc:         {seconds(tss.to_ipc):.3f} s")
+    print(f"pickle.loads:   {seconds(pickle.loads, pickled):.3f} s")
+    print(f"from_ipc:       {seconds(TimeSeriesSet.from_ipc, content):.3f} s")
+
+    # a columnar set, e.g. read by from_ipc, is written without copying events per time series
+    columnar = TimeSeriesSet.from_ipc(content)
+    print(f"to_ipc (columnar): {seconds(columnar.to_ipc):.3f} s")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        ipc_file = Path(tmp_dir) / "time_series.arrow"
+        columnar.to_ipc(ipc_file)
+        print(f"from_ipc (memory mapped): {seconds(TimeSeriesSet.from_ipc, ipc_file):.3f} s")
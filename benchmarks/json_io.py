@@ -0,0 +1,84 @@
+# %%
+"""Benchmark writing and reading PI JSON, in events per second.
+
+Compares TimeSeriesSet.to_json to dumping a dict per event with the json module, and read_json with the json
+module, with orjson (if installed) and in streaming mode. Run from the repository root:
+
+    python benchmarks/json_io.py
+"""
+
+import json
+import tempfile
+import time
+from pathlib import Path
+
+from fewspy.io.read_json import read_json
+from fewspy.io.write_json import _pi_header
+from fewspy.time_series import TimeSeriesSet
+from fewspy.utils import json_codec
+
+from _data import time_series_set
+
+N_SERIES = 50
+N_EVENTS = 20_000
+REPEAT = 3
+
+
+def to_json_dicts(time_series_set: TimeSeriesSet, json_file: Path):
+    """PI JSON dumped from a dict per event with the json module, for reference."""
+    pi_time_series_set = {
+        "version": time_series_set.version,
+        "timeZone": str(time_series_set.time_zone),
+        "timeSeries": [
+            {
+                "header": _pi_header(i.header),
+                "events": [
+                    {
+                        "date": f"{datetime:%Y-%m-%d}",
+                        "time": f"{datetime:%H:%M:%S}",
+                        "value": str(value),
+                        "flag": str(flag),
+                    }
+                    for datetime, value, flag in i.events.itertuples()
+                ],
+            }
+            for i in time_series_set.time_series
+        ],
+    }
+    with open(json_file, "w") as dst:
+        json.dump(pi_time_series_set, dst)
+
+
+def read_json_stdlib(json_file: Path) -> TimeSeriesSet:
+    return TimeSeriesSet.from_dict(json.loads(Path(json_file).read_text()))
+
+
+def read_json_stream(json_file: Path) -> TimeSeriesSet:
+    return read_json(json_file, stream=True)
+
+
+def events_per_second(method, *args) -> float:
+    best = float("inf")
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        method(*args)
+        best = min(best, time.perf_counter() - start)
+    return N_SERIES * N_EVENTS / best
+
+
+if __name__ == "__main__":
+    tss = time_series_set(N_SERIES, N_EVENTS)
+    codec = "json" if json_codec.orjson is None else "orjson"
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        json_file = Path(tmp_dir) / "time_series.json"
+        before = events_per_second(to_json_dicts, tss, json_file)
+        after = events_per_second(TimeSeriesSet.to_json, tss, json_file)
+        print(f"write, dicts + json.dump: {before:,.0f} events/s")
+        print(f"write, to_json:           {after:,.0f} events/s ({after / before:.1f}x)")
+
+        assert read_json(json_file).to_df().equals(read_json_stdlib(json_file).to_df())
+        before = events_per_second(read_json_stdlib, json_file)
+        print(f"read, json.loads:         {before:,.0f} events/s")
+        for name, reader in [(f"read_json ({codec})", read_json), ("read_json(stream=True)", read_json_stream)]:
+            after = events_per_second(reader, json_file)
+            print(f"{name + ':':<26}{after:,.0f} events/s ({after / before:.1f}x)")
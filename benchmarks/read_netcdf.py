@@ -0,0 +1,94 @@
+# %%
+"""Benchmark reading a zipped PI_NETCDF response, as returned by get_time_series(document_format="PI_NETCDF").
+
+Compares read_netcdf_from_content, decoding in memory, to writing the NetCDF file to a temporary file and reading
+that. Run from the repository root:
+
+    python benchmarks/read_netcdf.py
+"""
+
+import os
+import tempfile
+import time
+import warnings
+import zipfile
+from io import BytesIO
+from pathlib import Path
+
+import numpy as np
+from netCDF4 import Dataset
+
+from fewspy.io.read_netcdf import read_netcdf, read_netcdf_from_content
+
+SAMPLE_NC = Path(__file__).parents[1] / "tests" / "data" / "io" / "sample.nc"
+N_STATIONS = 20
+N_TIMES = 200_000
+REPEAT = 3
+
+
+def zipped_netcdf(n_stations: int = N_STATIONS, n_times: int = N_TIMES) -> bytes:
+    """Zipped NetCDF content with the variables of sample.nc, scaled to n_stations x n_times"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        nc_file = Path(tmp_dir) / "sample.nc"
+        with Dataset(SAMPLE_NC) as src, Dataset(nc_file, mode="w", format=src.data_model) as dst:
+            sizes = {"time": n_times, "stations": n_stations}
+            for name, dim in src.dimensions.items():
+                dst.createDimension(name, sizes.get(name, dim.size))
+            for name, var in src.variables.items():
+                attrs = {k: var.getncattr(k) for k in var.ncattrs()}
+                out = dst.createVariable(
+                    name, var.dtype, var.dimensions, fill_value=attrs.pop("_FillValue", None)
+                )
+                out.setncatts(attrs)
+                values = var[:]
+                if name == "time":
+                    out[:] = values[0] + 15 * np.arange(n_times)
+                elif var.dimensions == ("time", "stations"):
+                    out[:] = np.random.default_rng(0).random((n_times, n_stations), dtype="float32")
+                else:
+                    out[:] = np.resize(values, out.shape)
+        buffer = BytesIO()
+        with zipfile.ZipFile(buffer, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+            zf.write(nc_file, nc_file.name)
+    return buffer.getvalue()
+
+
+def read_netcdf_from_tempfile(content: bytes):
+    """Previous implementation: write the zip member to a temporary file and read that"""
+    with zipfile.ZipFile(BytesIO(content)) as zf:
+        fd, tmp_path = tempfile.mkstemp(suffix=".nc")
+        os.close(fd)
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(zf.read(zf.namelist()[0]))
+            return read_netcdf(Path(tmp_path))
+        finally:
+            os.remove(tmp_path)
+
+
+def best_of(func, *args) -> float:
+    timings = []
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        func(*args)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+# %%
+if __name__ == "__main__":
+    warnings.simplefilter("ignore")
+    content = zipped_netcdf()
+    print(f"{N_STATIONS} stations x {N_TIMES} times, {len(content) / 1e6:.1f} MB zipped")
+
+    assert all(
+        i.events.equals(j.events)
+        for i, j in zip(
+            read_netcdf_from_content(content).time_series,
+            read_netcdf_from_tempfile(content).time_series,
+        )
+    )
+    tempfile_time = best_of(read_netcdf_from_tempfile, content)
+    memory_time = best_of(read_netcdf_from_content, content)
+    print(f"temporary file: {tempfile_time:.3f} s")
+    print(f"in memory:      {memory_time:.3f} s ({tempfile_time / memory_time:.1f}x)")
@@ -0,0 +1,82 @@
+# %%
+"""Benchmark reading PI XML into a fewspy TimeSeriesSet, in events per second.
+
+Scales up tests/data/io/sample.xml and compares read_xml to the parser it replaced, which built a dict per
+event from a full DOM. Run from the repository root:
+
+    python benchmarks/read_xml.py
+"""
+
+import tempfile
+import time
+from pathlib import Path
+
+from lxml import etree
+
+from fewspy.io.read_xml import read_xml
+from fewspy.time_series import TimeSeriesSet
+
+SAMPLE_XML = Path(__file__).parents[1] / "tests" / "data" / "io" / "sample.xml"
+N_COPIES = 50
+N_REPEAT_EVENTS = 10
+REPEAT = 3
+
+
+def scale_sample_xml(xml_file: Path, n_copies: int = N_COPIES, n_repeat: int = N_REPEAT_EVENTS):
+    """Write sample.xml with every series copied n_copies times and its events repeated n_repeat times."""
+    head, body = SAMPLE_XML.read_text().split("<series>", 1)
+    series = [i.split("</series>")[0] for i in body.split("<series>")]
+    with open(xml_file, "w") as dst:
+        dst.write(head)
+        for idx in range(n_copies):
+            for i in series:
+                header, events = i.split("</header>")
+                header = header.replace("<locationId>", f"<locationId>{idx}_")
+                dst.write(f"<series>{header}</header>{events * n_repeat}</series>\n")
+        dst.write("</TimeSeries>\n")
+
+
+def read_xml_dicts(xml_file: Path) -> TimeSeriesSet:
+    """read_xml before vectorization, for reference."""
+    ns = {"pi": "http://www.wldelft.nl/fews/PI"}
+    root = etree.parse(xml_file).getroot()
+    time_series_set = {
+        "version": root.attrib.get("version"),
+        "timeZone": float(root.find("pi:timeZone", namespaces=ns).text),
+        "timeSeries": [],
+    }
+    for child in [i for i in root.getchildren() if i.tag.endswith("series")]:
+        metadata = {"qualifierId": None}
+        data = []
+        for subchild in child.getchildren():
+            if subchild.tag.endswith("header"):
+                for item in subchild.getchildren():
+                    key = item.tag.split("}")[-1]
+                    if len(item.keys()) == 0:
+                        metadata[key] = item.text
+                    else:
+                        metadata[key] = dict(zip(item.keys(), item.values()))
+            else:
+                data += [{k: v for k, v in zip(subchild.keys(), subchild.values())}]
+        time_series_set["timeSeries"] += [{"header": metadata, "events": data}]
+    return TimeSeriesSet.from_dict(time_series_set)
+
+
+def events_per_second(reader, xml_file: Path) -> float:
+    best = float("inf")
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        time_series_set = reader(xml_file)
+        best = min(best, time.perf_counter() - start)
+    return sum(len(i.events) for i in time_series_set.time_series) / best
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        xml_file = Path(tmp_dir) / "sample.xml"
+        scale_sample_xml(xml_file)
+        assert read_xml(xml_file).to_df().equals(read_xml_dicts(xml_file).to_df())
+        before = events_per_second(read_xml_dicts, xml_file)
+        after = events_per_second(read_xml, xml_file)
+        print(f"before: {before:,.0f} events/s")
+        print(f"after:  {after:,.0f} events/s ({after / before:.1f}x)")
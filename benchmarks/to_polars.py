@@ -0,0 +1,86 @@
+# %%
+"""Benchmark building a polars DataFrame from a fewspy TimeSeriesSet.
+
+Compares TimeSeriesSet.to_polars and TimeSeriesCache.get_time_series(backend="polars") to converting their
+pandas results with pl.from_pandas. Requires polars. Run from the repository root:
+
+    python benchmarks/to_polars.py
+"""
+
+import tempfile
+import time
+from pathlib import Path
+
+import polars as pl
+
+from fewspy.cache import Manifest, TimeSeriesCache
+from fewspy.cache.manifest import FieldEndtry
+from fewspy.time_series import TimeSeriesSet
+
+from _data import time_series_set
+
+N_SERIES = 500
+REPEAT = 3
+
+
+def via_pandas(time_series_set: TimeSeriesSet) -> pl.DataFrame:
+    df = time_series_set.to_df()
+    df.columns = [f"{i}/{j}" for i, j in df.columns]
+    return pl.from_pandas(df.reset_index())
+
+
+def long_via_pandas(time_series_set: TimeSeriesSet) -> pl.DataFrame:
+    return pl.from_pandas(time_series_set.to_long())
+
+
+def long_to_polars(time_series_set: TimeSeriesSet) -> pl.DataFrame:
+    return time_series_set.to_polars(how="long")
+
+
+def time_series_cache(time_series_set: TimeSeriesSet, cache_dir: Path) -> TimeSeriesCache:
+    time_series_set.to_netcdf(cache_dir / "20000101T000000" / "filter")
+    files = [FieldEndtry.from_file(i) for i in cache_dir.glob("*/filter/*.nc")]
+    manifest = Manifest(
+        current_cache="20000101T000000", files=files, expected_file_count=len(files)
+    )
+    return TimeSeriesCache(manifest)
+
+
+def cache_via_pandas(cache: TimeSeriesCache) -> pl.DataFrame:
+    df = cache.get_time_series("filter", "H.meting")
+    df.columns = df.columns.get_level_values("location_id")
+    return pl.from_pandas(df.reset_index())
+
+
+def cache_to_polars(cache: TimeSeriesCache) -> pl.DataFrame:
+    return cache.get_time_series("filter", "H.meting", backend="polars")
+
+
+def seconds(method, obj) -> float:
+    best = float("inf")
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        method(obj)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+if __name__ == "__main__":
+    tss = time_series_set(N_SERIES, columnar=True)
+    assert via_pandas(tss).equals(tss.to_polars())
+    for name, before, after in [
+        ("wide", via_pandas, TimeSeriesSet.to_polars),
+        ("long", long_via_pandas, long_to_polars),
+    ]:
+        before = seconds(before, tss)
+        after = seconds(after, tss)
+        print(f"{name} via pandas: {before:.3f} s")
+        print(f"{name} to_polars:  {after:.3f} s ({before / after:.1f}x)")
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        cache = time_series_cache(tss, Path(cache_dir))
+        assert cache_via_pandas(cache).equals(cache_to_polars(cache))
+        before = seconds(cache_via_pandas, cache)
+        after = seconds(cache_to_polars, cache)
+        print(f"cache via pandas: {before:.3f} s")
+        print(f"cache polars:     {after:.3f} s ({before / after:.1f}x)")
@@ -0,0 +1,68 @@
+# %%
+"""Benchmark writing a fewspy TimeSeriesSet to PI XML, in events per second.
+
+Compares TimeSeriesSet.to_xml to building an lxml DOM and writing it, the usual alternative. Run from the
+repository root:
+
+    python benchmarks/to_xml.py
+"""
+
+import tempfile
+import time
+from pathlib import Path
+
+from lxml import etree
+
+from fewspy.io.read_xml import read_xml
+from fewspy.io.write_xml import PI_NAMESPACE, _header_lines
+from fewspy.time_series import TimeSeriesSet
+
+from _data import time_series_set
+
+N_SERIES = 50
+REPEAT = 3
+
+
+def to_xml_dom(time_series_set: TimeSeriesSet, xml_file: Path):
+    """PI XML written from an lxml DOM, for reference."""
+    pi = f"{{{PI_NAMESPACE}}}"
+    root = etree.Element(f"{pi}TimeSeries", nsmap={None: PI_NAMESPACE}, version="1.34")
+    etree.SubElement(root, f"{pi}timeZone").text = "0.0"
+    for time_series in time_series_set.time_series:
+        series = etree.SubElement(root, f"{pi}series")
+        header = "".join(_header_lines(time_series.header))
+        header = header.replace("<header>", f'<header xmlns="{PI_NAMESPACE}">', 1)
+        series.append(etree.fromstring(header))
+        for datetime, value, flag in time_series.events.itertuples():
+            etree.SubElement(
+                series,
+                f"{pi}event",
+                date=f"{datetime:%Y-%m-%d}",
+                time=f"{datetime:%H:%M:%S}",
+                value=str(value),
+                flag=str(flag),
+            )
+    etree.ElementTree(root).write(xml_file, xml_declaration=True, encoding="UTF-8")
+
+
+def events_per_second(writer, time_series_set: TimeSeriesSet, xml_file: Path) -> float:
+    best = float("inf")
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        writer(time_series_set, xml_file)
+        best = min(best, time.perf_counter() - start)
+    return sum(len(i.events) for i in time_series_set.time_series) / best
+
+
+if __name__ == "__main__":
+    tss = time_series_set(N_SERIES)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        xml_file = Path(tmp_dir) / "time_series.xml"
+        to_xml_dom(tss, xml_file)
+        dom = read_xml(xml_file)
+        tss.to_xml(xml_file)
+        assert read_xml(xml_file).to_df().equals(dom.to_df())
+        before = events_per_second(to_xml_dom, tss, xml_file)
+        after = events_per_second(TimeSeriesSet.to_xml, tss, xml_file)
+        print(f"lxml DOM: {before:,.0f} events/s")
+        print(f"to_xml:   {after:,.0f} events/s ({after / before:.1f}x)")
@@ -1,20 +1,26 @@
 from importlib.metadata import PackageNotFoundError, version
 
 from fewspy.api import Api
+from fewspy.async_api import AsyncApi
 from fewspy.io.read_xml import read_xml
 from fewspy.io.read_json import read_json
 from fewspy.io.read_netcdf import read_netcdf
 from fewspy.io.read_parquet import read_parquet
 from fewspy.io.write_netcdf import write_netcdf
+from fewspy.io.write_json import write_json
+from fewspy.io.write_xml import write_xml
 from fewspy.time_series import TimeSeries, TimeSeriesSet
 
 __all__ = [
     "Api",
+    "AsyncApi",
     "read_xml",
     "read_json",
     "read_netcdf",
     "read_parquet",
     "write_netcdf",
+    "write_json",
+    "write_xml",
     "TimeSeries",
     "TimeSeriesSet",
 ]
@@ -7,11 +7,19 @@ https://publicwiki.deltares.nl/display/FEWSDOC/FEWS+PI+REST+Web+Service
 
 import pandas as pd
 from .utils.timer import Timer
-from .utils.url import validate_url
+from .utils.url import normalize_url, validate_url
+from .utils.session import DEFAULT_POOL_SIZE, create_session
+from .utils.resilience import DEFAULT_TIMEOUT, CircuitBreaker, RetryPolicy
 import logging
 import urllib3
 from typing import Literal
 
+from fewspy.wrappers.get_time_series_async import DEFAULT_MAX_CONCURRENCY
+from fewspy.utils.planning import (
+    DEFAULT_MAX_SERIES_PER_REQUEST,
+    DEFAULT_MAX_URL_LENGTH,
+    estimate_time_window,
+)
 from fewspy.wrappers import (
     get_time_series_async,
     get_qualifiers,
@@ -34,11 +42,65 @@ class Api:
     For more info on how-to work with the FEWS REST Web Service, visit the Deltares Website: https://publicwiki.deltares.nl/display/FEWSDOC/FEWS+PI+REST+Web+Service
     """
 
-    def __init__(self, url, logger=None, ssl_verify=None):
+    def __init__(
+        self,
+        url,
+        logger=None,
+        ssl_verify=None,
+        pool_size=DEFAULT_POOL_SIZE,
+        session=None,
+        validate: Literal["eager", "lazy", "skip"] = "eager",
+        timeout=DEFAULT_TIMEOUT,
+        retry=None,
+        circuit_breaker=None,
+    ):
+        """
+        Args:
+            url (str): url Delft-FEWS PI REST WebService.
+            logger (logging.Logger, optional): Logger to pass logging to. Defaults to None.
+            ssl_verify (bool, optional): verify ssl-certificates. Defaults to None, estimated from url.
+            pool_size (int, optional): maximum number of keep-alive connections in the session pool. Defaults to 10.
+            session (requests.Session, optional): session to share with other objects. Defaults to None,
+            creating a new connection-pooled session.
+            validate (Literal["eager", "lazy", "skip"], optional): when to validate url against the live
+            WebService: on construction ("eager"), on the first request ("lazy") or never ("skip"). Urls
+            validated before in this process are not requested again. Defaults to "eager".
+            timeout (float | tuple, optional): connect and read timeout in seconds. Defaults to (10, 300).
+            retry (RetryPolicy, optional): retry policy for failed requests. Defaults to None, retrying
+            3 times with jittered exponential backoff. Pass RetryPolicy(retries=0) to disable retries.
+            circuit_breaker (CircuitBreaker, optional): circuit breaker for all requests of this Api.
+            Defaults to None, opening the circuit after 5 consecutive failures for 30 seconds.
+        """
         self.document_format = "PI_JSON"
         self.logger = logger
         self.timer = Timer(logger)
-        self.url, verify = validate_url(url)
+
+        # set timeout, retry policy and circuit breaker, applied to all requests
+        self.timeout = timeout
+        self.retry = RetryPolicy() if retry is None else retry
+        self.circuit_breaker = (
+            CircuitBreaker() if circuit_breaker is None else circuit_breaker
+        )
+
+        # set session, re-used by all requests to the FEWS PI REST WebService
+        if session is None:
+            self.session = create_session(pool_size=pool_size)
+        else:
+            self.session = session
+
+        # validate url now, on first request or never
+        if validate == "eager":
+            self.url, verify = validate_url(
+                url, session=self.session, timeout=self.timeout
+            )
+            self._validated = True
+        elif validate in ["lazy", "skip"]:
+            self.url, verify = normalize_url(url)
+            self._validated = validate == "skip"
+        else:
+            raise ValueError(
+                f"validate should be 'eager', 'lazy' or 'skip', not '{validate}'"
+            )
 
         # set ssl_verify
         if ssl_verify is None:
@@ -52,14 +114,40 @@ class Api:
         else:
             self.logger = logger
 
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        """Close all pooled connections of the session"""
+        self.session.close()
+
+    def _ensure_validated(self):
+        """Validate url on first request if Api is constructed with validate="lazy"."""
+        if not self._validated:
+            validate_url(self.url, session=self.session, timeout=self.timeout)
+            self._validated = True
+
+    def __request_kwargs(self) -> dict:
+        return dict(
+            timeout=self.timeout,
+            retry=self.retry,
+            circuit_breaker=self.circuit_breaker,
+        )
+
     def __kwargs(self, url_post_fix: str, kwargs: dict) -> dict:
+        self._ensure_validated()
         kwargs = {
             **kwargs,
             **dict(
                 url=f"{self.url}{url_post_fix}",
                 verify=self.ssl_verify,
                 logger=self.logger,
+                session=self.session,
             ),
+            **self.__request_kwargs(),
         }
         kwargs.pop("self")
         kwargs.pop("parallel", None)
@@ -137,8 +225,15 @@ class Api:
             "name" and "group_id".
 
         """
+        self._ensure_validated()
         url = f"{self.url}qualifiers"
-        result = get_qualifiers(url, verify=self.ssl_verify, logger=self.logger)
+        result = get_qualifiers(
+            url,
+            verify=self.ssl_verify,
+            logger=self.logger,
+            session=self.session,
+            **self.__request_kwargs(),
+        )
         return result
 
     def get_timezone_id(self):
@@ -149,8 +244,15 @@ class Api:
             str: timezone id FEWS API is running on
 
         """
+        self._ensure_validated()
         url = f"{self.url}timezoneid"
-        result = get_timezone_id(url, verify=self.ssl_verify, logger=self.logger)
+        result = get_timezone_id(
+            url,
+            verify=self.ssl_verify,
+            logger=self.logger,
+            session=self.session,
+            **self.__request_kwargs(),
+        )
         return result
 
     def get_time_series(
@@ -167,10 +269,20 @@ class Api:
         show_statistics=False,
         parallel=False,
         document_format: str = "PI_JSON",
+        max_concurrency=DEFAULT_MAX_CONCURRENCY,
+        max_url_length=DEFAULT_MAX_URL_LENGTH,
+        max_series_per_request=DEFAULT_MAX_SERIES_PER_REQUEST,
+        time_window=None,
+        max_events_per_request=None,
+        stream=False,
+        executor=None,
     ):
         """
         Get FEWS qualifiers as a pandas DataFrame
 
+        If the request is split in batches or time windows and one of them fails after retries,
+        fewspy.utils.planning.IncompleteResultError is raised instead of returning the other time series.
+
         Args:
             filter_id (str): the FEWS id of the filter to pass as request parameter
             location_ids (list): list with FEWS location ids to extract timeseries from. Defaults to None.
@@ -184,14 +296,48 @@ class Api:
             show_statistics (bool): if True, time series statistics will be included in header. Defaults to False.
             document_format (str): request document format to return. Defaults to PI_JSON.
             parallel (bool): if True, timeseries are requested by the asynchronous wrapper. Defaults to False
+            max_concurrency (int): maximum number of requests in flight if parallel=True. Defaults to 10.
+            max_url_length (int): maximum length of a request url. Longer requests are split in batches of
+            location_ids and parameter_ids. Defaults to 8000.
+            max_series_per_request (int): maximum number of expected time series per request. Defaults to 500.
+            time_window (datetime.timedelta): if specified, [start_time, end_time] is requested in consecutive
+            windows of at most time_window and stitched into one TimeSeriesSet. Defaults to None.
+            max_events_per_request (int): if specified (and time_window is not), time_window is estimated from
+            the time steps in a headers request, so a request is expected to return at most max_events_per_request
+            events. Defaults to None.
+            stream (bool): if True, PI_JSON responses are parsed while they are downloaded, so a full response is
+            never in memory. Only used if parallel=False. Defaults to False.
+            executor (concurrent.futures.Executor): executor to parse responses in as they complete if parallel=True,
+            e.g. a ProcessPoolExecutor for large fan-outs. Defaults to None, parsing in the event loop.
 
         Returns:
             df (pandas.DataFrame): Pandas dataframe with index "id" and columns
             "name" and "group_id".
 
         """
+        if (time_window is None) and (max_events_per_request is not None):
+            headers = self.get_time_series(
+                filter_id=filter_id,
+                location_ids=location_ids,
+                start_time=start_time,
+                end_time=end_time,
+                parameter_ids=parameter_ids,
+                qualifier_ids=qualifier_ids,
+                only_headers=True,
+                max_url_length=max_url_length,
+                max_series_per_request=max_series_per_request,
+            )
+            time_window = estimate_time_window(
+                [i.header.time_step for i in headers.time_series],
+                max_events_per_request=max_events_per_request,
+                max_series_per_request=max_series_per_request,
+            )
+            self.logger.debug(f"Estimated time_window {time_window}")
+
         kwargs = self.__kwargs(url_post_fix="timeseries", kwargs=locals())
-        if (self.document_format != "PI_JSON") and parallel:
+        kwargs.pop("max_events_per_request")
+        kwargs.pop("headers", None)
+        if (document_format != "PI_JSON") and parallel:
             self.logger.warning(
                 "Wont run parallel, as this is only supported for documentFromat PI_JSON"
             )
@@ -199,8 +345,12 @@ class Api:
         if parallel:
             kwargs.pop("only_headers")
             kwargs.pop("show_statistics")
+            kwargs.pop("session")
+            kwargs.pop("stream")
             result = get_time_series_async(**kwargs)
         else:
+            kwargs.pop("max_concurrency")
+            kwargs.pop("executor")
             result = get_time_series(**kwargs)
 
         return result
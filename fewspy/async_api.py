@@ -0,0 +1,428 @@
+"""
+Module for calling the FEWS REST API asynchronously.
+
+The module contains one class with awaitable methods corresponding with the FEWS PI-REST requests:
+https://publicwiki.deltares.nl/display/FEWSDOC/FEWS+PI+REST+Web+Service
+"""
+
+import logging
+from typing import Literal
+
+import aiohttp
+import pandas as pd
+
+from .time_series import TimeSeriesSet
+from .utils.json_codec import loads
+from .utils.session import http_get_async
+from .utils.resilience import DEFAULT_TIMEOUT, CircuitBreaker, RetryPolicy
+from .utils.timer import Timer
+from .utils.transformations import parameters_to_fews
+from .utils.url import normalize_url, validate_url_async
+from .wrappers.get_locations import _locations_from_json
+from .wrappers.get_parameters import _parameters_from_json
+from .wrappers.get_qualifiers import COLUMNS as QUALIFIER_COLUMNS
+from .wrappers.get_qualifiers import _qualifiers_from_content
+from .wrappers.get_time_series import _time_series_set_from_content, _ts_or_headers
+from .wrappers.get_time_series_async import (
+    DEFAULT_CONNECTION_LIMIT,
+    DEFAULT_MAX_CONCURRENCY,
+    _fetch_all_async,
+    _result_async_to_time_series_set,
+)
+from .utils.planning import (
+    DEFAULT_MAX_SERIES_PER_REQUEST,
+    DEFAULT_MAX_URL_LENGTH,
+    check_complete,
+    plan_batches,
+    plan_time_windows,
+)
+
+LOGGER = logging.getLogger(__name__)
+
+
+class AsyncApi:
+    """
+    Asynchronous Python API for the Deltares FEWS PI REST Web Service.
+
+    All request methods are coroutines sharing one aiohttp.ClientSession, so they can be awaited and
+    gathered within a running event loop. Use as async context manager, or await close() when done:
+
+        async with AsyncApi(url) as api:
+            locations, parameters = await asyncio.gather(api.get_locations(), api.get_parameters())
+
+    For more info on how-to work with the FEWS REST Web Service, visit the Deltares Website: https://publicwiki.deltares.nl/display/FEWSDOC/FEWS+PI+REST+Web+Service
+    """
+
+    def __init__(
+        self,
+        url,
+        logger=None,
+        ssl_verify=None,
+        pool_size=DEFAULT_CONNECTION_LIMIT,
+        session=None,
+        validate: Literal["lazy", "skip"] = "lazy",
+        timeout=DEFAULT_TIMEOUT,
+        retry=None,
+        circuit_breaker=None,
+    ):
+        """
+        Args:
+            url (str): url Delft-FEWS PI REST WebService.
+            logger (logging.Logger, optional): Logger to pass logging to. Defaults to None.
+            ssl_verify (bool, optional): verify ssl-certificates. Defaults to None, estimated from url.
+            pool_size (int, optional): maximum number of simultaneous connections in the session. Defaults to 100.
+            session (aiohttp.ClientSession, optional): session to share with other objects. Defaults to None,
+            creating a new session on the first request.
+            validate (Literal["lazy", "skip"], optional): validate url against the live WebService on the
+            first request ("lazy") or never ("skip"). Defaults to "lazy".
+            timeout (float | tuple, optional): connect and read timeout in seconds. Defaults to (10, 300).
+            retry (RetryPolicy, optional): retry policy for failed requests. Defaults to None, retrying
+            3 times with jittered exponential backoff. Pass RetryPolicy(retries=0) to disable retries.
+            circuit_breaker (CircuitBreaker, optional): circuit breaker for all requests of this AsyncApi.
+            Defaults to None, opening the circuit after 5 consecutive failures for 30 seconds.
+        """
+        if validate not in ["lazy", "skip"]:
+            raise ValueError(f"validate should be 'lazy' or 'skip', not '{validate}'")
+
+        self.document_format = "PI_JSON"
+        self.url, verify = normalize_url(url)
+        self.pool_size = pool_size
+        self._session = session
+        self._owns_session = session is None
+        self._validated = validate == "skip"
+        self.timeout = timeout
+        self.retry = RetryPolicy() if retry is None else retry
+        self.circuit_breaker = (
+            CircuitBreaker() if circuit_breaker is None else circuit_breaker
+        )
+
+        # set ssl_verify
+        if ssl_verify is None:
+            self.ssl_verify = verify
+        else:
+            self.ssl_verify = ssl_verify
+
+        # set logger
+        if logger is None:
+            self.logger = LOGGER
+        else:
+            self.logger = logger
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
+
+    async def close(self):
+        """Close the session, if created by this AsyncApi"""
+        if self._owns_session and (self._session is not None):
+            await self._session.close()
+            self._session = None
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """aiohttp.ClientSession, created within the running event loop on first access"""
+        if self._session is None:
+            connector = aiohttp.TCPConnector(limit=self.pool_size)
+            self._session = aiohttp.ClientSession(connector=connector)
+        return self._session
+
+    async def _ensure_validated(self):
+        """Validate url on first request if AsyncApi is constructed with validate="lazy"."""
+        if not self._validated:
+            await validate_url_async(
+                self.url, session=self.session, timeout=self.timeout
+            )
+            self._validated = True
+
+    async def _get(self, url_post_fix: str, parameters: dict | None = None):
+        await self._ensure_validated()
+        return await http_get_async(
+            self.session,
+            f"{self.url}{url_post_fix}",
+            params=parameters,
+            verify=self.ssl_verify,
+            timeout=self.timeout,
+            retry=self.retry,
+            circuit_breaker=self.circuit_breaker,
+        )
+
+    async def get_parameters(self, filter_id=None) -> pd.DataFrame:
+        """
+        Get FEWS parameters as a pandas DataFrame
+
+        Args:
+            filter_id (str): the FEWS id of the filter to pass as request parameter
+
+        Returns:
+            df (pandas.DataFrame): Pandas dataframe with index "id" and columns
+            "name" and "group_id".
+
+        """
+        timer = Timer(self.logger)
+        parameters = parameters_to_fews(
+            dict(filter_id=filter_id, document_format="PI_JSON"), bool_to_string=True
+        )
+        response, content = await self._get("parameters", parameters)
+        timer.report("Parameters request")
+
+        if response.status == 200:
+            df = _parameters_from_json(loads(content))
+            timer.report("Parameters parsed")
+        else:
+            self.logger.error(f"FEWS Server responds {content.decode()}")
+            df = _parameters_from_json({})
+
+        return df
+
+    async def get_filters(self, filter_id=None) -> list:
+        """
+        Get FEWS filters as a list of dictionaries
+
+        Args:
+            filter_id (str): the FEWS id of the filter to pass as request parameter
+
+        Returns:
+            list: FEWS filters as returned by the WebService
+
+        """
+        timer = Timer(self.logger)
+        parameters = parameters_to_fews(
+            dict(filter_id=filter_id, document_format="PI_JSON"), bool_to_string=True
+        )
+        response, content = await self._get("filters", parameters)
+        timer.report("Filters request")
+
+        result = []
+        if response.status == 200:
+            result = loads(content).get("filters", [])
+            timer.report("Filters parsed")
+        else:
+            self.logger.error(f"FEWS Server responds {content.decode()}")
+
+        return result
+
+    async def get_locations(
+        self,
+        filter_id=None,
+        attributes=[],
+        remove_duplicates=False,
+        document_format: Literal["PI_JSON", "GEO_JSON"] = "GEO_JSON",
+    ):
+        """
+        Get FEWS locations as a GeoPandas GeoDataFrame
+
+        Args:
+            filter_id (str): the FEWS id of the filter to pass as request parameter
+            attributes (list): if not empty, the location attributes to include as columns in the GeoDataFrame.
+            remove_duplicates (bool): if True, duplicated location_ids are removed. Default = False
+            document_format (Literal["PI_JSON", "GEO_JSON"]): request document format to return. Supports "GEO_JSON" and "PI_JSON". Defaults to "GEO_JSON".
+
+        Returns:
+            gdf (geopandas.GeoDataFrame): GeoDataFrame with index "location_id".
+
+        """
+        timer = Timer(self.logger)
+        parameters = parameters_to_fews(
+            dict(
+                filter_id=filter_id,
+                attributes=attributes,
+                document_format=document_format,
+            ),
+            bool_to_string=True,
+        )
+        response, content = await self._get("locations", parameters)
+        timer.report("Locations request")
+
+        if response.status == 200:
+            gdf = _locations_from_json(
+                loads(content),
+                document_format=document_format,
+                attributes=attributes,
+                remove_duplicates=remove_duplicates,
+            )
+            timer.report("Locations parsed")
+            return gdf
+        else:
+            self.logger.error(f"FEWS Server responds {content.decode()}")
+
+    async def get_qualifiers(self) -> pd.DataFrame:
+        """
+        Get FEWS qualifiers as Pandas DataFrame
+
+        Returns:
+            df (pandas.DataFrame): Pandas dataframe with index "id" and columns
+            "name" and "group_id".
+
+        """
+        timer = Timer(self.logger)
+        response, content = await self._get("qualifiers")
+        timer.report("Qualifiers request")
+
+        if response.status == 200:
+            df = _qualifiers_from_content(content)
+            timer.report("Qualifiers parsed")
+        else:
+            self.logger.error(f"FEWS Server responds {content.decode()}")
+            df = pd.DataFrame(columns=QUALIFIER_COLUMNS).set_index("id")
+
+        return df
+
+    async def get_timezone_id(self):
+        """
+        Get FEWS timezone_id
+
+        Returns:
+            str: timezone id FEWS API is running on
+
+        """
+        timer = Timer(self.logger)
+        response, content = await self._get(
+            "timezoneid", parameters_to_fews(dict(document_format="PI_JSON"))
+        )
+        timer.report("Timezone request")
+
+        result = None
+        if response.status == 200:
+            result = content.decode()
+            timer.report("Timezone parsed")
+        else:
+            self.logger.error(f"FEWS Server responds {content.decode()}")
+
+        return result
+
+    async def get_time_series(
+        self,
+        filter_id,
+        location_ids=None,
+        start_time=None,
+        end_time=None,
+        parameter_ids=None,
+        qualifier_ids=None,
+        thinning=None,
+        only_headers=False,
+        omit_missing=True,
+        show_statistics=False,
+        document_format: str = "PI_JSON",
+        parallel=False,
+        max_concurrency=DEFAULT_MAX_CONCURRENCY,
+        max_url_length=DEFAULT_MAX_URL_LENGTH,
+        max_series_per_request=DEFAULT_MAX_SERIES_PER_REQUEST,
+        time_window=None,
+        executor=None,
+    ) -> TimeSeriesSet:
+        """
+        Get FEWS time series as a fewspy TimeSeriesSet
+
+        If the request is split in batches or time windows and one of them fails after retries,
+        fewspy.utils.planning.IncompleteResultError is raised instead of returning the other time series.
+
+        Args:
+            filter_id (str): the FEWS id of the filter to pass as request parameter
+            location_ids (list): list with FEWS location ids to extract timeseries from. Defaults to None.
+            parameter_ids (list): list with FEWS parameter ids to extract timeseries from. Defaults to None.
+            qualifier_ids (list): list with FEWS qualifier ids to extract timeseries from. Defaults to None.
+            start_time (datetime.datetime): datetime-object with start datetime to use in request. Defaults to None.
+            end_time (datetime.datetime): datetime-object with end datetime to use in request. Defaults to None.
+            thinning (int): integer value for thinning parameter to use in request. Defaults to None.
+            only_headers (bool): if True, only headers will be returned. Defaults to False.
+            omit_missing (bool): if True, no missings values will be returned. Defaults to True.
+            show_statistics (bool): if True, time series statistics will be included in header. Defaults to False.
+            document_format (str): request document format to return. Defaults to PI_JSON.
+            parallel (bool): if True, batches of location_ids and parameter_ids are requested concurrently.
+            Only supported for document_format PI_JSON. Defaults to False.
+            max_concurrency (int): maximum number of requests in flight if parallel=True. Defaults to 10.
+            max_url_length (int): maximum length of a request url. Longer requests are split in batches of
+            location_ids and parameter_ids. Defaults to 8000.
+            max_series_per_request (int): maximum number of expected time series per request. Defaults to 500.
+            time_window (datetime.timedelta): if specified, [start_time, end_time] is requested in consecutive
+            windows of at most time_window and stitched into one TimeSeriesSet. Defaults to None.
+            executor (concurrent.futures.Executor): executor to parse responses in as they complete if
+            parallel=True, e.g. a ProcessPoolExecutor. Defaults to None, parsing in the event loop.
+
+        Returns:
+            TimeSeriesSet: time series set with the requested time series
+
+        """
+        report_string = _ts_or_headers(only_headers)
+        timer = Timer(self.logger)
+        parameters = parameters_to_fews(locals(), bool_to_string=True)
+
+        if (document_format != "PI_JSON") and parallel:
+            self.logger.warning(
+                "Wont run parallel, as this is only supported for documentFromat PI_JSON"
+            )
+            parallel = False
+        batches = plan_batches(
+            f"{self.url}timeseries",
+            parameters,
+            location_ids=location_ids,
+            parameter_ids=parameter_ids,
+            qualifier_ids=qualifier_ids,
+            max_url_length=max_url_length,
+            max_series_per_request=max_series_per_request,
+        )
+        windows = plan_time_windows(start_time, end_time, time_window)
+        requests_parameters = [{**i, **j} for i in batches for j in windows]
+        if len(requests_parameters) > 1:
+            self.logger.debug(
+                f"Request split into {len(batches)} batches and {len(windows)} time windows"
+            )
+
+        if parallel:
+            await self._ensure_validated()
+            result_async = await _fetch_all_async(
+                self.session,
+                f"{self.url}timeseries",
+                requests_parameters,
+                verify=self.ssl_verify,
+                logger=self.logger,
+                max_concurrency=max_concurrency,
+                timeout=self.timeout,
+                retry=self.retry,
+                circuit_breaker=self.circuit_breaker,
+                executor=executor,
+            )
+            timer.report(report_string.format(status="requested and parsed"))
+            check_complete(result_async, requests_parameters)
+            time_series_set = _result_async_to_time_series_set(
+                result_async, deduplicate=len(windows) > 1
+            )
+            timer.report(report_string.format(status="stitched"))
+            return time_series_set
+
+        time_series_sets = [
+            await self._get_time_series_set(i, document_format, report_string)
+            for i in requests_parameters
+        ]
+        check_complete(time_series_sets, requests_parameters)
+        return TimeSeriesSet.concat(
+            [i for i in time_series_sets if i is not None], deduplicate=len(windows) > 1
+        )
+
+    async def _get_time_series_set(
+        self, parameters: dict, document_format: str, report_string: str
+    ) -> TimeSeriesSet | None:
+        """Request and parse one batch of time series, None if the server responds with an error."""
+        timer = Timer(self.logger)
+        response, content = await self._get("timeseries", parameters)
+        timer.report(report_string.format(status="request"))
+
+        if response.ok:
+            self.logger.debug(response.url)
+            time_series_set = _time_series_set_from_content(
+                content, document_format=document_format
+            )
+            timer.report(report_string.format(status="parsed"))
+            if time_series_set.empty:
+                self.logger.debug(
+                    f"FEWS WebService request passing empty set: {response.url}"
+                )
+        else:
+            self.logger.error(
+                f"FEWS WebService request {response.url} responds {content.decode()}"
+            )
+            time_series_set = None
+
+        return time_series_set
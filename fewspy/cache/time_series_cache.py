@@ -1,5 +1,6 @@
 from fewspy.cache.manifest import Manifest
-from typing import Optional
+from fewspy.utils.optional import import_optional
+from typing import Literal, Optional
 import threading
 import xarray as xr
 import pandas as pd
@@ -168,6 +169,7 @@ class TimeSeriesCache:
         start_time: Optional[datetime | str] = None,
         end_time: Optional[datetime | str] = None,
         location_ids: Optional[list[str]] = None,
+        backend: Literal["pandas", "polars"] = "pandas",
     ) -> pd.DataFrame:
         """fetch time series data from NetCDF file based on filter_id and parameter_id
 
@@ -177,10 +179,16 @@ class TimeSeriesCache:
             start_time (Optional[datetime  |  str], optional): start_time Defaults to None.
             end_time (Optional[datetime  |  str], optional): end_time. Defaults to None.
             location_ids (Optional[list[str]], optional): location_ids. Defaults to None.
+            backend (Literal["pandas", "polars"], optional): DataFrame library of the result. "polars" requires
+            the optional dependency polars. Defaults to "pandas".
 
         Returns:
-            pd.DataFrame: DataFrame with datetime index and MultiIndex columns (location_id, parameter_id)
+            pd.DataFrame: DataFrame with datetime index and MultiIndex columns (location_id, parameter_id). If
+            backend="polars", a polars.DataFrame with a datetime column and a column per location_id.
         """
+        if backend not in ["pandas", "polars"]:
+            raise ValueError(f"backend should be 'pandas' or 'polars', not '{backend}'")
+
         dataset = self._get_open_ds(filter_id=filter_id, parameter_id=parameter_id)
         da = dataset[parameter_id]
 
@@ -201,6 +209,9 @@ class TimeSeriesCache:
         if slicer:
             da = da.sel(**slicer)
 
+        if backend == "polars":
+            return self._to_polars(da)
+
         s = da.to_series()
         if "station_id" in s.index.names:
             df = s.unstack("station_id")
@@ -220,3 +231,27 @@ class TimeSeriesCache:
         df.sort_index(inplace=True, axis=1)
 
         return df
+
+    @classmethod
+    def _to_polars(cls, da: xr.DataArray):
+        """Polars DataFrame with a datetime column and a column per station, built from the DataArray values
+
+        Values are read once into a column-major array, so polars wraps every column without a copy.
+        """
+        pl = import_optional("polars")
+        station_dim = "station_id" if "station_id" in da.dims else "stations"
+        da = da.transpose("time", station_dim)
+        station_ids = da[station_dim].values.astype(str)
+        values = np.asfortranarray(da.values)
+        times = da["time"].values
+
+        # sort rows and columns like the pandas backend
+        if not (np.diff(times) >= np.timedelta64(0, "s")).all():
+            order = np.argsort(times, kind="stable")
+            times, values = times[order], np.asfortranarray(values[order])
+        columns = [pl.Series("datetime", times)]
+        columns += [
+            pl.Series(station_ids[idx], values[:, idx])
+            for idx in np.argsort(station_ids, kind="stable")
+        ]
+        return pl.DataFrame(columns)
@@ -0,0 +1,86 @@
+from typing import Iterator
+
+import numpy as np
+import pandas as pd
+
+# header fields in the order of the PI schema
+HEADER_FIELDS = [
+    "type",
+    "module_instance_id",
+    "location_id",
+    "parameter_id",
+    "qualifier_id",
+    "time_step",
+    "start_date",
+    "end_date",
+    "miss_val",
+    "station_name",
+    "lat",
+    "lon",
+    "x",
+    "y",
+    "z",
+    "units",
+]
+# number of events formatted at once, to keep memory flat for long time series
+EVENT_CHUNK_SIZE = 100_000
+
+
+def to_string(value) -> str:
+    """Value as PI string, with NaN as defined by xs:float"""
+    if isinstance(value, float) and np.isnan(value):
+        return "NaN"
+    return str(value)
+
+
+def _value_strings(values: np.ndarray, miss_val: float) -> list[str]:
+    values = np.where(np.isnan(values), miss_val, values).astype(values.dtype)
+    strings = values.astype(str)
+    strings[np.isnan(values)] = "NaN"
+    return strings.tolist()
+
+
+def _flag_strings(flags: np.ndarray) -> list[str | None]:
+    if np.issubdtype(flags.dtype, np.floating):
+        return [None if np.isnan(i) else str(int(i)) for i in flags.tolist()]
+    return [str(i) for i in flags.tolist()]
+
+
+def iter_event_strings(
+    events: pd.DataFrame,
+    miss_val: float,
+    time_zone: float | None = None,
+    chunk_size: int = EVENT_CHUNK_SIZE,
+) -> Iterator[tuple[list[str], list[str], list[str | None]]]:
+    """Format events as PI strings in bulk, in chunks of at most chunk_size events
+
+    Args:
+        events (pd.DataFrame): events with datetime index and value and (optional) flag columns
+        miss_val (float): value written for missing (NaN) values
+        time_zone (float, optional): time zone offset in hours added to datetimes. Defaults to None.
+        chunk_size (int, optional): maximum number of events per chunk. Defaults to 100_000.
+
+    Yields:
+        tuple[list[str], list[str], list[str | None]]: datetimes formatted as %Y-%m-%dT%H:%M:%S, values and
+        flags, None if the flag of an event is missing
+    """
+    if events.empty:
+        return
+    datetimes = events.index.to_numpy(dtype="datetime64[s]")
+    if time_zone:
+        datetimes = datetimes + np.timedelta64(pd.Timedelta(hours=time_zone))
+    values = pd.to_numeric(events["value"]).to_numpy()
+    if not np.issubdtype(values.dtype, np.floating):
+        values = values.astype("float64")
+    if "flag" in events.columns:
+        flags = events["flag"].to_numpy()
+    else:
+        flags = np.full(len(events), np.nan)
+
+    for start in range(0, len(events), chunk_size):
+        end = start + chunk_size
+        yield (
+            np.datetime_as_string(datetimes[start:end], unit="s").tolist(),
+            _value_strings(values[start:end], miss_val),
+            _flag_strings(flags[start:end]),
+        )
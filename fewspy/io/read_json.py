@@ -1,15 +1,181 @@
-from fewspy.time_series import TimeSeriesSet
+from fewspy.time_series import TimeSeriesSet, TimeSeries
+from fewspy.utils.json_codec import loads
 from pathlib import Path
+from typing import Iterable, Iterator
+import codecs
 import json
 
+CHUNK_SIZE = 1024 * 1024
+WHITESPACE = " \t\n\r"
+# characters that can follow a complete number
+NUMBER_END = ",}]" + WHITESPACE
 
-def read_json(json_path: Path) -> TimeSeriesSet:
+
+class _PiJsonStream:
+    """Incremental reader of a PI_JSON document, keeping only the unparsed text in memory."""
+
+    def __init__(self, chunks: Iterable[bytes | str]):
+        self._chunks = iter(chunks)
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._json_decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self, min_size: int = 1) -> bool:
+        """Append at least min_size characters to the buffer, return False at end of stream."""
+        self._buffer = self._buffer[self._pos :]
+        self._pos = 0
+        size = len(self._buffer)
+        while (not self._eof) and (len(self._buffer) - size < min_size):
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                self._eof = True
+                self._buffer += self._decoder.decode(b"", final=True)
+            elif isinstance(chunk, bytes):
+                self._buffer += self._decoder.decode(chunk)
+            else:
+                self._buffer += chunk
+        return len(self._buffer) > size
+
+    def _peek(self) -> str:
+        """Next non-whitespace character, empty at end of stream."""
+        while True:
+            while (self._pos < len(self._buffer)) and (
+                self._buffer[self._pos] in WHITESPACE
+            ):
+                self._pos += 1
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._fill():
+                return ""
+
+    def _expect(self, char: str):
+        if self._peek() != char:
+            raise json.JSONDecodeError(f"Expecting '{char}'", self._buffer, self._pos)
+        self._pos += 1
+
+    def _value(self):
+        """Decode the next complete JSON value, reading chunks until it is complete."""
+        self._peek()
+        while True:
+            try:
+                value, end = self._json_decoder.raw_decode(self._buffer, self._pos)
+                # a number is only complete if a delimiter follows, e.g. "1." may continue as "1.5"
+                is_number = isinstance(value, (int, float)) and not isinstance(value, bool)
+                if self._eof or (
+                    (end < len(self._buffer))
+                    and ((not is_number) or (self._buffer[end] in NUMBER_END))
+                ):
+                    self._pos = end
+                    return value
+            except json.JSONDecodeError:
+                if self._eof:
+                    raise
+            # grow the buffer geometrically, so a large value is decoded in amortized linear time
+            self._fill(min_size=max(len(self._buffer) - self._pos, 1))
+
+    def __iter__(self) -> Iterator[tuple[str, object]]:
+        self._expect("{")
+        while self._peek() not in ["}", ""]:
+            key = self._value()
+            self._expect(":")
+            if (key == "timeSeries") and (self._peek() == "["):
+                self._pos += 1
+                while self._peek() not in ["]", ""]:
+                    yield key, self._value()
+                    if self._peek() == ",":
+                        self._pos += 1
+                self._expect("]")
+            else:
+                yield key, self._value()
+            if self._peek() == ",":
+                self._pos += 1
+        self._expect("}")
+
+
+def iter_pi_json(chunks: Iterable[bytes | str]) -> Iterator[tuple[str, object]]:
+    """Iterate over the top-level items of a PI_JSON document read in chunks
+
+    Every element of "timeSeries" is yielded as a separate ("timeSeries", dict) item as soon as it is
+    complete, so the full document is never in memory.
+
+    Args:
+        chunks (Iterable[bytes | str]): PI_JSON document in chunks, e.g. response.iter_content()
+
+    Yields:
+        tuple[str, object]: key and value, e.g. ("version", "1.34") or ("timeSeries", {...})
+    """
+    return iter(_PiJsonStream(chunks))
+
+
+def read_json_from_chunks(
+    chunks: Iterable[bytes | str], validate: bool = True, compact: bool = False
+) -> TimeSeriesSet:
+    """Parse a PI_JSON document read in chunks into a fewspy TimeSeriesSet
+
+    Each time series is parsed as soon as its JSON object is complete and the raw text is discarded.
+
+    Args:
+        chunks (Iterable[bytes | str]): PI_JSON document in chunks, e.g. response.iter_content()
+        validate (bool, optional): if False, headers and time series are constructed without validation,
+        for trusted FEWS output only. Defaults to True.
+        compact (bool, optional): if True, values are float32, flags int8 and header strings shared by time
+        series are interned. Defaults to False.
+
+    Returns:
+        TimeSeriesSet: timeseries
+    """
+    time_series_set = TimeSeriesSet()
+    time_zone = None
+    pending = []
+
+    def _time_series(pi_time_series):
+        return TimeSeries.from_dict(
+            pi_time_series, time_zone, validate=validate, compact=compact
+        )
+
+    for key, value in iter_pi_json(chunks):
+        if key == "version":
+            time_series_set.version = value
+        elif key == "timeZone":
+            time_zone = float(value)
+            time_series_set.time_zone = time_zone
+            # time series before timeZone could not be shifted yet
+            time_series_set.time_series += [_time_series(i) for i in pending]
+            pending = []
+        elif key == "timeSeries":
+            if time_series_set.time_zone is None:
+                pending += [value]
+            else:
+                time_series_set.time_series += [_time_series(value)]
+    time_series_set.time_series += [_time_series(i) for i in pending]
+    return time_series_set
+
+
+def read_json(
+    json_path: Path, validate: bool = True, compact: bool = False, stream: bool = False
+) -> TimeSeriesSet:
     """Read the content of a JSON file into a fewspy TimeSeriesSet
 
+    The document is decoded with orjson if installed, else with the json module.
+
     Args:
         json_path (Path): path to PI_JSON file
+        validate (bool, optional): if False, headers and time series are constructed without validation,
+        for trusted FEWS output only. Defaults to True.
+        compact (bool, optional): if True, values are float32, flags int8 and header strings shared by time
+        series are interned. Defaults to False.
+        stream (bool, optional): if True, the file is read in chunks and every time series is parsed as soon
+        as it is complete, so the full document is never in memory. Defaults to False.
 
     Returns:
         TimeSeriesSet: timeseries
     """
-    return TimeSeriesSet.from_dict(json.loads(Path(json_path).read_text()))
+    if stream:
+        with open(json_path, "rb") as src:
+            chunks = iter(lambda: src.read(CHUNK_SIZE), b"")
+            return read_json_from_chunks(chunks, validate=validate, compact=compact)
+    return TimeSeriesSet.from_dict(
+        loads(Path(json_path).read_bytes()), validate=validate, compact=compact
+    )
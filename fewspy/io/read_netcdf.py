@@ -4,10 +4,11 @@ import pandas as pd
 from fewspy.time_series import TimeSeriesSet, TimeSeries, Header
 import zipfile
 from io import BytesIO
-import tempfile
-import os
 import warnings
 
+# size of the chunks a zipped NetCDF file is decompressed in
+CHUNK_SIZE = 1024 * 1024
+
 
 def _parse_time(time_var):
     times = num2date(time_var[:], units=time_var.units, only_use_cftime_datetimes=False)
@@ -22,7 +23,10 @@ def _get_time_step(time_index):
     first_delta = deltas.iloc[0]
     equidistant = (deltas == first_delta).all()
     if equidistant:
-        return {"unit": "second", "multiplier": first_delta.total_seconds()}
+        multiplier = first_delta.total_seconds()
+        if multiplier.is_integer():
+            multiplier = int(multiplier)
+        return {"unit": "second", "multiplier": multiplier}
     else:
         return {"unit": "nonequidistant"}
 
@@ -47,8 +51,23 @@ def _get_parameter_id(ds):
     return parameter_ids
 
 
+def _read_zip_member(zf: zipfile.ZipFile, name: str) -> bytearray:
+    """Decompress a zip member in chunks into a buffer of its final size, without intermediate copies."""
+    info = zf.getinfo(name)
+    buffer = bytearray(info.file_size)
+    view = memoryview(buffer)
+    with zf.open(info) as src:
+        pos = 0
+        while pos < info.file_size:
+            size = src.readinto(view[pos : pos + CHUNK_SIZE])
+            if size == 0:
+                raise zipfile.BadZipFile(f"Unexpected end of data in {name}")
+            pos += size
+    return buffer
+
+
 def read_netcdf_from_content(content) -> TimeSeriesSet:
-    """Read zipped NetCDF content as TimeSeriesSet."""
+    """Read zipped NetCDF content as TimeSeriesSet, decoded in memory without temporary files."""
     with zipfile.ZipFile(BytesIO(content)) as zf:
         nc_file_name = next(
             (name for name in zf.namelist() if name.endswith(".nc")), None
@@ -57,33 +76,29 @@ def read_netcdf_from_content(content) -> TimeSeriesSet:
             raise ValueError(
                 f"No NetCDF-file in content, with filelist {zf.namelist()}"
             )
-
-        # Create a temp file path without opening the file
-        fd, tmp_path = tempfile.mkstemp(suffix=".nc")
-        os.close(fd)  # Close the low-level file descriptor
-
-        try:
-            with open(tmp_path, "wb") as f:
-                f.write(zf.read(nc_file_name))  # write zip contents to temp file
-
-            result = read_netcdf(Path(tmp_path))
-        finally:
-            os.remove(tmp_path)
-        return result
+        nc_content = _read_zip_member(zf, nc_file_name)
+    return read_netcdf(nc_content)
 
 
 def read_netcdf(
-    nc_file: Path,
+    nc_file: Path | bytes | bytearray | memoryview,
     time_series_type: str | None = None,
     module_instance_id: str | None = None,
+    validate: bool = True,
+    compact: bool = False,
 ) -> TimeSeriesSet:
     """Read the content of a NetCDF file into a fewspy TimeSeriesSet
 
     Args:
-        nc_file (Path): path to the NetCDF file
+        nc_file (Path | bytes | bytearray | memoryview): path to the NetCDF file or its content, decoded in
+        memory
         time_series_type (str | None, optional): type for timeseries header. Defaults to None.
         Note (!) specifying time_series_type is advised. If you don't data will be interpreted as instantaneous
         module_instance_id (str | None, optional): ModuleInstanceId for timeseries header. Defaults to None.
+        validate (bool, optional): if False, headers and time series are constructed without validation.
+        Defaults to True.
+        compact (bool, optional): if True, values are float32 and header strings shared by time series are
+        interned. Defaults to False.
 
     Returns:
         TimeSeriesSet: timeseries
@@ -97,8 +112,15 @@ def read_netcdf(
         )
         time_series_type = "instantaneous"
 
-    # Read file
-    with Dataset(nc_file, mode="r") as ds:
+    header_cls = Header if validate else Header.construct
+    time_series_cls = TimeSeries if validate else TimeSeries.construct
+
+    # Read file, or content in memory
+    if isinstance(nc_file, (bytes, bytearray, memoryview)):
+        dataset = Dataset("inmemory.nc", mode="r", memory=nc_file)
+    else:
+        dataset = Dataset(nc_file, mode="r")
+    with dataset as ds:
         # init TimeSeriesSet
         time_series_set = TimeSeriesSet(time_zone=0.0)
 
@@ -129,7 +151,7 @@ def read_netcdf(
             miss_val = float(var._FillValue)
             for i in range(len(location_ids)):
                 # define header
-                header = Header(
+                header = header_cls(
                     type=time_series_type,
                     module_instance_id=module_instance_id,
                     location_id=location_ids[i],
@@ -147,14 +169,18 @@ def read_netcdf(
                     qualifier_id=None,
                     miss_val=miss_val,
                 )
+                if compact:
+                    header.intern_strings()
 
                 # define events
                 data = {"value": pd.to_numeric(var[:, i].data, downcast="float")}
+                if compact:
+                    data["value"] = data["value"].astype("float32", copy=False)
                 events = pd.DataFrame(data=data, index=time_index)
 
                 # append to TimeSeriesSet
                 time_series_set.time_series.append(
-                    TimeSeries(header=header, events=events)
+                    time_series_cls(header=header, events=events)
                 )
 
     return time_series_set
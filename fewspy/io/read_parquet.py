@@ -5,27 +5,34 @@ import pandas as pd
 from fewspy.io.header_file import get_header_file
 
 
-def _row_to_header(row):
+def _row_to_header(row, compact=False):
     d = row.to_dict()
     header = d.copy()
     header["time_step"] = {
         "unit": header.pop("time_step.unit"),
         "multiplier": header.pop("time_step.multiplier"),
     }
-    return Header(**header)
+    header = Header(**header)
+    if compact:
+        header.intern_strings()
+    return header
 
 
-def _column_to_time_series(df, column):
+def _column_to_time_series(df, column, compact=False):
     df = pd.DataFrame(df[column])
     df.columns = ["value"]
+    if compact:
+        df["value"] = df["value"].astype("float32")
     return df
 
 
-def read_parquet(parquet_file: Path) -> TimeSeriesSet:
+def read_parquet(parquet_file: Path, compact: bool = False) -> TimeSeriesSet:
     """Parse parquet file to fewspy TimeSeriesSet
 
     Args:
         parquet_file (Path): path to parquet-file
+        compact (bool, optional): if True, values are float32 and header strings shared by time series are
+        interned. Defaults to False.
 
     Returns:
         TimeSeriesSet: timeseries
@@ -33,7 +40,7 @@ def read_parquet(parquet_file: Path) -> TimeSeriesSet:
     # header to list of dict
     header_df = pd.read_parquet(get_header_file(parquet_file))
     header_df.set_index(["location_id", "parameter_id"], drop=False, inplace=True)
-    header_series = header_df.apply(_row_to_header, axis=1)
+    header_series = header_df.apply(_row_to_header, axis=1, compact=compact)
 
     # read timeseries
     df = pd.read_parquet(parquet_file, engine="pyarrow")
@@ -43,7 +50,9 @@ def read_parquet(parquet_file: Path) -> TimeSeriesSet:
     time_series_set.time_series = [
         TimeSeries(
             header=i,
-            events=_column_to_time_series(df, (i.location_id, i.parameter_id)),
+            events=_column_to_time_series(
+                df, (i.location_id, i.parameter_id), compact=compact
+            ),
         )
         for i in header_series
     ]
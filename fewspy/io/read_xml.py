@@ -1,86 +1,191 @@
+from io import BytesIO
 from lxml import etree
 from pathlib import Path
-from fewspy.time_series import TimeSeriesSet
+from typing import IO, Iterator
+import numpy as np
+from fewspy.time_series import Events, Header, TimeSeriesSet, TimeSeries
 
 ns = {"pi": "http://www.wldelft.nl/fews/PI"}
+PI_TAGS = {f"{{{ns['pi']}}}{i}": i for i in ["TimeSeries", "timeZone", "series"]}
+# event attributes of a series, extracted in one XPath evaluation per column
+EVENT_XPATHS = {
+    key: etree.XPath(f"pi:event/@{key}", namespaces=ns, smart_strings=False)
+    for key in ["date", "time", "value", "flag"]
+}
+
+
+def _parse_header(header) -> dict:
+    """Parse a PI XML header element to a FEWS PI header dict"""
+    metadata = {"qualifierId": None}
+
+    for item in header:
+        key = etree.QName(item).localname
+        item_keys = item.keys()
+
+        # qualifierId kan meerdere keren voorkomen
+        if key == "qualifierId":
+            if metadata["qualifierId"] is None:
+                metadata["qualifierId"] = []
+            metadata["qualifierId"].append(item.text)
+            continue
+
+        if len(item_keys) == 0:
+            metadata[key] = item.text
+        else:
+            metadata[key] = dict(item.items())
+    return metadata
+
+
+def _event_columns(series) -> dict:
+    """Extract the event attributes of a PI XML series element in columns"""
+    columns = {key: xpath(series) for key, xpath in EVENT_XPATHS.items()}
+
+    # flag is optional per event
+    if len(columns["flag"]) != len(columns["date"]):
+        columns["flag"] = [
+            i.get("flag", np.nan) for i in series.iterchildren(f"{{{ns['pi']}}}event")
+        ]
+    return columns
+
+
+def _parse_series(
+    series, time_zone: float | None = None, validate: bool = True, compact: bool = False
+) -> TimeSeries:
+    """Parse a PI XML series element to a TimeSeries"""
+    header_element = series.find("pi:header", namespaces=ns)
+    header = Header.from_dict(
+        {"qualifierId": None} if header_element is None else _parse_header(header_element),
+        validate=validate,
+        compact=compact,
+    )
+    events = Events.from_columns(
+        **_event_columns(series),
+        missing_value=header.miss_val,
+        tz_offset=time_zone,
+        compact=compact,
+    )
+    if validate:
+        return TimeSeries(header=header, events=events)
+    return TimeSeries.construct(header=header, events=events)
+
+
+def iter_pi_xml(
+    source: Path | IO[bytes], validate: bool = True, compact: bool = False
+) -> Iterator[tuple[str, object]]:
+    """Iterate over the items of a PI XML document, one series at a time
+
+    The document is parsed incrementally and every series element is cleared after it is parsed, so memory
+    is proportional to the largest series, not to the document.
 
+    Args:
+        source (Path | IO[bytes]): path to PI XML file or a binary file-like object
+        validate (bool, optional): if False, headers and time series are constructed without validation,
+        for trusted FEWS output only. Defaults to True.
+        compact (bool, optional): if True, values are float32, flags int8 and header strings shared by time
+        series are interned. Defaults to False.
+
+    Yields:
+        tuple[str, object]: key and value, e.g. ("version", "1.34"), ("timeZone", 0.0) or ("timeSeries",
+        TimeSeries)
+    """
+    if isinstance(source, Path):
+        source = str(source)
+    root, time_zone = None, None
+    context = etree.iterparse(source, events=("end",), tag=list(PI_TAGS))
+    for _, element in context:
+        key = PI_TAGS[element.tag]
+
+        # version is an attribute of the root, read from the parent of its first child or the root itself
+        if root is None:
+            root = element if key == "TimeSeries" else element.getparent()
+            yield "version", root.get("version")
+        if key == "timeZone":
+            time_zone = float(element.text)
+            yield "timeZone", time_zone
+        elif key == "series":
+            time_series = _parse_series(element, time_zone, validate, compact)
+
+            # free the parsed series and its predecessors
+            element.clear(keep_tail=True)
+            while element.getprevious() is not None:
+                del element.getparent()[0]
+            yield "timeSeries", time_series
+    del context
+
+
+def iter_xml(
+    source: Path | IO[bytes], validate: bool = True, compact: bool = False
+) -> Iterator[TimeSeries]:
+    """Iterate over the time series of a PI XML file, keeping one series in memory at a time
 
-def _parse_xml_data(root) -> TimeSeriesSet:
-
-    version = root.attrib.get("version")
-    time_zone_element = root.find("pi:timeZone", namespaces=ns)
-    time_zone = float(time_zone_element.text) if time_zone_element is not None else None
-
-    time_series_set = {"version": version, "timeZone": time_zone, "timeSeries": []}
-
-    # Get children, filter out timezone.
-    rootchildren = [
-        child for child in root.getchildren() if child.tag.endswith("series")
-    ]
-
-    # Loop over children (individual timeseries in the xml)
-    for child in rootchildren:
-        subchildren = child.getchildren()  # alle headers en en timevalues
-        metadata = {"qualifierId": None}
-        data = []
-
-        for subchild in subchildren:
-            # Write header to dict
-            if subchild.tag.endswith(
-                "header"
-            ):  # gewoonlijk eerste subchild is de header
-                header_childs = subchild.getchildren()
-                metadata = {"qualifierId": None}
-
-                for item in header_childs:
-                    key = item.tag.split("}")[-1]
-                    item_keys = item.keys()
-
-                    # qualifierId kan meerdere keren voorkomen
-                    if key == "qualifierId":
-                        if metadata["qualifierId"] is None:
-                            metadata["qualifierId"] = []
-                        metadata["qualifierId"].append(item.text)
-                        continue
-
-                    if len(item_keys) == 0:
-                        metadata[key] = item.text
-                    else:
-                        metadata[key] = {}
-                        for item_key, item_value in zip(item_keys, item.values()):
-                            metadata[key][item_key] = item_value
-            # Get event data
-            else:
-                data += [{k: v for k, v in zip(subchild.keys(), subchild.values())}]
-
-        time_series_set["timeSeries"] += [{"header": metadata, "events": data}]
-
-    return TimeSeriesSet.from_dict(time_series_set)
-
-
-def read_xml(xml_path: Path) -> TimeSeriesSet:
+    Args:
+        source (Path | IO[bytes]): path to PI XML file or a binary file-like object
+        validate (bool, optional): if False, headers and time series are constructed without validation,
+        for trusted FEWS output only. Defaults to True.
+        compact (bool, optional): if True, values are float32, flags int8 and header strings shared by time
+        series are interned. Defaults to False.
+
+    Yields:
+        TimeSeries: time series, with datetimes shifted to UTC by the timeZone of the document
+    """
+    for key, value in iter_pi_xml(source, validate, compact):
+        if key == "timeSeries":
+            yield value
+
+
+def _read_pi_xml(
+    source: Path | IO[bytes], validate: bool = True, compact: bool = False
+) -> TimeSeriesSet:
+    """Read a PI XML document into a TimeSeriesSet, parsing every series as soon as it is complete"""
+    time_series_set = TimeSeriesSet()
+    for key, value in iter_pi_xml(source, validate, compact):
+        if key == "version":
+            time_series_set.version = value
+        elif key == "timeZone":
+            time_series_set.time_zone = value
+        elif key == "timeSeries":
+            time_series_set.time_series += [value]
+    return time_series_set
+
+
+def read_xml(
+    xml_path: Path, validate: bool = True, compact: bool = False
+) -> TimeSeriesSet:
     """Parse PI XML file to fewspy TimeSeriesSet
 
+    The file is parsed incrementally, so only one series is in memory as XML at a time. Use iter_xml to
+    process time series one by one.
+
     Args:
         xml_path (Path): Path to xml-file
+        validate (bool, optional): if False, headers and time series are constructed without validation,
+        for trusted FEWS output only. Defaults to True.
+        compact (bool, optional): if True, values are float32, flags int8 and header strings shared by time
+        series are interned. Defaults to False.
 
     Returns:
         TimeSeriesSet: timeseries
     """
 
-    root = etree.parse(xml_path).getroot()  # Parse XML data
-    return _parse_xml_data(root)
+    return _read_pi_xml(Path(xml_path), validate=validate, compact=compact)
 
 
-def read_xml_from_string(xml_string: str) -> TimeSeriesSet:
+def read_xml_from_string(
+    xml_string: str, validate: bool = True, compact: bool = False
+) -> TimeSeriesSet:
     """Parse PI XML file to fewspy TimeSeriesSet
 
     Args:
         xml_string (str): string with PI_XML data
+        validate (bool, optional): if False, headers and time series are constructed without validation,
+        for trusted FEWS output only. Defaults to True.
+        compact (bool, optional): if True, values are float32, flags int8 and header strings shared by time
+        series are interned. Defaults to False.
 
     Returns:
         TimeSeriesSet: timeseries
     """
 
-    root = etree.fromstring(xml_string.encode("utf-8"))
-    return _parse_xml_data(root)
+    return _read_pi_xml(
+        BytesIO(xml_string.encode("utf-8")), validate=validate, compact=compact
+    )
@@ -0,0 +1,95 @@
+from datetime import datetime
+from io import StringIO
+from pathlib import Path
+from typing import IO, Iterable
+
+from fewspy.io.pi_format import HEADER_FIELDS, iter_event_strings, to_string
+from fewspy.utils.conversions import snake_to_camel_case
+from fewspy.utils.json_codec import dumps
+
+
+def _pi_date(date: datetime) -> dict:
+    return {"date": f"{date:%Y-%m-%d}", "time": f"{date:%H:%M:%S}"}
+
+
+def _pi_header(header) -> dict:
+    """FEWS PI header dict of a header, with values as strings and without fields that are None"""
+    pi_header = {}
+    for field in HEADER_FIELDS:
+        value = getattr(header, field)
+        if value is None:
+            continue
+        elif field == "qualifier_id":
+            value = list(value)
+        elif field == "time_step":
+            value = {k: str(v) for k, v in value.items() if v is not None}
+        elif field in ["start_date", "end_date"]:
+            value = _pi_date(value)
+        else:
+            value = to_string(value)
+        pi_header[snake_to_camel_case(field)] = value
+    return pi_header
+
+
+def _event_objects(datetimes: list, values: list, flags: list) -> str:
+    """PI JSON event objects of formatted events, separated by commas"""
+    if None in flags:
+        flags = ["" if i is None else f',"flag":"{i}"' for i in flags]
+    else:
+        flags = [f',"flag":"{i}"' for i in flags]
+    return ",".join(
+        [
+            f'{{"date":"{i[:10]}","time":"{i[11:]}","value":"{j}"{k}}}'
+            for i, j, k in zip(datetimes, values, flags)
+        ]
+    )
+
+
+def _write_series(dst: IO[str], time_series, time_zone: float | None):
+    header = time_series.header
+    dst.write(f'{{"header":{dumps(_pi_header(header))},"events":[')
+    separator = ""
+    for chunk in iter_event_strings(time_series.events, header.miss_val, time_zone):
+        dst.write(separator + _event_objects(*chunk))
+        separator = ","
+    dst.write("]}")
+
+
+def write_json(
+    time_series: Iterable,
+    json_file: Path | None = None,
+    version: str | None = None,
+    time_zone: float | None = None,
+) -> str | None:
+    """Write time series to a PI JSON file, series by series without building the document in memory.
+
+    Events are written in local time of time_zone, missing values as the missVal of their header.
+
+    Args:
+        time_series (Iterable[TimeSeries]): time series to write
+        json_file (Path, optional): PI JSON file to write to. Defaults to None, returning the document.
+        version (str, optional): PI version of the document. Defaults to None.
+        time_zone (float, optional): time zone offset in hours of the document. Defaults to None, UTC.
+
+    Returns:
+        str | None: PI JSON document if json_file is None
+    """
+    if json_file is None:
+        dst = StringIO()
+    else:
+        json_file = Path(json_file)
+        json_file.parent.mkdir(exist_ok=True, parents=True)
+        dst = open(json_file, "w", encoding="utf-8")
+
+    with dst:
+        dst.write("{")
+        if version is not None:
+            dst.write(f'"version":{dumps(version)},')
+        dst.write(f'"timeZone":"{float(time_zone or 0.0)}","timeSeries":[')
+        for idx, i in enumerate(time_series):
+            if idx > 0:
+                dst.write(",")
+            _write_series(dst, i, time_zone)
+        dst.write("]}")
+        if json_file is None:
+            return dst.getvalue()
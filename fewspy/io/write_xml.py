@@ -0,0 +1,96 @@
+from datetime import datetime
+from pathlib import Path
+from typing import IO, Iterable
+from xml.sax.saxutils import escape, quoteattr
+
+from fewspy.io.pi_format import HEADER_FIELDS, iter_event_strings, to_string
+from fewspy.utils.conversions import snake_to_camel_case
+
+PI_NAMESPACE = "http://www.wldelft.nl/fews/PI"
+PI_SCHEMA = "https://fewsdocs.deltares.nl/schemas/version1.0/pi-schemas/pi_timeseries.xsd"
+
+
+def _attributes(attributes: dict) -> str:
+    return "".join(
+        f" {k}={quoteattr(str(v))}" for k, v in attributes.items() if v is not None
+    )
+
+
+def _date_attributes(date: datetime) -> str:
+    return _attributes({"date": f"{date:%Y-%m-%d}", "time": f"{date:%H:%M:%S}"})
+
+
+def _header_lines(header) -> list[str]:
+    """PI XML lines of a header, skipping fields that are None"""
+    lines = ["    <header>\n"]
+    for field in HEADER_FIELDS:
+        value = getattr(header, field)
+        tag = snake_to_camel_case(field)
+        if value is None:
+            continue
+        elif field == "qualifier_id":
+            lines += [f"      <{tag}>{escape(i)}</{tag}>\n" for i in value]
+        elif field == "time_step":
+            lines += [f"      <{tag}{_attributes(value)}/>\n"]
+        elif field in ["start_date", "end_date"]:
+            lines += [f"      <{tag}{_date_attributes(value)}/>\n"]
+        else:
+            lines += [f"      <{tag}>{escape(to_string(value))}</{tag}>\n"]
+    return lines + ["    </header>\n"]
+
+
+def _event_lines(datetimes: list, values: list, flags: list) -> str:
+    """PI XML event lines of formatted events"""
+    if None in flags:
+        flags = ["" if i is None else f' flag="{i}"' for i in flags]
+    else:
+        flags = [f' flag="{i}"' for i in flags]
+    return "".join(
+        [
+            f'    <event date="{i[:10]}" time="{i[11:]}" value="{j}"{k}/>\n'
+            for i, j, k in zip(datetimes, values, flags)
+        ]
+    )
+
+
+def _write_series(dst: IO[str], time_series, time_zone: float | None):
+    header = time_series.header
+    dst.write("  <series>\n")
+    dst.writelines(_header_lines(header))
+    for chunk in iter_event_strings(time_series.events, header.miss_val, time_zone):
+        dst.write(_event_lines(*chunk))
+    dst.write("  </series>\n")
+
+
+def write_xml(
+    time_series: Iterable,
+    xml_file: Path,
+    version: str | None = None,
+    time_zone: float | None = None,
+) -> None:
+    """Write time series to a PI XML file, series by series without building a DOM.
+
+    Events are written in local time of time_zone, missing values as the missVal of their header.
+
+    Args:
+        time_series (Iterable[TimeSeries]): time series to write
+        xml_file (Path): PI XML file to write to
+        version (str, optional): PI version of the document. Defaults to None.
+        time_zone (float, optional): time zone offset in hours of the document. Defaults to None, UTC.
+    """
+    xml_file = Path(xml_file)
+    xml_file.parent.mkdir(exist_ok=True, parents=True)
+
+    root_attributes = {
+        "xmlns": PI_NAMESPACE,
+        "xmlns:xsi": "http://www.w3.org/2001/XMLSchema-instance",
+        "xsi:schemaLocation": f"{PI_NAMESPACE} {PI_SCHEMA}",
+        "version": version,
+    }
+    with open(xml_file, "w", encoding="utf-8") as dst:
+        dst.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+        dst.write(f"<TimeSeries{_attributes(root_attributes)}>\n")
+        dst.write(f"  <timeZone>{float(time_zone or 0.0)}</timeZone>\n")
+        for i in time_series:
+            _write_series(dst, i, time_zone)
+        dst.write("</TimeSeries>\n")
@@ -1,21 +1,40 @@
+import json
+import sys
 import warnings
-from dataclasses import field
+from collections.abc import Sequence
+from dataclasses import MISSING, field, fields, replace
+from functools import lru_cache
 from datetime import datetime
+from itertools import chain
+from operator import itemgetter
 from pathlib import Path
 from typing import List, Literal, TypedDict
 from pydantic.dataclasses import dataclass
 from pydantic import ConfigDict
+import numpy as np
 import pandas as pd
+import pyarrow as pa
 
 from fewspy.io.header_file import get_header_file
+from fewspy.io.write_json import write_json
 from fewspy.io.write_netcdf import write_netcdf
+from fewspy.io.write_xml import write_xml
 from fewspy.utils.conversions import camel_to_snake_case, dict_to_datetime
+from fewspy.utils.optional import import_optional
 from fewspy.utils.transformations import flatten_list
 
 DATETIME_KEYS = ["start_date", "end_date"]
 FLOAT_KEYS = ["miss_val", "lat", "lon", "x", "y", "z"]
 STRING_KEYS = ["module_instance_id"]
 EVENT_COLUMNS = ["datetime", "value", "flag"]
+# integer dtype of flags stored as float because some are missing, e.g. float32 flags are int8 if compact
+INTEGER_FLAG_DTYPES = {np.dtype("float64"): "int64", np.dtype("float32"): "int8"}
+LONG_ID_COLUMNS = ["location_id", "parameter_id", "qualifier_id"]
+EQUIDISTANT_UNITS = ["second", "minute", "hour", "day", "week"]
+# header strings shared by many time series, interned in compact mode
+COMPACT_KEYS = ["type", "module_instance_id", "parameter_id", "units"]
+# resolution pandas parses datetime strings to (ns before pandas 3.0, us since)
+DATETIME_DTYPE = pd.to_datetime(["1970-01-01 00:00:00"]).dtype
 
 
 @dataclass(config=ConfigDict(arbitrary_types_allowed=False))
@@ -24,6 +43,54 @@ class TimeStepDict(TypedDict, total=False):
     multiplier: int | None
 
 
+def _string_or_none(value) -> str | None:
+    return None if value == "None" else str(value)
+
+
+def _time_step(time_step: dict) -> dict:
+    if "multiplier" in time_step.keys():
+        time_step["multiplier"] = int(float(time_step["multiplier"]))
+    return time_step
+
+
+@lru_cache(maxsize=None)
+def _field_converter(pi_key: str) -> tuple:
+    """Memoized FEWS PI key to dataclass field name and value converter, e.g. locationId to location_id"""
+    k = camel_to_snake_case(pi_key)
+    if k in DATETIME_KEYS:
+        return k, dict_to_datetime
+    elif k in FLOAT_KEYS:
+        return k, float
+    elif k in STRING_KEYS:
+        return k, _string_or_none
+    elif k == "time_step":
+        return k, _time_step
+    return k, None
+
+
+@lru_cache(maxsize=None)
+def _field_defaults(cls) -> tuple:
+    """Memoized defaults (None if required) and default factories of the fields of a dataclass, in order"""
+    defaults = {i.name: None if i.default is MISSING else i.default for i in fields(cls)}
+    factories = {i.name: i.default_factory for i in fields(cls) if i.default_factory is not MISSING}
+    return defaults, factories
+
+
+def _construct(cls, **kwargs):
+    """Construct a (pydantic) dataclass without validation, for trusted input"""
+    defaults, factories = _field_defaults(cls)
+    values = defaults.copy()
+    values.update(kwargs)
+    if len(values) > len(defaults):
+        values = {k: v for k, v in values.items() if k in defaults}
+    for k, factory in factories.items():
+        if k not in kwargs:
+            values[k] = factory()
+    obj = cls.__new__(cls)
+    obj.__dict__.update(values)
+    return obj
+
+
 def reliables(df: pd.DataFrame, threshold: int = 6) -> pd.DataFrame:
     """
     Filters reliables from an Events type Pandas DataFrame
@@ -74,36 +141,45 @@ class Header:
         return cls.from_dict(pi_header=pi_header)
 
     @classmethod
-    def from_dict(cls, pi_header: dict) -> "Header":
+    def construct(cls, **kwargs) -> "Header":
+        """Construct a Header without validation, for trusted and correctly typed input"""
+        return _construct(cls, **kwargs)
+
+    @classmethod
+    def from_dict(
+        cls, pi_header: dict, validate: bool = True, compact: bool = False
+    ) -> "Header":
         """
         Parse Header from FEWS PI header dict.
 
         Args:
             pi_header (dict): FEWS PI header as dictionary
+            validate (bool, optional): if False, the header is constructed without validation, for trusted FEWS
+            output only. Defaults to True.
+            compact (bool, optional): if True, strings shared by headers are interned. Defaults to False.
 
         Returns:
             Header: FEWS-PI header-style dataclass
 
         """
 
-        def _convert_kv(k: str, v) -> dict:
-            k = camel_to_snake_case(k)
-            if k in DATETIME_KEYS:
-                v = dict_to_datetime(v)
-            elif k in FLOAT_KEYS:
-                v = float(v)
-            elif k in STRING_KEYS:
-                if v == "None":
-                    v = None
-                else:
-                    v = str(v)
-            elif k == "time_step":
-                if "multiplier" in v.keys():
-                    v["multiplier"] = float(v["multiplier"])
-            return k, v
-
-        args = (_convert_kv(k, v) for k, v in pi_header.items())
-        return cls(**{i[0]: i[1] for i in args})
+        kwargs = {}
+        for k, v in pi_header.items():
+            k, converter = _field_converter(k)
+            kwargs[k] = v if converter is None else converter(v)
+        header = cls(**kwargs) if validate else cls.construct(**kwargs)
+        if compact:
+            header.intern_strings()
+        return header
+
+    def intern_strings(self) -> "Header":
+        """Intern header strings shared by many time series, so they are stored once"""
+        for k in COMPACT_KEYS:
+            if isinstance(self.__dict__[k], str):
+                self.__dict__[k] = sys.intern(self.__dict__[k])
+        if self.qualifier_id is not None:
+            self.__dict__["qualifier_id"] = [sys.intern(i) for i in self.qualifier_id]
+        return self
 
     def to_row(self):
         flat = self.__dict__.copy()
@@ -113,6 +189,47 @@ class Header:
         return flat
 
 
+def _parse_event_columns(
+    date: list,
+    time: list,
+    value: list,
+    flag: list | None = None,
+    tz_offset: float | None = None,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Parse PI event columns to datetime, value and flag arrays."""
+
+    # parse datetimes in one vectorized step, PI uses ISO 8601 dates and times
+    datetimes = np.array(
+        [f"{i} {j}" for i, j in zip(date, time)], dtype="datetime64[s]"
+    ).astype(DATETIME_DTYPE)
+    if tz_offset is not None:
+        datetimes = datetimes - np.timedelta64(pd.Timedelta(hours=tz_offset))
+
+    # set numeric types, flags are float if some are missing
+    values = pd.to_numeric(np.asarray(value, dtype="float64"), downcast="float")
+    if flag is None:
+        flags = np.full(len(values), np.nan)
+    else:
+        try:
+            flags = np.asarray(flag, dtype="int64")
+        except (TypeError, ValueError):
+            flags = np.asarray(flag, dtype="float64")
+
+    return datetimes, values, flags
+
+
+def _compact_columns(
+    values: np.ndarray, flags: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """Cast values to float32 and flags to int8 (float32 if some are missing)."""
+    values = values.astype("float32", copy=False)
+    if np.issubdtype(flags.dtype, np.integer):
+        flags = flags.astype("int8", copy=False)
+    else:
+        flags = flags.astype("float32", copy=False)
+    return values, flags
+
+
 class Events(pd.DataFrame):
     """FEWS-PI events in pandas DataFrame"""
 
@@ -129,52 +246,87 @@ class Events(pd.DataFrame):
 
     @classmethod
     def from_dict(
-        cls, pi_events: list, missing_value: float | None = None, tz_offset: float | None = None
+        cls,
+        pi_events: list,
+        missing_value: float | None = None,
+        tz_offset: float | None = None,
+        compact: bool = False,
     ) -> pd.DataFrame:
         """
         Parse Events from FEWS PI events dict.
 
         Args:
             pi_events (dict): FEWS PI events as dictionary
+            missing_value (float, optional): events with this value are removed. Defaults to None.
+            tz_offset (float, optional): time zone offset in hours, subtracted from datetimes. Defaults to None.
+            compact (bool, optional): if True, values are float32 and flags int8. Defaults to False.
 
         Returns:
             Events: pandas DataFrame
 
         """
 
-        df = cls(pi_events)
-
-        if df.empty:
+        if not pi_events:
             return pd.DataFrame(columns=EVENT_COLUMNS).set_index("datetime")
 
-        # set datetime
-        if tz_offset is not None:
-            df["datetime"] = pd.to_datetime(
-                df["date"] + " " + df["time"]
-            ) - pd.Timedelta(hours=tz_offset)
-        else:
-            df["datetime"] = pd.to_datetime(df["date"] + " " + df["time"])
+        # extract columns in bulk
+        def _column(key):
+            return list(map(itemgetter(key), pi_events))
+
+        return cls.from_columns(
+            date=_column("date"),
+            time=_column("time"),
+            value=_column("value"),
+            flag=_column("flag") if "flag" in pi_events[0] else None,
+            missing_value=missing_value,
+            tz_offset=tz_offset,
+            compact=compact,
+        )
+
+    @classmethod
+    def from_columns(
+        cls,
+        date: list,
+        time: list,
+        value: list,
+        flag: list | None = None,
+        missing_value: float | None = None,
+        tz_offset: float | None = None,
+        compact: bool = False,
+    ) -> pd.DataFrame:
+        """
+        Parse Events from FEWS PI event attributes in columns.
 
-        # drop columns and add missing columns
-        drop_cols = [i for i in df.columns if i not in EVENT_COLUMNS]
-        df.drop(columns=drop_cols, inplace=True)
+        Args:
+            date (list): event dates formatted as %Y-%m-%d
+            time (list): event times formatted as %H:%M:%S
+            value (list): event values (as string or number)
+            flag (list, optional): event flags (as string or number). Defaults to None.
+            missing_value (float, optional): events with this value are removed. Defaults to None.
+            tz_offset (float, optional): time zone offset in hours, subtracted from datetimes. Defaults to None.
+            compact (bool, optional): if True, values are float32 and flags int8. Defaults to False.
 
-        # set numeric types
-        if "flag" not in df.columns:
-            df["flag"] = pd.Series(dtype="int")
-        else:
-            df["flag"] = df["flag"].astype("int")
+        Returns:
+            Events: pandas DataFrame
+
+        """
+
+        if len(date) == 0:
+            return pd.DataFrame(columns=EVENT_COLUMNS).set_index("datetime")
 
-        df["value"] = pd.to_numeric(df["value"], downcast="float")
+        datetimes, values, flags = _parse_event_columns(date, time, value, flag, tz_offset)
 
         # remove missings (if specified)
         if missing_value is not None:
-            df = df.loc[df["value"] != missing_value]
-
-        # set datetime to index
-        df.set_index("datetime", inplace=True)
-
-        return df
+            mask = values != missing_value
+            datetimes, values, flags = datetimes[mask], values[mask], flags[mask]
+        if compact:
+            values, flags = _compact_columns(values, flags)
+
+        return cls(
+            {"value": values, "flag": flags},
+            index=pd.DatetimeIndex(datetimes, name="datetime"),
+        )
 
 
 @dataclass(config=ConfigDict(arbitrary_types_allowed=True))
@@ -191,6 +343,29 @@ class TimeSeries:
     def __len__(self):
         return len(self.events)
 
+    def __getattr__(self, name):
+        # materialize lazy events on first access
+        lazy_events = self.__dict__.get("_lazy_events")
+        if (name == "events") and (lazy_events is not None):
+            self.__dict__["events"] = Events.from_dict(*lazy_events)
+            del self.__dict__["_lazy_events"]
+            return self.__dict__["events"]
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+    @property
+    def lazy(self) -> bool:
+        """True if events are not parsed yet."""
+        return "_lazy_events" in self.__dict__
+
+    @property
+    def empty(self) -> bool:
+        """True if there are no events (other than missing values), without parsing lazy events."""
+        lazy_events = self.__dict__.get("_lazy_events")
+        if lazy_events is None:
+            return self.events.empty
+        pi_events, missing_value = lazy_events[:2]
+        return all(float(i["value"]) == missing_value for i in pi_events)
+
     @classmethod
     def from_pi_time_series(cls, pi_time_series: dict, time_zone: float | None = None):
         warnings.warn(
@@ -200,23 +375,368 @@ class TimeSeries:
         return cls.from_dict(pi_time_series=pi_time_series, time_zone=time_zone)
 
     @classmethod
-    def from_dict(cls, pi_time_series: dict, time_zone: float | None = None):
+    def construct(cls, **kwargs) -> "TimeSeries":
+        """Construct a TimeSeries without validation, for trusted and correctly typed input"""
+        return _construct(cls, **kwargs)
+
+    @classmethod
+    def from_dict(
+        cls,
+        pi_time_series: dict,
+        time_zone: float | None = None,
+        validate: bool = True,
+        lazy: bool = False,
+        compact: bool = False,
+    ):
         """Parse TimeSeries from FEWS PI timeseries dict.
 
         Args:
             pi_time_series (dict): FEWS PI timeseries as dictionary
             time_zone (float, optional): time_zone. Defaults to None.
+            validate (bool, optional): if False, the time series is constructed without validation, for
+            trusted FEWS output only. Defaults to True.
+            lazy (bool, optional): if True, events are parsed on first access of events. Defaults to False.
+            compact (bool, optional): if True, values are float32, flags int8 and shared header strings are
+            interned. Defaults to False.
 
         Returns:
             fewspy.TimeSeries: time series in FEWS PI format
         """
-        header = Header.from_dict(pi_time_series["header"])
+        header = Header.from_dict(
+            pi_time_series["header"], validate=validate, compact=compact
+        )
         kwargs = dict(header=header)
+        if lazy and ("events" in pi_time_series.keys()):
+            time_series = cls.__new__(cls)
+            time_series.__dict__.update(
+                header=header,
+                _lazy_events=(
+                    pi_time_series["events"],
+                    header.miss_val,
+                    time_zone,
+                    compact,
+                ),
+            )
+            return time_series
         if "events" in pi_time_series.keys():
             kwargs["events"] = Events.from_dict(
-                pi_time_series["events"], header.miss_val, time_zone
+                pi_time_series["events"], header.miss_val, time_zone, compact
             )
-        return cls(**kwargs)
+        if validate:
+            return cls(**kwargs)
+        return cls.construct(**kwargs)
+
+
+def _header_key(header: Header) -> tuple:
+    """Key identifying a time series by location_id, parameter_id and qualifier_id(s)"""
+    qualifier_id = tuple(header.qualifier_id) if header.qualifier_id else ()
+    return (header.location_id, header.parameter_id, qualifier_id)
+
+
+def _join_time_series(group: List[TimeSeries], header: Header) -> TimeSeries:
+    """Join time series into one with a single sort, keeping the last event at duplicated datetimes.
+
+    The joined header is header with the earliest start_date and latest end_date of the group.
+    """
+    events = [i.events for i in group if not i.events.empty]
+    if len(events) > 1:
+        events = pd.concat(events).sort_index(kind="stable")
+        events = events.loc[~events.index.duplicated(keep="last")]
+    elif events:
+        events = events[0]
+    else:
+        events = group[0].events
+
+    header = replace(
+        header,
+        start_date=min(i.header.start_date for i in group),
+        end_date=max(i.header.end_date for i in group),
+    )
+    return TimeSeries(header=header, events=events)
+
+
+def _stitch_time_series(time_series: List[TimeSeries]) -> List[TimeSeries]:
+    """Join time series with equal header keys into one, dropping duplicated datetimes."""
+    groups = {}
+    for i in time_series:
+        groups.setdefault(_header_key(i.header), []).append(i)
+
+    stitched = []
+    for group in groups.values():
+        if len(group) == 1:
+            stitched += group
+        else:
+            stitched += [_join_time_series(group, group[0].header)]
+
+    return stitched
+
+
+class ColumnarStore(Sequence):
+    """Events of many time series in contiguous buffers, exposed as a sequence of TimeSeries views.
+
+    The events of time series i are datetimes, values and flags in [offsets[i], offsets[i + 1]), so
+    memory and construction time scale with the number of events rather than the number of series.
+
+    Flags are float (NaN if missing) in the buffer if any time series misses flags. The events of a time series
+    without missing flags then have integer flags, as if parsed separately.
+    """
+
+    def __init__(
+        self,
+        headers: List[Header],
+        datetimes: np.ndarray,
+        values: np.ndarray,
+        flags: np.ndarray,
+        offsets: np.ndarray,
+    ):
+        """
+        Args:
+            headers (List[Header]): header per time series
+            datetimes (np.ndarray): datetimes of all events
+            values (np.ndarray): values of all events
+            flags (np.ndarray): flags of all events
+            offsets (np.ndarray): start of the events of every time series, followed by the total number of events
+        """
+        self.headers = list(headers)
+        self.datetimes = datetimes
+        self.values = values
+        self.flags = flags
+        self.offsets = np.asarray(offsets, dtype="int64")
+
+    def __len__(self):
+        return len(self.headers)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        return TimeSeries.construct(header=self.headers[index], events=self.events(index))
+
+    def __add__(self, other):
+        return list(self) + list(other)
+
+    @property
+    def counts(self) -> np.ndarray:
+        """Number of events per time series."""
+        return np.diff(self.offsets)
+
+    @property
+    def header_table(self) -> pd.DataFrame:
+        """Headers as a table with one row per time series."""
+        return pd.DataFrame([i.to_row() for i in self.headers])
+
+    def events(self, index: int) -> Events:
+        """Events of time series index, as a view on the buffers."""
+        start, end = self.offsets[index], self.offsets[index + 1]
+        flags = self.flags[start:end]
+        if (flags.dtype in INTEGER_FLAG_DTYPES) and (len(flags) > 0) and not np.isnan(flags).any():
+            flags = flags.astype(INTEGER_FLAG_DTYPES[flags.dtype])
+        return Events(
+            {"value": self.values[start:end], "flag": flags},
+            index=pd.DatetimeIndex(self.datetimes[start:end], name="datetime"),
+            copy=False,
+        )
+
+    @classmethod
+    def from_time_series(cls, time_series: List[TimeSeries]) -> "ColumnarStore":
+        """Copy the events of time series into a ColumnarStore.
+
+        Args:
+            time_series (List[TimeSeries]): time series
+
+        Returns:
+            ColumnarStore: columnar store with the headers and events of time series
+        """
+        counts = [len(i.events) for i in time_series]
+        events = [i.events for i in time_series if not i.events.empty]
+
+        # one concat is much faster than selecting columns of many small DataFrames
+        if events:
+            df = pd.concat(events)
+            datetimes = df.index.to_numpy(dtype=DATETIME_DTYPE)
+            values = pd.to_numeric(df["value"]).to_numpy()
+            if "flag" in df.columns:
+                flags = df["flag"].to_numpy()
+            else:
+                flags = np.full(len(df), np.nan)
+        else:
+            datetimes = np.empty(0, dtype=DATETIME_DTYPE)
+            values = np.empty(0, dtype="float32")
+            flags = np.empty(0, dtype="int64")
+        return cls(
+            headers=[i.header for i in time_series],
+            datetimes=datetimes,
+            values=values,
+            flags=flags,
+            offsets=np.concatenate([[0], np.cumsum(counts, dtype="int64")]),
+        )
+
+    @classmethod
+    def from_dict(
+        cls,
+        pi_time_series: List[dict],
+        time_zone: float | None = None,
+        validate: bool = True,
+        compact: bool = False,
+    ) -> "ColumnarStore":
+        """Parse a ColumnarStore from a list of FEWS PI timeseries dicts, all events in one pass.
+
+        Args:
+            pi_time_series (List[dict]): FEWS PI timeseries as dictionaries
+            time_zone (float, optional): time_zone. Defaults to None.
+            validate (bool, optional): if False, headers are constructed without validation. Defaults to True.
+            compact (bool, optional): if True, values are float32, flags int8 and shared header strings are
+            interned. Defaults to False.
+
+        Returns:
+            ColumnarStore: columnar store with the headers and events of pi_time_series
+        """
+        headers = [
+            Header.from_dict(i["header"], validate, compact) for i in pi_time_series
+        ]
+        pi_events = [i.get("events", []) for i in pi_time_series]
+        counts = np.array([len(i) for i in pi_events], dtype="int64")
+        all_events = list(chain.from_iterable(pi_events))
+
+        def _column(key):
+            return list(map(itemgetter(key), all_events))
+
+        if all(("flag" in i[0]) for i in pi_events if i):
+            flag = _column("flag")
+        else:
+            flag = [i.get("flag", np.nan) for i in all_events]
+
+        datetimes, values, flags = _parse_event_columns(
+            _column("date"), _column("time"), _column("value"), flag, time_zone
+        )
+
+        # remove missings per time series
+        mask = values != np.repeat([i.miss_val for i in headers], counts)
+        if not mask.all():
+            datetimes, values, flags = datetimes[mask], values[mask], flags[mask]
+            series_index = np.repeat(np.arange(len(headers)), counts)[mask]
+            counts = np.bincount(series_index, minlength=len(headers))
+        if compact:
+            values, flags = _compact_columns(values, flags)
+
+        return cls(
+            headers=headers,
+            datetimes=datetimes,
+            values=values,
+            flags=flags,
+            offsets=np.concatenate([[0], np.cumsum(counts)]),
+        )
+
+
+def _equidistant_axis(datetimes: np.ndarray, headers: List[Header]) -> tuple | None:
+    """Time axis and row of every datetime for time series sharing an equidistant time step, else None"""
+    time_steps = {(i.time_step.get("unit"), i.time_step.get("multiplier")) for i in headers}
+    if (len(time_steps) != 1) or (len(datetimes) == 0):
+        return None
+    unit, multiplier = time_steps.pop()
+    if unit not in EQUIDISTANT_UNITS:
+        return None
+    step = np.timedelta64(pd.Timedelta(**{f"{unit}s": float(multiplier or 1)}))
+    start = datetimes.min()
+    elapsed = datetimes - start
+    if (elapsed % step).any():
+        return None
+    row = elapsed // step
+
+    # skip time steps without events, fall back if the axis is mostly gaps
+    size = int(row.max()) + 1
+    if size > 2 * len(datetimes):
+        return None
+    present = np.zeros(size, dtype=bool)
+    present[row] = True
+    index = start + np.flatnonzero(present) * step
+    row = (np.cumsum(present) - 1)[row]
+    return index, row
+
+
+def _deep_size(obj, seen: set | None = None) -> int:
+    """Size of obj and the objects it refers to in bytes, counting shared objects once"""
+    seen = set() if seen is None else seen
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(_deep_size(k, seen) + _deep_size(v, seen) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple)):
+        size += sum(_deep_size(i, seen) for i in obj)
+    elif hasattr(obj, "__dict__"):
+        size += _deep_size(obj.__dict__, seen)
+    return size
+
+
+def _wide_column_name(header: Header) -> str:
+    """Column name of a time series in a wide polars DataFrame, unique per location, parameter and qualifiers"""
+    name = f"{header.location_id}/{header.parameter_id}"
+    if header.qualifier_id:
+        name += f"/{','.join(header.qualifier_id)}"
+    return name
+
+
+def _long_id_codes(store: ColumnarStore) -> dict:
+    """Dictionary codes per event and categories of the id columns of a long table.
+
+    Qualifier ids of a time series are joined by a comma; time series without qualifiers have code -1 (null).
+    """
+    ids = {
+        "location_id": [i.location_id for i in store.headers],
+        "parameter_id": [i.parameter_id for i in store.headers],
+        "qualifier_id": [
+            ",".join(i.qualifier_id) if i.qualifier_id else None for i in store.headers
+        ],
+    }
+    id_codes = {}
+    for column, values in ids.items():
+        codes, categories = pd.factorize(pd.Series(values, dtype=object))
+        id_codes[column] = (np.repeat(codes.astype("int32"), store.counts), categories)
+    return id_codes
+
+
+def _header_to_json(header: Header) -> dict:
+    """Header as a JSON-serializable dict, with ISO 8601 dates"""
+    header = header.__dict__.copy()
+    for key in DATETIME_KEYS:
+        header[key] = header[key].isoformat()
+    return header
+
+
+def _header_from_json(header: dict, validate: bool = True) -> Header:
+    """Header from a dict written by _header_to_json"""
+    if validate:
+        return Header(**header)
+    for key in DATETIME_KEYS:
+        header[key] = datetime.fromisoformat(header[key])
+    return Header.construct(**header)
+
+
+def _ipc_column(table: pa.Table, name: str) -> np.ndarray:
+    """Column of an Arrow table as a numpy array, without a copy if it is stored in one chunk"""
+    column = table.column(name)
+    if column.num_chunks == 1:
+        return column.chunk(0).to_numpy(zero_copy_only=False)
+    return column.to_numpy()
+
+
+def _headers(time_series: List[TimeSeries]) -> List[Header]:
+    """Headers of time series, without creating views on a ColumnarStore"""
+    if isinstance(time_series, ColumnarStore):
+        return time_series.headers
+    return [i.header for i in time_series]
+
+
+def _add_to_index(index: dict, position: int, header: Header):
+    """Add the position of a time series to the lookup-tables of a TimeSeriesSet index"""
+    index["key"].setdefault(_header_key(header), []).append(position)
+    index["location_id"].setdefault(header.location_id, []).append(position)
+    index["parameter_id"].setdefault(header.parameter_id, []).append(position)
+    for qualifier_id in header.qualifier_id or []:
+        index["qualifier_id"].setdefault(qualifier_id, []).append(position)
 
 
 @dataclass(config=ConfigDict(arbitrary_types_allowed=True))
@@ -230,6 +750,21 @@ class TimeSeriesSet:
     def __len__(self):
         return len(self.time_series)
 
+    def _time_series_index(self) -> dict:
+        """Positions of time series by header key, location_id, parameter_id and qualifier_id.
+
+        The index is rebuilt if time series are re-assigned, replaced, moved or removed other than by add, detected
+        by the identity of their headers. Headers are treated as immutable, changing one in place is not detected.
+        """
+        signature = list(map(id, _headers(self.time_series)))
+        if self.__dict__.get("_index_signature") != signature:
+            index = {"key": {}, "location_id": {}, "parameter_id": {}, "qualifier_id": {}}
+            for position, header in enumerate(_headers(self.time_series)):
+                _add_to_index(index, position, header)
+            self._index = index
+            self._index_signature = signature
+        return self._index
+
     @classmethod
     def from_pi_time_series(cls, pi_time_series_set):
         warnings.warn(
@@ -239,11 +774,26 @@ class TimeSeriesSet:
         return cls.from_dict(pi_time_series_set)
 
     @classmethod
-    def from_dict(cls, pi_time_series_set: dict):
+    def from_dict(
+        cls,
+        pi_time_series_set: dict,
+        columnar: bool = False,
+        validate: bool = True,
+        lazy: bool = False,
+        compact: bool = False,
+    ):
         """Parse TimeSeries from FEWS PI time series set dict.
 
         Args:
             pi_time_series_set (dict): FEWS PI time series set as dictionary
+            columnar (bool, optional): if True, events are stored in a ColumnarStore and time_series are
+            views on it. Defaults to False.
+            validate (bool, optional): if False, headers and time series are constructed without validation,
+            for trusted FEWS output only. Defaults to True.
+            lazy (bool, optional): if True, headers are parsed but events of a time series are parsed on first
+            access. Ignored if columnar is True. Defaults to False.
+            compact (bool, optional): if True, values are float32, flags int8 and header strings shared by time
+            series are interned. Defaults to False.
 
         Returns:
             fewspy.TimeSeriesSet: Time series set with multiple time series
@@ -256,50 +806,435 @@ class TimeSeriesSet:
             kwargs["time_zone"] = time_zone
         else:
             time_zone = None
+        if columnar:
+            time_series_set = cls(**kwargs)
+            time_series_set.time_series = ColumnarStore.from_dict(
+                pi_time_series_set.get("timeSeries", []), time_zone, validate, compact
+            )
+            return time_series_set
         if "timeSeries" in pi_time_series_set.keys():
             kwargs["time_series"] = [
-                TimeSeries.from_dict(i, time_zone)
+                TimeSeries.from_dict(i, time_zone, validate, lazy, compact)
                 for i in pi_time_series_set["timeSeries"]
             ]
         return cls(**kwargs)
 
+    @classmethod
+    def concat(
+        cls, time_series_sets: List["TimeSeriesSet"], deduplicate: bool = False
+    ) -> "TimeSeriesSet":
+        """Concatenate the time series of multiple time series sets into one set.
+
+        Args:
+            time_series_sets (List[TimeSeriesSet]): time series sets, e.g. responses to batched requests
+            deduplicate (bool, optional): if True, time series with equal location_id, parameter_id and
+            qualifier_id are stitched into one, e.g. responses to consecutive time windows. Defaults to False.
+
+        Returns:
+            fewspy.TimeSeriesSet: Time series set with all time series. Version and time_zone are taken
+            from the first set specifying them.
+        """
+        version = next((i.version for i in time_series_sets if i.version), None)
+        time_zone = next(
+            (i.time_zone for i in time_series_sets if i.time_zone is not None), None
+        )
+        time_series = [j for i in time_series_sets for j in i.time_series]
+        if deduplicate:
+            time_series = _stitch_time_series(time_series)
+        time_series_set = cls(version=version, time_zone=time_zone)
+        time_series_set.time_series = time_series
+        return time_series_set
+
     def add(self, time_series_set):
         # add time_series to the time_series_set
+        index = self._time_series_index()
         self.time_series += [time_series_set]
+
+        # update the index in place, instead of rebuilding it on the next lookup
+        _add_to_index(index, len(self.time_series) - 1, time_series_set.header)
+        self._index_signature.append(id(time_series_set.header))
         return self
 
+    def merge(
+        self, other: "TimeSeriesSet", how: Literal["update", "keep"] = "update"
+    ) -> "TimeSeriesSet":
+        """Merge the time series of another set into this set, e.g. the result of a new poll.
+
+        Time series with equal location_id, parameter_id and qualifier_id are joined into one, with their events
+        de-duplicated by datetime and start_date/end_date spanning both. Other time series are added.
+
+        Args:
+            other (TimeSeriesSet): time series set to merge into this set
+            how (Literal["update", "keep"], optional): at duplicated datetimes, "update" takes events (and header)
+            from other, "keep" keeps those of this set. Defaults to "update".
+
+        Returns:
+            TimeSeriesSet: this time series set, merged in place
+        """
+        if how not in ["update", "keep"]:
+            raise ValueError(f"how should be 'update' or 'keep', not '{how}'")
+        if isinstance(self.time_series, ColumnarStore):
+            self.time_series = list(self.time_series)
+        if self.version is None:
+            self.version = other.version
+        if self.time_zone is None:
+            self.time_zone = other.time_zone
+
+        index = self._time_series_index()
+        for time_series in other.time_series:
+            positions = index["key"].get(_header_key(time_series.header))
+            if positions is None:
+                self.add(time_series)
+                continue
+            current = self.time_series[positions[0]]
+            group = [current, time_series] if how == "update" else [time_series, current]
+            self.time_series[positions[0]] = _join_time_series(group, group[-1].header)
+        return self
+
+    def get(
+        self,
+        location_id: str,
+        parameter_id: str,
+        qualifier_id: str | List[str] | None = None,
+    ) -> TimeSeries | None:
+        """Get a time series by location_id, parameter_id and qualifier_id(s)
+
+        Args:
+            location_id (str): FEWS location id
+            parameter_id (str): FEWS parameter id
+            qualifier_id (str | List[str], optional): FEWS qualifier id(s). Defaults to None.
+
+        Returns:
+            TimeSeries | None: first time series with this location_id, parameter_id and qualifier_id(s), None if
+            not in the set
+        """
+        if isinstance(qualifier_id, str):
+            qualifier_id = [qualifier_id]
+        key = (location_id, parameter_id, tuple(qualifier_id) if qualifier_id else ())
+        positions = self._time_series_index()["key"].get(key)
+        if positions is None:
+            return None
+        return self.time_series[positions[0]]
+
+    def select(
+        self,
+        location_ids: str | List[str] | None = None,
+        parameter_ids: str | List[str] | None = None,
+        qualifier_ids: str | List[str] | None = None,
+    ) -> "TimeSeriesSet":
+        """Select time series by location_ids, parameter_ids and qualifier_ids
+
+        Args:
+            location_ids (str | List[str], optional): FEWS location id(s). Defaults to None (all).
+            parameter_ids (str | List[str], optional): FEWS parameter id(s). Defaults to None (all).
+            qualifier_ids (str | List[str], optional): FEWS qualifier id(s), a time series is selected if it has one
+            of them. Defaults to None (all).
+
+        Returns:
+            TimeSeriesSet: time series set sharing (not copying) the selected time series
+        """
+        index = self._time_series_index()
+        positions = None
+        for key, ids in [
+            ("location_id", location_ids),
+            ("parameter_id", parameter_ids),
+            ("qualifier_id", qualifier_ids),
+        ]:
+            if ids is None:
+                continue
+            if isinstance(ids, str):
+                ids = [ids]
+            selected = set(flatten_list([index[key].get(i, []) for i in ids]))
+            positions = selected if positions is None else positions & selected
+
+        time_series_set = TimeSeriesSet(version=self.version, time_zone=self.time_zone)
+        if positions is None:
+            time_series_set.time_series = list(self.time_series)
+        else:
+            time_series_set.time_series = [self.time_series[i] for i in sorted(positions)]
+        return time_series_set
+
+    def to_columnar(self) -> ColumnarStore:
+        """Events of all time series in a ColumnarStore, copied only if not stored columnar already."""
+        if isinstance(self.time_series, ColumnarStore):
+            return self.time_series
+        return ColumnarStore.from_time_series(self.time_series)
+
     @property
     def empty(self):
-        return all([i.events.empty for i in self.time_series])
+        if isinstance(self.time_series, ColumnarStore):
+            return len(self.time_series.values) == 0
+        return all(i.empty for i in self.time_series)
+
+    def memory_usage(self, deep: bool = True) -> pd.Series:
+        """Memory used by the events and headers of the time series set in bytes.
+
+        Objects shared by headers (e.g. strings interned in compact mode) are counted once. Events of lazy time
+        series are not parsed for this report and not counted.
+
+        Args:
+            deep (bool, optional): passed to pandas.DataFrame.memory_usage. Defaults to True.
+
+        Returns:
+            pd.Series: bytes used by "events", "headers" and in "total"
+        """
+        if isinstance(self.time_series, ColumnarStore):
+            store = self.time_series
+            events = sum(
+                i.nbytes for i in [store.datetimes, store.values, store.flags, store.offsets]
+            )
+        else:
+            events = sum(
+                int(i.events.memory_usage(index=True, deep=deep).sum())
+                for i in self.time_series
+                if not i.lazy
+            )
+        headers = _deep_size(_headers(self.time_series))
+        return pd.Series(
+            {"events": events, "headers": headers, "total": events + headers}
+        )
 
     @property
     def parameter_ids(self):
-        return list(set([i.header.parameter_id for i in self.time_series]))
+        return list(dict.fromkeys(i.parameter_id for i in _headers(self.time_series)))
 
     @property
     def location_ids(self):
-        return list(set([i.header.location_id for i in self.time_series]))
+        return list(dict.fromkeys(i.location_id for i in _headers(self.time_series)))
 
     @property
     def qualifier_ids(self):
-        qualifiers = (i.header.qualifier_id for i in self.time_series)
-        qualifiers = [i for i in qualifiers if i is not None]
+        qualifiers = (i.qualifier_id for i in _headers(self.time_series))
+        return list(dict.fromkeys(flatten_list([i for i in qualifiers if i is not None])))
+
+    def to_ipc(self, ipc_file: Path | None = None) -> pa.Buffer | None:
+        """Write fewspy.TimeSeriesSet to the Arrow IPC file format.
 
-        return list(set(flatten_list(qualifiers)))
+        Events are written as one record batch with datetime, value and flag columns, headers and the number of
+        events per time series as JSON in the schema metadata. Writing and reading is bounded by memory copies,
+        so IPC is a fast alternative to pickle for passing sets between processes and caching them on disk.
 
-    def to_df(self) -> pd.DataFrame:
+        Args:
+            ipc_file (Path, optional): file to write to. Defaults to None, returning the IPC file in memory.
+
+        Returns:
+            pa.Buffer | None: IPC file if ipc_file is None, a bytes-like object that can be pickled
+        """
+        store = self.to_columnar()
+        metadata = {
+            "version": json.dumps(self.version),
+            "time_zone": json.dumps(self.time_zone),
+            "headers": json.dumps([_header_to_json(i) for i in store.headers]),
+            "counts": json.dumps(store.counts.tolist()),
+        }
+        table = pa.table(
+            {
+                "datetime": store.datetimes,
+                "value": store.values,
+                "flag": store.flags,
+            },
+            metadata={f"fewspy.{k}": v for k, v in metadata.items()},
+        )
+
+        if ipc_file is None:
+            sink = pa.BufferOutputStream()
+        else:
+            Path(ipc_file).parent.mkdir(exist_ok=True, parents=True)
+            sink = pa.OSFile(str(ipc_file), "wb")
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+        if ipc_file is None:
+            return sink.getvalue()
+        sink.close()
+
+    @classmethod
+    def from_ipc(
+        cls, source: Path | pa.Buffer | bytes, memory_map: bool = True, validate: bool = False
+    ) -> "TimeSeriesSet":
+        """Read a fewspy.TimeSeriesSet written by to_ipc.
+
+        Events are stored columnar and wrap the Arrow buffers without copies. If memory mapped, events are only
+        read from disk when accessed; arrays are read-only in that case.
+
+        Args:
+            source (Path | pa.Buffer | bytes): IPC file or its content, e.g. returned by to_ipc()
+            memory_map (bool, optional): if True, a file is memory mapped instead of read. Defaults to True.
+            validate (bool, optional): if True, headers are validated. Defaults to False, as they are written
+            by fewspy.
+
+        Returns:
+            fewspy.TimeSeriesSet: Time series set with multiple time series
+        """
+        if isinstance(source, (pa.Buffer, bytes, bytearray, memoryview)):
+            source = pa.BufferReader(source)
+        elif memory_map:
+            source = pa.memory_map(str(source), "r")
+        else:
+            source = pa.OSFile(str(source), "rb")
+        with source:
+            table = pa.ipc.open_file(source).read_all()
+
+        metadata = {
+            k.decode()[len("fewspy.") :]: json.loads(v)
+            for k, v in table.schema.metadata.items()
+            if k.startswith(b"fewspy.")
+        }
+        time_series_set = cls(
+            version=metadata["version"], time_zone=metadata["time_zone"]
+        )
+        time_series_set.time_series = ColumnarStore(
+            headers=[_header_from_json(i, validate) for i in metadata["headers"]],
+            datetimes=_ipc_column(table, "datetime"),
+            values=_ipc_column(table, "value"),
+            flags=_ipc_column(table, "flag"),
+            offsets=np.concatenate([[0], np.cumsum(metadata["counts"], dtype="int64")]),
+        )
+        return time_series_set
+
+    def to_arrow(self) -> pa.Table:
+        """All events in a long pyarrow Table, with dictionary-encoded ids.
+
+        Columns are location_id, parameter_id, qualifier_id (comma-joined), datetime, value and flag. Datetimes,
+        values and flags are wrapped without copies if the set is stored columnar. Version and time_zone are
+        stored in the schema metadata.
+
+        Returns:
+            pa.Table: events with a row per event
+        """
+        store = self.to_columnar()
+        columns = {
+            column: pa.DictionaryArray.from_arrays(
+                pa.array(codes, mask=codes < 0), pa.array(categories, type=pa.string())
+            )
+            for column, (codes, categories) in _long_id_codes(store).items()
+        }
+        columns["datetime"] = pa.array(store.datetimes)
+        columns["value"] = pa.array(store.values)
+        columns["flag"] = pa.array(store.flags)
+        metadata = {
+            "version": str(self.version or ""),
+            "time_zone": "" if self.time_zone is None else str(self.time_zone),
+        }
+        return pa.table(columns, metadata=metadata)
+
+    def to_long(self) -> pd.DataFrame:
+        """All events in a long pandas DataFrame, with categorical ids.
+
+        Columns are location_id, parameter_id, qualifier_id (comma-joined), datetime, value and flag, so memory
+        is proportional to the number of events, also if time series have different datetimes.
+
+        Returns:
+            pd.DataFrame: events with a row per event
+        """
+        store = self.to_columnar()
+        columns = {
+            column: pd.Categorical.from_codes(codes, categories)
+            for column, (codes, categories) in _long_id_codes(store).items()
+        }
+        columns["datetime"] = store.datetimes
+        columns["value"] = store.values
+        columns["flag"] = store.flags
+        return pd.DataFrame(columns, copy=False)
+
+    def _wide_values(self, threshold: int) -> tuple:
+        """Reliable values of all time series in one preallocated array, with a column per time series.
+
+        The array is column-major, so every column is one contiguous buffer.
+
+        Returns:
+            tuple: headers, datetimes and values of shape (datetimes, time series)
+        """
+        store = self.to_columnar()
+
+        # reliable events and the column they belong to, events without a flag are unreliable as in reliables
+        column = np.repeat(np.arange(len(store)), store.counts)
+        reliable = store.flags < threshold
+        if not isinstance(self.time_series, ColumnarStore):
+            # time series without a flag column are reliable as a whole
+            unflagged = [
+                idx for idx, i in enumerate(self.time_series) if "flag" not in i.events.columns
+            ]
+            if unflagged:
+                reliable |= np.isin(column, unflagged)
+        datetimes = store.datetimes[reliable]
+        values = store.values[reliable]
+        column = column[reliable]
+
+        # row of every event on an equidistant time axis, or else on the union of all datetimes
+        axis = _equidistant_axis(datetimes, store.headers)
+        if axis is None:
+            axis = np.unique(datetimes, return_inverse=True)
+        index, row = axis
+
+        dtype = values.dtype if np.issubdtype(values.dtype, np.floating) else "float64"
+        data = np.full((len(index), len(store)), np.nan, dtype=dtype, order="F")
+        data[row, column] = values
+        return store.headers, index, data
+
+    def to_df(self, threshold: int = 6) -> pd.DataFrame:
+        """Reliable values of all time series in one DataFrame, with a column per time series.
+
+        Values are filled into one preallocated array. If all time series share an equidistant time step, rows
+        follow from the time step; otherwise from one sorted union of all datetimes. As with reliables, events
+        with a missing flag are dropped, unless the events of a time series have no flag column at all. An
+        empty TimeSeriesSet returns an empty DataFrame.
+
+        Args:
+            threshold (int, optional): events with a flag of threshold or higher are unreliable. Defaults to 6.
+
+        Returns:
+            pd.DataFrame: values with datetime index and (location_id, parameter_id) columns
+        """
+        headers, index, data = self._wide_values(threshold)
         columns = pd.MultiIndex.from_tuples(
-            [(i.header.location_id, i.header.parameter_id) for i in self.time_series],
+            [(i.location_id, i.parameter_id) for i in headers],
             names=["location_id", "parameter_id"],
         )
-        df = pd.concat(
-            [reliables(i.events)["value"] for i in self.time_series],
-            axis=1,
-            sort=True,
+        return pd.DataFrame(
+            data, index=pd.DatetimeIndex(index, name="datetime"), columns=columns
         )
-        df.columns = columns
 
-        return df
+    def to_polars(self, how: Literal["wide", "long"] = "wide", threshold: int = 6):
+        """All time series in a polars DataFrame, built from the underlying arrays without a pandas copy.
+
+        Requires the optional dependency polars.
+
+        Args:
+            how (Literal["wide", "long"], optional): "wide" for reliable values as in to_df, with a datetime
+            column and a "{location_id}/{parameter_id}" column per time series, followed by "/{qualifier_ids}"
+            (comma-joined) if the time series has qualifiers; "long" for all events as in to_long, with
+            categorical ids. Defaults to "wide".
+            threshold (int, optional): events with a flag of threshold or higher are unreliable, only used if
+            how="wide". Defaults to 6.
+
+        Returns:
+            polars.DataFrame: time series
+        """
+        pl = import_optional("polars")
+        if how == "long":
+            store = self.to_columnar()
+            columns = [
+                pl.Series(column, categories, dtype=pl.Categorical).gather(
+                    pl.Series(codes).cast(pl.UInt32, strict=False)
+                )
+                for column, (codes, categories) in _long_id_codes(store).items()
+            ]
+            columns += [
+                pl.Series("datetime", store.datetimes),
+                pl.Series("value", store.values),
+                pl.Series("flag", store.flags),
+            ]
+            return pl.DataFrame(columns)
+        if how != "wide":
+            raise ValueError(f"how should be 'wide' or 'long', not '{how}'")
+
+        headers, index, data = self._wide_values(threshold)
+        columns = [pl.Series("datetime", index)]
+        columns += [
+            pl.Series(_wide_column_name(header), data[:, idx])
+            for idx, header in enumerate(headers)
+        ]
+        return pl.DataFrame(columns)
 
     def to_netcdf(
         self,
@@ -327,6 +1262,42 @@ class TimeSeriesSet:
                 remove_dir=remove_dir,
             )
 
+    def to_xml(self, xml_file: Path) -> None:
+        """Write fewspy.TimeSeriesSet to a PI XML file.
+
+        The file is written series by series and events are formatted in bulk, so memory does not grow with
+        the size of the file. Datetimes are written in the time_zone of the set, with the PI XML resolution of
+        seconds.
+
+        Args:
+            xml_file (Path): PI XML file to write to
+        """
+        write_xml(
+            time_series=self.time_series,
+            xml_file=xml_file,
+            version=self.version,
+            time_zone=self.time_zone,
+        )
+
+    def to_json(self, json_file: Path | None = None) -> str | None:
+        """Write fewspy.TimeSeriesSet to a PI JSON file.
+
+        The file is written series by series and events are formatted in bulk, like to_xml. Datetimes are
+        written in the time_zone of the set, with a resolution of seconds.
+
+        Args:
+            json_file (Path, optional): PI JSON file to write to. Defaults to None, returning the document.
+
+        Returns:
+            str | None: PI JSON document if json_file is None
+        """
+        return write_json(
+            time_series=self.time_series,
+            json_file=json_file,
+            version=self.version,
+            time_zone=self.time_zone,
+        )
+
     def to_parquet(self, parquet_file: Path, include_header: bool = False):
         """Write fewspy.TimeSeriesSet to arrow parquet file
 
@@ -0,0 +1,40 @@
+import json
+
+try:
+    import orjson
+except ImportError:  # accelerated JSON codec is optional
+    orjson = None
+
+
+def loads(content: bytes | str):
+    """
+    Deserialize a JSON document, with orjson if installed
+
+    Args:
+        content (bytes | str): JSON document
+
+    Returns:
+        object: deserialized document
+
+    """
+
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def dumps(obj) -> str:
+    """
+    Serialize an object to a compact JSON string, with orjson if installed
+
+    Args:
+        obj (object): object to serialize
+
+    Returns:
+        str: JSON document
+
+    """
+
+    if orjson is not None:
+        return orjson.dumps(obj).decode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
@@ -0,0 +1,23 @@
+import importlib
+
+
+def import_optional(name: str, extra: str | None = None):
+    """
+    Import an optional dependency, raising an ImportError with install instructions if it is missing
+
+    Args:
+        name (str): name of the module to import, e.g. "polars"
+        extra (str, optional): fewspy extra that installs the module. Defaults to None, the module name.
+
+    Returns:
+        module: the imported module
+
+    """
+
+    try:
+        return importlib.import_module(name)
+    except ImportError as e:
+        raise ImportError(
+            f"Optional dependency '{name}' is not installed. Install it with `pip install {name}` or "
+            f"`pip install fewspy[{extra or name}]`"
+        ) from e
@@ -0,0 +1,248 @@
+from datetime import datetime, timedelta
+from typing import List, Union
+from urllib.parse import quote_plus, urlencode
+
+from .conversions import datetime_to_fews_str
+
+DEFAULT_MAX_URL_LENGTH = 8000
+DEFAULT_MAX_SERIES_PER_REQUEST = 500
+ID_KEYS = ["locationIds", "parameterIds", "qualifierIds"]
+TIME_STEP_SECONDS = {
+    "second": 1,
+    "minute": 60,
+    "hour": 3600,
+    "day": 86400,
+    "week": 604800,
+    "month": 2629800,
+    "year": 31557600,
+}
+
+
+class IncompleteResultError(Exception):
+    """Raised if some requests of a split request failed, instead of returning an incomplete result."""
+
+    def __init__(self, failed_parameters: List[dict], n_requests: int):
+        self.failed_parameters = failed_parameters
+        super().__init__(
+            f"{len(failed_parameters)} of {n_requests} requests failed, see the log for their errors. "
+            f"Parameters of the first failed request: {failed_parameters[0]}"
+        )
+
+
+def _as_list(ids: Union[str, List[str], None]) -> List[str] | None:
+    if ids is None:
+        return None
+    elif isinstance(ids, str):
+        return [ids]
+    return list(ids)
+
+
+def _id_lengths(key: str, ids: List[str]) -> List[int]:
+    """Length each id adds to an encoded url, e.g. &locationIds=my_location"""
+    return [len(f"&{key}=") + len(quote_plus(i)) for i in ids]
+
+
+def _pack(ids: List[str], lengths: List[int], max_length: int, max_count: int):
+    """Greedily pack ids into chunks bounded by summed length and count"""
+    chunks, chunk, chunk_length = [], [], 0
+    for i, length in zip(ids, lengths):
+        if chunk and ((chunk_length + length > max_length) or (len(chunk) >= max_count)):
+            chunks += [chunk]
+            chunk, chunk_length = [], 0
+        chunk += [i]
+        chunk_length += length
+    if chunk:
+        chunks += [chunk]
+    return chunks
+
+
+def plan_batches(
+    url: str,
+    parameters: dict,
+    location_ids: Union[str, List[str]] = None,
+    parameter_ids: Union[str, List[str]] = None,
+    qualifier_ids: Union[str, List[str]] = None,
+    max_url_length: int = DEFAULT_MAX_URL_LENGTH,
+    max_series_per_request: int = DEFAULT_MAX_SERIES_PER_REQUEST,
+) -> List[dict]:
+    """
+    Pack location_ids and parameter_ids into as few requests as possible
+
+    FEWS returns all combinations of the location_ids, parameter_ids and qualifier_ids in a request.
+    Requests are bounded by the length of the encoded url and by the number of expected time series,
+    as a measure for the payload size of the response.
+
+    Args:
+        url (str): url Delft-FEWS PI REST WebService timeseries end-point
+        parameters (dict): request parameters, prepared by parameters_to_fews
+        location_ids (list): list with FEWS location ids. Defaults to None.
+        parameter_ids (list): list with FEWS parameter ids. Defaults to None.
+        qualifier_ids (list): list with FEWS qualifier ids, added to every request. Defaults to None.
+        max_url_length (int, optional): maximum length of a request url. Defaults to 8000.
+        max_series_per_request (int, optional): maximum number of expected time series per request.
+        Defaults to 500.
+
+    Returns:
+        List[dict]: request parameters per batch
+
+    """
+
+    location_ids = _as_list(location_ids)
+    parameter_ids = _as_list(parameter_ids)
+    qualifier_ids = _as_list(qualifier_ids)
+
+    # parameters shared by all requests
+    base_parameters = {k: v for k, v in parameters.items() if k not in ID_KEYS}
+    if qualifier_ids is not None:
+        base_parameters["qualifierIds"] = qualifier_ids
+    base_length = len(url) + 1 + len(urlencode(base_parameters, doseq=True))
+    budget = max(max_url_length - base_length, 0)
+    max_series = max(max_series_per_request // max(len(qualifier_ids or []), 1), 1)
+
+    # pack parameters, leaving at least half of the budget to locations
+    if parameter_ids is None:
+        parameter_chunks = [None]
+    else:
+        parameter_lengths = _id_lengths("parameterIds", parameter_ids)
+        location_length = sum(_id_lengths("locationIds", location_ids or []))
+        parameter_budget = max(budget - location_length, budget // 2)
+        parameter_chunks = _pack(
+            parameter_ids, parameter_lengths, parameter_budget, max_series
+        )
+
+    # pack locations for every chunk of parameters
+    batches = []
+    for parameter_chunk in parameter_chunks:
+        if location_ids is None:
+            location_chunks = [None]
+        else:
+            parameter_length = sum(_id_lengths("parameterIds", parameter_chunk or []))
+            location_chunks = _pack(
+                location_ids,
+                _id_lengths("locationIds", location_ids),
+                budget - parameter_length,
+                max(max_series // len(parameter_chunk or [None]), 1),
+            )
+        for location_chunk in location_chunks:
+            batch = base_parameters.copy()
+            if location_chunk is not None:
+                batch["locationIds"] = location_chunk
+            if parameter_chunk is not None:
+                batch["parameterIds"] = parameter_chunk
+            batches += [batch]
+
+    return batches
+
+
+def time_step_to_seconds(time_step: dict) -> float | None:
+    """
+    Convert a FEWS PI time step to (approximate) seconds
+
+    Args:
+        time_step (dict): FEWS PI time step (e.g. {'unit': 'minute', 'multiplier': 15})
+
+    Returns:
+        float | None: time step in seconds, None for nonequidistant time steps
+
+    """
+
+    unit = time_step.get("unit")
+    if unit not in TIME_STEP_SECONDS.keys():
+        return None
+    multiplier = time_step.get("multiplier")
+    if multiplier is None:
+        multiplier = 1
+    return TIME_STEP_SECONDS[unit] * float(multiplier)
+
+
+def estimate_time_window(
+    time_steps: List[dict],
+    max_events_per_request: int,
+    max_series_per_request: int = DEFAULT_MAX_SERIES_PER_REQUEST,
+) -> timedelta | None:
+    """
+    Estimate the time window that keeps the expected number of events in a request below a maximum
+
+    The estimate assumes all series in a request have the smallest equidistant time step. The window is at
+    least one smallest time step, so a request always covers whole time steps.
+
+    Args:
+        time_steps (List[dict]): FEWS PI time steps of the requested time series, e.g. from a headers request
+        max_events_per_request (int): maximum number of expected events per request
+        max_series_per_request (int, optional): maximum number of time series per request. Defaults to 500.
+
+    Returns:
+        timedelta | None: time window, None if no time series is equidistant
+
+    """
+
+    if max_events_per_request < 1:
+        raise ValueError(
+            f"max_events_per_request should be at least 1, got {max_events_per_request}"
+        )
+    seconds = [time_step_to_seconds(i) for i in time_steps]
+    seconds = [i for i in seconds if i]
+    if not seconds:
+        return None
+    n_series = min(len(time_steps), max_series_per_request)
+    window = max(max_events_per_request * min(seconds) / n_series, min(seconds))
+    return timedelta(seconds=window)
+
+
+def plan_time_windows(
+    start_time: datetime | None,
+    end_time: datetime | None,
+    time_window: timedelta | None = None,
+) -> List[dict]:
+    """
+    Split [start_time, end_time] into consecutive windows of at most time_window
+
+    Consecutive windows share their boundary, so events at the boundary are returned twice and have
+    to be de-duplicated when the responses are stitched.
+
+    Args:
+        start_time (datetime): start datetime of the request
+        end_time (datetime): end datetime of the request
+        time_window (timedelta, optional): maximum duration of a window. Defaults to None (no windows).
+
+    Returns:
+        List[dict]: request parameters startTime and endTime per window. One empty dict if the
+        request is not split.
+
+    """
+
+    if (time_window is not None) and (time_window <= timedelta(0)):
+        raise ValueError(f"time_window should be positive, got {time_window}")
+    if (time_window is None) or (start_time is None) or (end_time is None):
+        return [{}]
+
+    windows = []
+    window_start = start_time
+    while window_start < end_time:
+        window_end = min(window_start + time_window, end_time)
+        windows += [
+            {
+                "startTime": datetime_to_fews_str(window_start),
+                "endTime": datetime_to_fews_str(window_end),
+            }
+        ]
+        window_start = window_end
+
+    return windows if windows else [{}]
+
+
+def check_complete(results: list, requests_parameters: List[dict]):
+    """
+    Raise IncompleteResultError if a request of a split request failed
+
+    A single failed request is not raised, it returns an empty result as a request that is not split.
+
+    Args:
+        results (list): result per request, None for failed requests
+        requests_parameters (List[dict]): request parameters per request
+
+    """
+
+    failed_parameters = [j for i, j in zip(results, requests_parameters) if i is None]
+    if failed_parameters and (len(requests_parameters) > 1):
+        raise IncompleteResultError(failed_parameters, len(requests_parameters))
@@ -0,0 +1,123 @@
+import random
+import threading
+import time
+
+DEFAULT_TIMEOUT = (10, 300)
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+
+class CircuitOpenError(Exception):
+    pass
+
+
+class RetryPolicy(object):
+    """Jittered exponential backoff for idempotent GET requests."""
+
+    def __init__(
+        self,
+        retries: int = 3,
+        backoff_factor: float = 0.5,
+        max_backoff: float = 30,
+        status_codes: tuple = RETRY_STATUS_CODES,
+    ):
+        """
+        Args:
+            retries (int, optional): maximum number of retries after the first attempt. Defaults to 3.
+            backoff_factor (float, optional): backoff in seconds before the first retry, doubled every retry.
+            Defaults to 0.5.
+            max_backoff (float, optional): maximum backoff in seconds. Defaults to 30.
+            status_codes (tuple, optional): response status codes to retry. Defaults to (429, 500, 502, 503, 504).
+        """
+        self.retries = retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.status_codes = status_codes
+
+    def delay(self, attempt: int, retry_after: str | None = None) -> float:
+        """
+        Seconds to wait before the next attempt, with full jitter
+
+        Args:
+            attempt (int): number of the failed attempt, starting at 0
+            retry_after (str, optional): Retry-After header of the failed response. Defaults to None.
+
+        Returns:
+            float: seconds to wait
+
+        """
+        delay = random.uniform(0, min(self.max_backoff, self.backoff_factor * 2**attempt))
+        if (retry_after is not None) and retry_after.isdigit():
+            delay = max(delay, min(float(retry_after), self.max_backoff))
+        return delay
+
+
+class CircuitBreaker(object):
+    """Stop sending requests to a failing FEWS server for a recovery period.
+
+    After the recovery period one trial request is allowed ("half-open"), other requests are refused until its
+    result closes or re-opens the circuit. A trial without a recorded result expires after another recovery period.
+    """
+
+    def __init__(self, failure_threshold: int = 5, recovery_time: float = 30):
+        """
+        Args:
+            failure_threshold (int, optional): consecutive failures that open the circuit. Defaults to 5.
+            recovery_time (float, optional): seconds the circuit stays open before a trial request is
+            allowed. Defaults to 30.
+        """
+        self.failure_threshold = failure_threshold
+        self.recovery_time = recovery_time
+        self.failures = 0
+        self.opened_at = None
+        self.trial_started_at = None
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        """State of the circuit: "closed", "open" or "half-open"."""
+        if self.opened_at is None:
+            return "closed"
+        elif time.monotonic() - self.opened_at < self.recovery_time:
+            return "open"
+        return "half-open"
+
+    def allow_request(self) -> bool:
+        """Check if a request is allowed: the circuit is closed, or half-open without a trial request in flight.
+
+        In the half-open state an allowed request is the trial request.
+        """
+        with self._lock:
+            state = self.state
+            if state == "closed":
+                return True
+            elif state == "open":
+                return False
+            now = time.monotonic()
+            if (self.trial_started_at is not None) and (
+                now - self.trial_started_at < self.recovery_time
+            ):
+                return False
+            self.trial_started_at = now
+            return True
+
+    def record_success(self):
+        """Close the circuit after a successful request."""
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+            self.trial_started_at = None
+
+    def record_failure(self):
+        """Count a failed request and (re-)open the circuit at failure_threshold."""
+        with self._lock:
+            self.trial_started_at = None
+            self.failures += 1
+            if (self.failures >= self.failure_threshold) or (self.opened_at is not None):
+                self.opened_at = time.monotonic()
+
+    def check(self, url: str):
+        """Raise CircuitOpenError if the circuit is open, or half-open with a trial request in flight."""
+        if not self.allow_request():
+            raise CircuitOpenError(
+                f"Circuit open after {self.failures} failures; not requesting {url}"
+            )
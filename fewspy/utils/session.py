@@ -0,0 +1,187 @@
+import asyncio
+import time
+import aiohttp
+import requests
+from requests.adapters import HTTPAdapter
+from .resilience import DEFAULT_TIMEOUT, CircuitBreaker, RetryPolicy
+
+DEFAULT_POOL_SIZE = 10
+
+
+def create_session(pool_size: int = DEFAULT_POOL_SIZE) -> requests.Session:
+    """
+    Create a connection-pooled requests.Session with keep-alive
+
+    Args:
+        pool_size (int, optional): maximum number of connections kept alive per host.
+        Defaults to 10.
+
+    Returns:
+        requests.Session: session to be shared by all requests to the FEWS PI REST WebService
+
+    """
+
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers.update({"Connection": "keep-alive"})
+
+    return session
+
+
+def http_get(
+    url: str,
+    params: dict | None = None,
+    session: requests.Session | None = None,
+    timeout: float | tuple | None = DEFAULT_TIMEOUT,
+    retry: RetryPolicy | None = None,
+    circuit_breaker: CircuitBreaker | None = None,
+    **kwargs,
+) -> requests.Response:
+    """
+    Send a GET request, re-using the connection pool of session if provided
+
+    Args:
+        url (str): url to request
+        params (dict, optional): query parameters. Defaults to None.
+        session (requests.Session, optional): session to send the request with. If None,
+        a single-use connection is opened by requests.get. Defaults to None.
+        timeout (float | tuple, optional): connect and read timeout in seconds. Defaults to (10, 300).
+        retry (RetryPolicy, optional): retry policy for failed requests. Defaults to None (no retries).
+        circuit_breaker (CircuitBreaker, optional): circuit breaker shared by requests to the same server.
+        Defaults to None.
+        **kwargs: passed to requests.get/requests.Session.get (e.g. verify)
+
+    Returns:
+        requests.Response: server response. If retries are exhausted, the last response.
+
+    """
+
+    get = requests.get if session is None else session.get
+    retries = 0 if retry is None else retry.retries
+    attempt = 0
+    while True:
+        if circuit_breaker is not None:
+            circuit_breaker.check(url)
+        retry_after = None
+        try:
+            response = get(url, params=params, timeout=timeout, **kwargs)
+        except (requests.ConnectionError, requests.Timeout):
+            if circuit_breaker is not None:
+                circuit_breaker.record_failure()
+            if attempt >= retries:
+                raise
+        else:
+            if (retry is None) or (response.status_code not in retry.status_codes):
+                if circuit_breaker is not None:
+                    circuit_breaker.record_success()
+                return response
+            if circuit_breaker is not None:
+                circuit_breaker.record_failure()
+            if attempt >= retries:
+                return response
+            retry_after = response.headers.get("Retry-After")
+
+            # release the connection of a discarded (streamed) response to the pool
+            response.close()
+        time.sleep(retry.delay(attempt, retry_after))
+        attempt += 1
+
+
+def to_query(params: dict | None) -> list[tuple[str, str]]:
+    """
+    Convert request parameters to a list of query tuples, expanding list-values to repeated keys
+
+    Args:
+        params (dict, optional): query parameters
+
+    Returns:
+        list[tuple[str, str]]: query parameters as accepted by aiohttp
+
+    """
+
+    query = []
+    if params is not None:
+        for key, value in params.items():
+            values = value if isinstance(value, (list, tuple)) else [value]
+            query += [(key, str(i)) for i in values]
+    return query
+
+
+def to_client_timeout(timeout: float | tuple) -> aiohttp.ClientTimeout:
+    """
+    Convert a requests-style (connect, read) timeout to an aiohttp.ClientTimeout
+
+    Args:
+        timeout (float | tuple): connect and read timeout in seconds
+
+    Returns:
+        aiohttp.ClientTimeout: timeout for an aiohttp request
+
+    """
+
+    if isinstance(timeout, (list, tuple)):
+        connect, read = timeout
+    else:
+        connect, read = timeout, timeout
+    return aiohttp.ClientTimeout(total=None, sock_connect=connect, sock_read=read)
+
+
+async def http_get_async(
+    session: aiohttp.ClientSession,
+    url: str,
+    params: dict | None = None,
+    verify: bool = False,
+    timeout: float | tuple | None = DEFAULT_TIMEOUT,
+    retry: RetryPolicy | None = None,
+    circuit_breaker: CircuitBreaker | None = None,
+) -> tuple[aiohttp.ClientResponse, bytes]:
+    """
+    Send a GET request with an aiohttp.ClientSession and read the full body
+
+    Args:
+        session (aiohttp.ClientSession): session to send the request with
+        url (str): url to request
+        params (dict, optional): query parameters. Defaults to None.
+        verify (bool, optional): passed to aiohttp ssl parameter. Defaults to False.
+        timeout (float | tuple, optional): connect and read timeout in seconds. Defaults to (10, 300).
+        retry (RetryPolicy, optional): retry policy for failed requests. Defaults to None (no retries).
+        circuit_breaker (CircuitBreaker, optional): circuit breaker shared by requests to the same server.
+        Defaults to None.
+
+    Returns:
+        tuple[aiohttp.ClientResponse, bytes]: released server response and its body. If retries are
+        exhausted, the last response.
+
+    """
+
+    request_kwargs = dict(params=to_query(params), ssl=verify)
+    if timeout is not None:
+        request_kwargs["timeout"] = to_client_timeout(timeout)
+    retries = 0 if retry is None else retry.retries
+    attempt = 0
+    while True:
+        if circuit_breaker is not None:
+            circuit_breaker.check(url)
+        retry_after = None
+        try:
+            async with session.get(url, **request_kwargs) as response:
+                content = await response.read()
+        except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+            if circuit_breaker is not None:
+                circuit_breaker.record_failure()
+            if attempt >= retries:
+                raise
+        else:
+            if (retry is None) or (response.status not in retry.status_codes):
+                if circuit_breaker is not None:
+                    circuit_breaker.record_success()
+                return response, content
+            if circuit_breaker is not None:
+                circuit_breaker.record_failure()
+            if attempt >= retries:
+                return response, content
+            retry_after = response.headers.get("Retry-After")
+        await asyncio.sleep(retry.delay(attempt, retry_after))
+        attempt += 1
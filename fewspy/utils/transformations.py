@@ -47,7 +47,7 @@ def parameters_to_fews(parameters: dict, bool_to_string=False) -> dict:
     """
 
     def _convert_kv(k: str, v) -> dict:
-        if k in DATETIME_KEYS:
+        if (k in DATETIME_KEYS) and (v is not None):
             v = datetime_to_fews_str(v)
         elif k == "attributes":
             k = "show_attributes"
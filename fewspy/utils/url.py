@@ -1,18 +1,25 @@
+import threading
+import aiohttp
 import requests
+from .session import http_get, http_get_async
+from .resilience import DEFAULT_TIMEOUT
+
+_VALIDATED_URLS = set()
+_VALIDATED_URLS_LOCK = threading.Lock()
 
 
 class URLNotFoundError(Exception):
     pass
 
 
-def validate_url(url: str, test_postfix: str = "timezoneid") -> str:
+def normalize_url(url: str) -> tuple[str, bool]:
     """
+    Add a trailing / to url and estimate ssl_verify, without sending a request
 
     Args:
-        url: input url to be validated
-        test_postfix: postfix to url used for testing. Defaults to 'filters'.
+        url: input url to be normalized
 
-    Returns: validated url
+    Returns: normalized url and estimated ssl_verify
 
     """
 
@@ -20,11 +27,6 @@ def validate_url(url: str, test_postfix: str = "timezoneid") -> str:
     if not url.endswith("/"):
         url += "/"
 
-    # test with request
-    response = requests.get(f"{url}{test_postfix}", verify=False)
-    if not response.ok:
-        raise URLNotFoundError(f"{url} is not a root to a live FEWS PI Rest WebService")
-
     # estimate ssl_verify
     if url.startswith("https"):
         ssl_verify = True
@@ -32,3 +34,79 @@ def validate_url(url: str, test_postfix: str = "timezoneid") -> str:
         ssl_verify = False
 
     return url, ssl_verify
+
+
+def validate_url(
+    url: str,
+    test_postfix: str = "timezoneid",
+    session: requests.Session | None = None,
+    memoize: bool = True,
+    timeout: float | tuple = DEFAULT_TIMEOUT,
+) -> str:
+    """
+
+    Args:
+        url: input url to be validated
+        test_postfix: postfix to url used for testing. Defaults to 'filters'.
+        session: session to send the test request with. Defaults to None.
+        memoize: if True, urls validated before in this process are not requested again. Defaults to True.
+        timeout: connect and read timeout in seconds. Defaults to (10, 300).
+
+    Returns: validated url
+
+    """
+
+    url, ssl_verify = normalize_url(url)
+
+    if memoize and (url in _VALIDATED_URLS):
+        return url, ssl_verify
+
+    # test with request
+    response = http_get(
+        f"{url}{test_postfix}", session=session, verify=False, timeout=timeout
+    )
+    if not response.ok:
+        raise URLNotFoundError(f"{url} is not a root to a live FEWS PI Rest WebService")
+
+    with _VALIDATED_URLS_LOCK:
+        _VALIDATED_URLS.add(url)
+
+    return url, ssl_verify
+
+
+async def validate_url_async(
+    url: str,
+    session: aiohttp.ClientSession,
+    test_postfix: str = "timezoneid",
+    memoize: bool = True,
+    timeout: float | tuple = DEFAULT_TIMEOUT,
+) -> str:
+    """
+
+    Args:
+        url: input url to be validated
+        session: aiohttp session to send the test request with.
+        test_postfix: postfix to url used for testing. Defaults to 'timezoneid'.
+        memoize: if True, urls validated before in this process are not requested again. Defaults to True.
+        timeout: connect and read timeout in seconds. Defaults to (10, 300).
+
+    Returns: validated url
+
+    """
+
+    url, ssl_verify = normalize_url(url)
+
+    if memoize and (url in _VALIDATED_URLS):
+        return url, ssl_verify
+
+    # test with request
+    response, _ = await http_get_async(
+        session, f"{url}{test_postfix}", verify=False, timeout=timeout
+    )
+    if not response.ok:
+        raise URLNotFoundError(f"{url} is not a root to a live FEWS PI Rest WebService")
+
+    with _VALIDATED_URLS_LOCK:
+        _VALIDATED_URLS.add(url)
+
+    return url, ssl_verify
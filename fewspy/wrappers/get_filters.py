@@ -2,6 +2,8 @@ import requests
 import logging
 from typing import List
 from ..utils.timer import Timer
+from ..utils.session import http_get
+from ..utils.resilience import DEFAULT_TIMEOUT, CircuitBreaker, RetryPolicy
 from ..utils.transformations import parameters_to_fews
 
 LOGGER = logging.getLogger(__name__)
@@ -13,6 +15,10 @@ def get_filters(
     document_format: str = "PI_JSON",
     verify: bool = False,
     logger=LOGGER,
+    session: requests.Session = None,
+    timeout: float | tuple = DEFAULT_TIMEOUT,
+    retry: RetryPolicy = None,
+    circuit_breaker: CircuitBreaker = None,
 ) -> List[dict]:
     """
     Get FEWS qualifiers as a pandas DataFrame
@@ -26,6 +32,12 @@ def get_filters(
         Defaults to False.
         logger (logging.Logger, optional): Logger to pass logging to. By
         default, a logger will ge created.
+        session (requests.Session, optional): session to re-use pooled connections from.
+        Defaults to None, opening a new connection per request.
+        timeout (float | tuple, optional): connect and read timeout in seconds. Defaults to (10, 300).
+        retry (RetryPolicy, optional): retry policy for failed requests. Defaults to None (no retries).
+        circuit_breaker (CircuitBreaker, optional): circuit breaker shared by requests to the same server.
+        Defaults to None.
 
     Returns:
         df (pandas.DataFrame): Pandas dataframe with index "id" and columns
@@ -36,7 +48,15 @@ def get_filters(
     # do the request
     timer = Timer(logger)
     parameters = parameters_to_fews(locals())
-    response = requests.get(url, parameters, verify=verify)
+    response = http_get(
+        url,
+        parameters,
+        session=session,
+        verify=verify,
+        timeout=timeout,
+        retry=retry,
+        circuit_breaker=circuit_breaker,
+    )
     timer.report("Filters request")
 
     # parse the response
@@ -3,6 +3,8 @@ import pandas as pd
 import geopandas as gpd
 import logging
 from ..utils.timer import Timer
+from ..utils.session import http_get
+from ..utils.resilience import DEFAULT_TIMEOUT, CircuitBreaker, RetryPolicy
 from ..utils.transformations import parameters_to_fews
 from ..utils.conversions import (
     attributes_to_array,
@@ -16,6 +18,57 @@ from typing import Literal
 LOGGER = logging.getLogger(__name__)
 
 
+def _locations_from_json(
+    data: dict,
+    document_format: Literal["GEO_JSON", "PI_JSON"] = "GEO_JSON",
+    attributes: list = [],
+    remove_duplicates: bool = False,
+) -> gpd.GeoDataFrame:
+    """Parse FEWS PI_JSON or GEO_JSON locations response to a GeoDataFrame with index "location_id"."""
+    if document_format == "PI_JSON":
+        # convert to gdf and snake_case
+        gdf = gpd.GeoDataFrame(data["locations"], geometry=gpd.GeoSeries())
+        gdf.columns = [camel_to_snake_case(i) for i in gdf.columns]
+
+        # remove duplicates
+        if remove_duplicates:
+            gdf.drop_duplicates(subset="location_id", inplace=True, ignore_index=True)
+
+        # set index
+        gdf.set_index("location_id", inplace=True)
+
+        # handle geometry and crs
+        gdf["geometry"] = xy_array_to_point(gdf[["x", "y"]].values)
+        gdf.crs = geo_datum_to_crs(data["geoDatum"])
+
+    elif document_format == "GEO_JSON":
+        # we read as 4326
+        gdf = gpd.GeoDataFrame.from_features(data, crs="4326")
+        gdf.columns = [camel_to_snake_case(i) for i in gdf.columns]
+
+        # reproject if crs is provided
+        if "crs" in data.keys():
+            target_epsg = data["crs"]["properties"]["code"]
+            if target_epsg != 4326:
+                gdf = gdf.to_crs(f"EPSG:{target_epsg}")
+
+        # remove duplicates
+        if remove_duplicates:
+            gdf.drop_duplicates(subset="location_id", inplace=True, ignore_index=True)
+
+        # set index
+        gdf.set_index("location_id", inplace=True)
+    else:
+        raise ValueError(f"Reading document_format {document_format} not implemented")
+
+    # handle attributes
+    if attributes:
+        gdf.loc[:, attributes] = attributes_to_array(gdf["attributes"].values, attributes)
+    gdf.drop(columns=["attributes"], inplace=True)
+
+    return gdf
+
+
 def get_locations(
     url: str,
     filter_id: str = None,
@@ -23,6 +76,10 @@ def get_locations(
     attributes: list = [],
     verify: bool = False,
     logger=LOGGER,
+    session: requests.Session = None,
+    timeout: float | tuple = DEFAULT_TIMEOUT,
+    retry: RetryPolicy = None,
+    circuit_breaker: CircuitBreaker = None,
     remove_duplicates: bool = False,
 ) -> pd.DataFrame:
     """
@@ -37,6 +94,12 @@ def get_locations(
         verify (bool, optional): passed to requests.get verify parameter.
         Defaults to False.
         logger (logging.Logger, optional): Logger to pass logging to. By default, a logger will ge created.
+        session (requests.Session, optional): session to re-use pooled connections from.
+        Defaults to None, opening a new connection per request.
+        timeout (float | tuple, optional): connect and read timeout in seconds. Defaults to (10, 300).
+        retry (RetryPolicy, optional): retry policy for failed requests. Defaults to None (no retries).
+        circuit_breaker (CircuitBreaker, optional): circuit breaker shared by requests to the same server.
+        Defaults to None.
 
     Returns:
         df (pandas.DataFrame): Pandas dataframe with index "id" and columns
@@ -47,63 +110,25 @@ def get_locations(
     # do the request
     timer = Timer(logger)
     parameters = parameters_to_fews(locals())
-    response = requests.get(url, parameters, verify=verify)
+    response = http_get(
+        url,
+        parameters,
+        session=session,
+        verify=verify,
+        timeout=timeout,
+        retry=retry,
+        circuit_breaker=circuit_breaker,
+    )
     timer.report("Locations request")
 
     # parse the response
     if response.status_code == 200:
-        if document_format == "PI_JSON":
-            # convert to gdf and snake_case
-            gdf = gpd.GeoDataFrame(
-                response.json()["locations"], geometry=gpd.GeoSeries()
-            )
-            gdf.columns = [camel_to_snake_case(i) for i in gdf.columns]
-
-            # remove duplicates
-            if remove_duplicates:
-                gdf.drop_duplicates(
-                    subset="location_id", inplace=True, ignore_index=True
-                )
-
-            # set index
-            gdf.set_index("location_id", inplace=True)
-
-            # handle geometry and crs
-            gdf["geometry"] = xy_array_to_point(gdf[["x", "y"]].values)
-            gdf.crs = geo_datum_to_crs(response.json()["geoDatum"])
-
-        elif document_format == "GEO_JSON":
-            # read from GeoJSON
-            data = response.json()
-
-            # we read as 4326
-            gdf = gpd.GeoDataFrame.from_features(data, crs="4326")
-            gdf.columns = [camel_to_snake_case(i) for i in gdf.columns]
-
-            # reproject if crs is provided
-            if "crs" in data.keys():
-                target_epsg = data["crs"]["properties"]["code"]
-                if target_epsg != 4326:
-                    gdf = gdf.to_crs(f"EPSG:{target_epsg}")
-
-            # remove duplicates
-            if remove_duplicates:
-                gdf.drop_duplicates(
-                    subset="location_id", inplace=True, ignore_index=True
-                )
-
-            # set index
-            gdf.set_index("location_id", inplace=True)
-        else:
-            raise ValueError(
-                f"Reading document_format {document_format} not implemented"
-            )
-        # handle attributes
-        if attributes:
-            gdf.loc[:, attributes] = attributes_to_array(
-                gdf["attributes"].values, attributes
-            )
-        gdf.drop(columns=["attributes"], inplace=True)
+        gdf = _locations_from_json(
+            response.json(),
+            document_format=document_format,
+            attributes=attributes,
+            remove_duplicates=remove_duplicates,
+        )
         timer.report("Locations parsed")
 
         return gdf
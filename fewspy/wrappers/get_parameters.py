@@ -3,6 +3,8 @@ import logging
 import pandas as pd
 from typing import List
 from ..utils.timer import Timer
+from ..utils.session import http_get
+from ..utils.resilience import DEFAULT_TIMEOUT, CircuitBreaker, RetryPolicy
 from ..utils.transformations import parameters_to_fews
 from ..utils.conversions import camel_to_snake_case
 
@@ -18,12 +20,27 @@ COLUMNS = [
 ]
 
 
+def _parameters_from_json(data: dict) -> pd.DataFrame:
+    """Parse FEWS PI_JSON parameters response to a DataFrame with index "id"."""
+    df = pd.DataFrame(columns=COLUMNS)
+    if "timeSeriesParameters" in data.keys():
+        df = pd.DataFrame(data["timeSeriesParameters"])
+        df.columns = [camel_to_snake_case(i) for i in df.columns]
+        df["uses_datum"] = df["uses_datum"] == "true"
+    df.set_index("id", inplace=True)
+    return df
+
+
 def get_parameters(
     url: str,
     filter_id: str = None,
     document_format: str = "PI_JSON",
     verify: bool = False,
     logger=LOGGER,
+    session: requests.Session = None,
+    timeout: float | tuple = DEFAULT_TIMEOUT,
+    retry: RetryPolicy = None,
+    circuit_breaker: CircuitBreaker = None,
 ) -> List[dict]:
     """
     Get FEWS qualifiers as a pandas DataFrame
@@ -37,6 +54,12 @@ def get_parameters(
         Defaults to False.
         logger (logging.Logger, optional): Logger to pass logging to. By
         default, a logger will ge created.
+        session (requests.Session, optional): session to re-use pooled connections from.
+        Defaults to None, opening a new connection per request.
+        timeout (float | tuple, optional): connect and read timeout in seconds. Defaults to (10, 300).
+        retry (RetryPolicy, optional): retry policy for failed requests. Defaults to None (no retries).
+        circuit_breaker (CircuitBreaker, optional): circuit breaker shared by requests to the same server.
+        Defaults to None.
 
     Returns:
         df (pandas.DataFrame): Pandas dataframe with index "id" and columns
@@ -47,20 +70,23 @@ def get_parameters(
     # do the request
     timer = Timer(logger)
     parameters = parameters_to_fews(locals())
-    response = requests.get(url, parameters, verify=verify)
+    response = http_get(
+        url,
+        parameters,
+        session=session,
+        verify=verify,
+        timeout=timeout,
+        retry=retry,
+        circuit_breaker=circuit_breaker,
+    )
     timer.report("Parameters request")
 
     # parse the response
-    df = pd.DataFrame(columns=COLUMNS)
     if response.status_code == 200:
-        if "timeSeriesParameters" in response.json().keys():
-            df = pd.DataFrame(response.json()["timeSeriesParameters"])
-            df.columns = [camel_to_snake_case(i) for i in df.columns]
-            df["uses_datum"] = df["uses_datum"] == "true"
-            timer.report("Parameters parsed")
+        df = _parameters_from_json(response.json())
+        timer.report("Parameters parsed")
     else:
         logger.error(f"FEWS Server responds {response.text}")
-
-    df.set_index("id", inplace=True)
+        df = _parameters_from_json({})
 
     return df
@@ -3,6 +3,8 @@ from xml.etree import ElementTree
 import pandas as pd
 import logging
 from ..utils.timer import Timer
+from ..utils.session import http_get
+from ..utils.resilience import DEFAULT_TIMEOUT, CircuitBreaker, RetryPolicy
 
 NS = "{http://www.wldelft.nl/fews/PI}"
 LOGGER = logging.getLogger(__name__)
@@ -36,7 +38,25 @@ def _element_to_tuple(qualifier_element: ElementTree.Element) -> tuple:
     return (ident, name, group_id)
 
 
-def get_qualifiers(url: str, verify: bool = False, logger=LOGGER) -> pd.DataFrame:
+def _qualifiers_from_content(content: bytes) -> pd.DataFrame:
+    """Parse FEWS PI_XML qualifiers response to a DataFrame with index "id"."""
+    tree = ElementTree.fromstring(content)
+    qualifiers_tree = [i for i in tree.iter(tag=f"{NS}qualifier")]
+    qualifiers_tuple = (_element_to_tuple(i) for i in qualifiers_tree)
+    df = pd.DataFrame(qualifiers_tuple, columns=COLUMNS)
+    df.set_index("id", inplace=True)
+    return df
+
+
+def get_qualifiers(
+    url: str,
+    verify: bool = False,
+    logger=LOGGER,
+    session: requests.Session = None,
+    timeout: float | tuple = DEFAULT_TIMEOUT,
+    retry: RetryPolicy = None,
+    circuit_breaker: CircuitBreaker = None,
+) -> pd.DataFrame:
     """
     Get FEWS qualifiers as Pandas DataFrame
 
@@ -47,6 +67,12 @@ def get_qualifiers(url: str, verify: bool = False, logger=LOGGER) -> pd.DataFram
         Defaults to False.
         logger (logging.Logger, optional): Logger to pass logging to. By
         default, a new logger will ge created.
+        session (requests.Session, optional): session to re-use pooled connections from.
+        Defaults to None, opening a new connection per request.
+        timeout (float | tuple, optional): connect and read timeout in seconds. Defaults to (10, 300).
+        retry (RetryPolicy, optional): retry policy for failed requests. Defaults to None (no retries).
+        circuit_breaker (CircuitBreaker, optional): circuit breaker shared by requests to the same server.
+        Defaults to None.
 
     Returns:
         df (pandas.DataFrame): Pandas dataframe with index "id" and columns
@@ -56,19 +82,22 @@ def get_qualifiers(url: str, verify: bool = False, logger=LOGGER) -> pd.DataFram
 
     # do the request
     timer = Timer(logger)
-    response = requests.get(url, verify=False)
+    response = http_get(
+        url,
+        session=session,
+        verify=False,
+        timeout=timeout,
+        retry=retry,
+        circuit_breaker=circuit_breaker,
+    )
     timer.report("Qualifiers request")
 
     # parse the response
     if response.status_code == 200:
-        tree = ElementTree.fromstring(response.content)
-        qualifiers_tree = [i for i in tree.iter(tag=f"{NS}qualifier")]
-        qualifiers_tuple = (_element_to_tuple(i) for i in qualifiers_tree)
-        df = pd.DataFrame(qualifiers_tuple, columns=COLUMNS)
+        df = _qualifiers_from_content(response.content)
         timer.report("Qualifiers parsed")
     else:
         logger.error(f"FEWS Server responds {response.text}")
-        df = pd.DataFrame(columns=COLUMNS)
-    df.set_index("id", inplace=True)
+        df = pd.DataFrame(columns=COLUMNS).set_index("id")
 
     return df
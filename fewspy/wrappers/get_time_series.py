@@ -2,12 +2,23 @@ import requests
 import pandas as pd
 import logging
 from ..utils.timer import Timer
+from ..utils.session import http_get
+from ..utils.resilience import DEFAULT_TIMEOUT, CircuitBreaker, RetryPolicy
 from ..utils.transformations import parameters_to_fews
+from ..utils.planning import (
+    DEFAULT_MAX_SERIES_PER_REQUEST,
+    DEFAULT_MAX_URL_LENGTH,
+    check_complete,
+    plan_batches,
+    plan_time_windows,
+)
 from typing import List, Union
 from ..time_series import TimeSeriesSet
-from datetime import datetime
+from ..utils.json_codec import loads
+from datetime import datetime, timedelta
 from fewspy.io.read_xml import read_xml_from_string
 from fewspy.io.read_netcdf import read_netcdf_from_content
+from fewspy.io.read_json import CHUNK_SIZE, read_json_from_chunks
 
 
 LOGGER = logging.getLogger(__name__)
@@ -20,6 +31,21 @@ def _ts_or_headers(only_headers=False):
         return "TimeSeries {status}"
 
 
+def _time_series_set_from_content(
+    content: bytes, document_format: str = "PI_JSON"
+) -> TimeSeriesSet:
+    """Parse FEWS timeseries response content to a TimeSeriesSet."""
+    if document_format == "PI_JSON":
+        time_series_set = TimeSeriesSet.from_dict(loads(content))
+    elif document_format == "PI_XML":
+        time_series_set = read_xml_from_string(content.decode("utf-8"))
+    elif document_format == "PI_NETCDF":
+        time_series_set = read_netcdf_from_content(content)
+    else:
+        raise ValueError(f"Reading document_format {document_format} not implemented")
+    return time_series_set
+
+
 def get_time_series(
     url: str,
     filter_id: str,
@@ -35,6 +61,14 @@ def get_time_series(
     document_format: str = "PI_JSON",
     verify: bool = False,
     logger=LOGGER,
+    session: requests.Session = None,
+    timeout: float | tuple = DEFAULT_TIMEOUT,
+    retry: RetryPolicy = None,
+    circuit_breaker: CircuitBreaker = None,
+    max_url_length: int = DEFAULT_MAX_URL_LENGTH,
+    max_series_per_request: int = DEFAULT_MAX_SERIES_PER_REQUEST,
+    time_window: timedelta = None,
+    stream: bool = False,
 ) -> pd.DataFrame:
     """
     Get FEWS qualifiers as a pandas DataFrame
@@ -57,6 +91,20 @@ def get_time_series(
         Defaults to False.
         logger (logging.Logger, optional): Logger to pass logging to. By
         default, a logger will ge created.
+        session (requests.Session, optional): session to re-use pooled connections from.
+        Defaults to None, opening a new connection per request.
+        timeout (float | tuple, optional): connect and read timeout in seconds. Defaults to (10, 300).
+        retry (RetryPolicy, optional): retry policy for failed requests. Defaults to None (no retries).
+        circuit_breaker (CircuitBreaker, optional): circuit breaker shared by requests to the same server.
+        Defaults to None.
+        max_url_length (int, optional): maximum length of a request url. Longer requests are split
+        in batches of location_ids and parameter_ids. Defaults to 8000.
+        max_series_per_request (int, optional): maximum number of expected time series per request.
+        Defaults to 500.
+        time_window (datetime.timedelta, optional): if specified, [start_time, end_time] is requested in
+        consecutive windows of at most time_window and stitched. Defaults to None.
+        stream (bool, optional): if True, a PI_JSON response is parsed while it is downloaded, so the
+        full response is never in memory. Defaults to False.
 
     Returns:
         df (pandas.DataFrame): Pandas dataframe with index "id" and columns
@@ -64,28 +112,93 @@ def get_time_series(
 
     """
     report_string = _ts_or_headers(only_headers)
+    parameters = parameters_to_fews(locals())
+    batches = plan_batches(
+        url,
+        parameters,
+        location_ids=location_ids,
+        parameter_ids=parameter_ids,
+        qualifier_ids=qualifier_ids,
+        max_url_length=max_url_length,
+        max_series_per_request=max_series_per_request,
+    )
+    windows = plan_time_windows(start_time, end_time, time_window)
+    requests_parameters = [{**i, **j} for i in batches for j in windows]
+    if len(requests_parameters) > 1:
+        logger.debug(
+            f"Request split into {len(batches)} batches and {len(windows)} time windows"
+        )
+
+    time_series_sets = [
+        _get_time_series_set(
+            url,
+            i,
+            document_format=document_format,
+            verify=verify,
+            logger=logger,
+            session=session,
+            timeout=timeout,
+            retry=retry,
+            circuit_breaker=circuit_breaker,
+            report_string=report_string,
+            stream=stream,
+        )
+        for i in requests_parameters
+    ]
+    check_complete(time_series_sets, requests_parameters)
+
+    return TimeSeriesSet.concat(
+        [i for i in time_series_sets if i is not None], deduplicate=len(windows) > 1
+    )
+
+
+def _get_time_series_set(
+    url: str,
+    parameters: dict,
+    document_format: str = "PI_JSON",
+    verify: bool = False,
+    logger=LOGGER,
+    session: requests.Session = None,
+    timeout: float | tuple = DEFAULT_TIMEOUT,
+    retry: RetryPolicy = None,
+    circuit_breaker: CircuitBreaker = None,
+    report_string: str = "TimeSeries {status}",
+    stream: bool = False,
+) -> TimeSeriesSet | None:
+    """Request and parse one batch of time series, None if the server responds with an error."""
 
     # do the request
+    stream = stream and (document_format == "PI_JSON")
     timer = Timer(logger)
-    parameters = parameters_to_fews(locals())
-    response = requests.get(url, parameters, verify=verify)
+    response = http_get(
+        url,
+        parameters,
+        session=session,
+        verify=verify,
+        timeout=timeout,
+        retry=retry,
+        circuit_breaker=circuit_breaker,
+        stream=stream,
+    )
     timer.report(report_string.format(status="request"))
 
     # parse the response
     if response.ok:
         logger.debug(response.url)
-        if document_format == "PI_JSON":
-            pi_time_series = response.json()
-            time_series_set = TimeSeriesSet.from_dict(pi_time_series)
-        elif document_format == "PI_XML":
-            time_series_set = read_xml_from_string(response.text)
-        elif document_format == "PI_NETCDF":
-            time_series_set = read_netcdf_from_content(response.content)
+        if stream:
+            with response:
+                time_series_set = read_json_from_chunks(
+                    response.iter_content(chunk_size=CHUNK_SIZE)
+                )
+        else:
+            time_series_set = _time_series_set_from_content(
+                response.content, document_format=document_format
+            )
         timer.report(report_string.format(status="parsed"))
         if time_series_set.empty:
             logger.debug(f"FEWS WebService request passing empty set: {response.url}")
     else:
         logger.error(f"FEWS WebService request {response.url} responds {response.text}")
-        time_series_set = TimeSeriesSet()
+        time_series_set = None
 
     return time_series_set
@@ -1,13 +1,21 @@
-import requests
 import pandas as pd
+from concurrent.futures import Executor
 import logging
-from fewspy.utils.timer import Timer
+from fewspy.utils.session import http_get_async
+from fewspy.utils.resilience import DEFAULT_TIMEOUT, CircuitBreaker, RetryPolicy
 from fewspy.utils.transformations import parameters_to_fews
+from fewspy.utils.planning import (
+    DEFAULT_MAX_SERIES_PER_REQUEST,
+    DEFAULT_MAX_URL_LENGTH,
+    check_complete,
+    plan_batches,
+    plan_time_windows,
+)
 from typing import List, Union
 from fewspy.time_series import TimeSeriesSet
-from aiohttp import ClientSession
+from fewspy.utils.json_codec import loads
 
-from datetime import datetime
+from datetime import datetime, timedelta
 import aiohttp
 import asyncio
 import nest_asyncio
@@ -16,28 +24,84 @@ nest_asyncio.apply()
 
 LOGGER = logging.getLogger(__name__)
 
+DEFAULT_MAX_CONCURRENCY = 10
+DEFAULT_CONNECTION_LIMIT = 100
 
-def __result_async_to_time_series_set(async_result):
-    time_series_set = TimeSeriesSet()
-    time_series_set_gen = (i for i in async_result if "timeSeries" if type(i) == dict)
-    time_series_set_list = [i for i in time_series_set_gen if "timeSeries" in i.keys()]
 
-    version = next((i for i in time_series_set_list if "version" in i.keys()), None)
-    if version is not None:
-        time_zone = next(
-            (i for i in time_series_set_list if "timeZone" in i.keys()), None
-        )
-        if time_zone is not None:
-            time_series = {
-                "timeSeries": [
-                    i["timeSeries"][0]
-                    for i in time_series_set_list
-                    if "timeSeries" in i.keys()
-                ]
-            }
-            pi_time_series = {**version, **time_zone, **time_series}
-            time_series_set = TimeSeriesSet.from_dict(pi_time_series)
-    return time_series_set
+def _result_async_to_time_series_set(
+    async_result, deduplicate: bool = False
+) -> TimeSeriesSet:
+    time_series_sets = [i for i in async_result if isinstance(i, TimeSeriesSet)]
+    return TimeSeriesSet.concat(time_series_sets, deduplicate=deduplicate)
+
+
+def _time_series_set_from_json(content: bytes) -> TimeSeriesSet:
+    """Parse PI_JSON response content to a TimeSeriesSet, picklable for process pools."""
+    return TimeSeriesSet.from_dict(loads(content))
+
+
+async def _fetch_all_async(
+    session: aiohttp.ClientSession,
+    url: str,
+    requests_parameters: List[dict],
+    verify: bool = False,
+    logger=LOGGER,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    timeout: float | tuple = DEFAULT_TIMEOUT,
+    retry: RetryPolicy = None,
+    circuit_breaker: CircuitBreaker = None,
+    executor: Executor = None,
+) -> List[TimeSeriesSet | None]:
+    """
+    Request all parameters with at most max_concurrency requests in flight and parse every
+    response as soon as it completes, so parsing overlaps with the requests still in flight.
+
+    Returns one TimeSeriesSet per request in order of requests_parameters, None for failed requests.
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+    loop = asyncio.get_running_loop()
+
+    async def _fetch(index, parameters):
+        async with semaphore:
+            try:
+                response, content = await http_get_async(
+                    session,
+                    url,
+                    params=parameters,
+                    verify=verify,
+                    timeout=timeout,
+                    retry=retry,
+                    circuit_breaker=circuit_breaker,
+                )
+                response.raise_for_status()
+            except Exception as err:
+                logger.error(
+                    f"An error ocurred: {err} while executing url {url} with parameters {parameters}"
+                )
+                return index, None
+
+        # parse outside the semaphore, so the next request is sent while parsing
+        try:
+            if executor is None:
+                time_series_set = _time_series_set_from_json(content)
+            else:
+                time_series_set = await loop.run_in_executor(
+                    executor, _time_series_set_from_json, content
+                )
+        except Exception as err:
+            logger.error(
+                f"An error ocurred: {err} while parsing url {url} with parameters {parameters}"
+            )
+            return index, None
+        return index, time_series_set
+
+    result = [None] * len(requests_parameters)
+    for task in asyncio.as_completed(
+        [_fetch(i, parameters) for i, parameters in enumerate(requests_parameters)]
+    ):
+        index, time_series_set = await task
+        result[index] = time_series_set
+    return result
 
 
 def get_time_series_async(
@@ -53,6 +117,16 @@ def get_time_series_async(
     omit_missing: bool = True,
     verify: bool = False,
     logger=LOGGER,
+    timeout: float | tuple = DEFAULT_TIMEOUT,
+    retry: RetryPolicy = None,
+    circuit_breaker: CircuitBreaker = None,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    connection_limit: int = DEFAULT_CONNECTION_LIMIT,
+    connection_limit_per_host: int | None = None,
+    max_url_length: int = DEFAULT_MAX_URL_LENGTH,
+    max_series_per_request: int = DEFAULT_MAX_SERIES_PER_REQUEST,
+    time_window: timedelta = None,
+    executor: Executor = None,
 ) -> pd.DataFrame:
     """
 
@@ -72,6 +146,21 @@ def get_time_series_async(
         Defaults to False.
         logger (logging.Logger, optional): Logger to pass logging to. By
         default, a logger will ge created.
+        timeout (float | tuple, optional): connect and read timeout in seconds. Defaults to (10, 300).
+        retry (RetryPolicy, optional): retry policy for failed requests. Defaults to None (no retries).
+        circuit_breaker (CircuitBreaker, optional): circuit breaker shared by requests to the same server.
+        Defaults to None.
+        max_concurrency (int, optional): maximum number of requests in flight. Defaults to 10.
+        connection_limit (int, optional): maximum number of open connections. Defaults to 100.
+        connection_limit_per_host (int, optional): maximum number of open connections to the FEWS host.
+        Defaults to None, using max_concurrency.
+        max_url_length (int, optional): maximum length of a request url. Defaults to 8000.
+        max_series_per_request (int, optional): maximum number of expected time series per request.
+        Defaults to 500.
+        time_window (datetime.timedelta, optional): if specified, [start_time, end_time] is requested in
+        consecutive windows of at most time_window and stitched. Defaults to None.
+        executor (concurrent.futures.Executor, optional): executor to parse responses in, e.g. a
+        ProcessPoolExecutor for large fan-outs. Defaults to None, parsing in the event loop.
 
     Returns:
         df (pandas.DataFrame): Pandas dataframe with index "id" and columns
@@ -79,6 +168,19 @@ def get_time_series_async(
 
     """
     parameters = parameters_to_fews(locals(), bool_to_string=True)
+    batches = plan_batches(
+        url,
+        parameters,
+        location_ids=location_ids,
+        parameter_ids=parameter_ids,
+        qualifier_ids=qualifier_ids,
+        max_url_length=max_url_length,
+        max_series_per_request=max_series_per_request,
+    )
+    windows = plan_time_windows(start_time, end_time, time_window)
+    requests_parameters = [{**i, **j} for i in batches for j in windows]
+    if connection_limit_per_host is None:
+        connection_limit_per_host = max_concurrency
 
     def _get_loop():
         try:
@@ -90,56 +192,28 @@ def get_time_series_async(
             loop.set_debug(True)
             return loop
 
-    async def get_timeseries_async(location_id, parameter_id, qualifier_id, session):
-        """Get timerseries using FEWS (asynchronously)"""
-        parameters["locationIds"] = [location_id]
-        parameters["parameterIds"] = [parameter_id]
-        if qualifier_id is not None:
-            parameters["qualifierIds"] = qualifier_id
-        try:
-            response = await session.request(
-                method="GET", url=url, params=parameters, ssl=verify
-            )
-            response.raise_for_status()
-        except Exception as err:
-            logger.error(
-                f"An error ocurred: {err} while executing url {url} with parameters {parameters}"
-            )
-            response = None
-        response_json = await response.json()
-        return response_json
-
-    async def run_program(location_id, parameter_id, qualifier_id, session):
-        """Wrapper for running program in an asynchronous manner"""
-        try:
-            response = await get_timeseries_async(
-                location_id, parameter_id, qualifier_id, session
+    async def asynciee():
+        connector = aiohttp.TCPConnector(
+            limit=connection_limit, limit_per_host=connection_limit_per_host
+        )
+        async with aiohttp.ClientSession(connector=connector) as session:
+            return await _fetch_all_async(
+                session,
+                url,
+                requests_parameters,
+                verify=verify,
+                logger=logger,
+                max_concurrency=max_concurrency,
+                timeout=timeout,
+                retry=retry,
+                circuit_breaker=circuit_breaker,
+                executor=executor,
             )
-        except Exception as err:
-            logger.error(f"Exception occured: {err}")
-            response = None
-            pass
-        return response
 
-    async def asynciee():
-        async with aiohttp.ClientSession(loop=loop) as session:
-            args = [
-                (location_id, parameter_id)
-                for location_id in location_ids
-                for parameter_id in parameter_ids
-            ]
-            if qualifier_ids is None:
-                args = [(*i, None) for i in args]
-            else:
-                args = [
-                    (*i, qualifier_id) for i in args for qualifier_id in qualifier_ids
-                ]
-            fetch_all = [run_program(*i, session) for i in args]
-            result_async = await asyncio.gather(*fetch_all)
-            return result_async
-
-    if __name__ == "fewspy.wrappers.get_time_series_async":
-        loop = _get_loop()
-        result_async = loop.run_until_complete(asynciee())
-        time_series_set = __result_async_to_time_series_set(result_async)
+    loop = _get_loop()
+    result_async = loop.run_until_complete(asynciee())
+    check_complete(result_async, requests_parameters)
+    time_series_set = _result_async_to_time_series_set(
+        result_async, deduplicate=len(windows) > 1
+    )
     return time_series_set
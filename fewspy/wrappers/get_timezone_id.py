@@ -1,6 +1,8 @@
 import requests
 import logging
 from ..utils.timer import Timer
+from ..utils.session import http_get
+from ..utils.resilience import DEFAULT_TIMEOUT, CircuitBreaker, RetryPolicy
 from ..utils.transformations import parameters_to_fews
 
 LOGGER = logging.getLogger(__name__)
@@ -12,6 +14,10 @@ def get_timezone_id(
     document_format: str = "PI_JSON",
     verify: bool = False,
     logger=LOGGER,
+    session: requests.Session = None,
+    timeout: float | tuple = DEFAULT_TIMEOUT,
+    retry: RetryPolicy = None,
+    circuit_breaker: CircuitBreaker = None,
 ) -> str:
     """
     Get FEWS timezone id
@@ -25,6 +31,12 @@ def get_timezone_id(
         Defaults to False.
         logger (logging.Logger, optional): Logger to pass logging to. By
         default, a logger will ge created.
+        session (requests.Session, optional): session to re-use pooled connections from.
+        Defaults to None, opening a new connection per request.
+        timeout (float | tuple, optional): connect and read timeout in seconds. Defaults to (10, 300).
+        retry (RetryPolicy, optional): retry policy for failed requests. Defaults to None (no retries).
+        circuit_breaker (CircuitBreaker, optional): circuit breaker shared by requests to the same server.
+        Defaults to None.
 
     Returns:
         str: timezone string, e.g. GMT+01:00 expressing a GMT + 1 hour offset
@@ -34,7 +46,15 @@ def get_timezone_id(
     # do the request
     timer = Timer(logger)
     parameters = parameters_to_fews(locals())
-    response = requests.get(url, parameters, verify=verify)
+    response = http_get(
+        url,
+        parameters,
+        session=session,
+        verify=verify,
+        timeout=timeout,
+        retry=retry,
+        circuit_breaker=circuit_breaker,
+    )
     timer.report("Timezone request")
 
     # parse the response
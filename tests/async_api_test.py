@@ -0,0 +1,110 @@
+from datetime import datetime, timedelta
+import asyncio
+import pytest
+
+from fewspy import AsyncApi
+from config import FEWS_API_URL
+
+LOCATION_IDS = ["NL34.HL.KGM156.HWZ1", "NL34.HL.KGM156.LWZ1"]
+PARAMETER_IDS = ["Q [m3/s] [NVT] [OW]", "WATHTE [m] [NAP] [OW]"]
+
+
+async def _gather_requests():
+    async with AsyncApi(url=FEWS_API_URL, ssl_verify=False) as api:
+        return await asyncio.gather(
+            api.get_timezone_id(),
+            api.get_parameters(),
+            api.get_qualifiers(),
+            api.get_time_series(
+                filter_id="WDB_OW_KGM",
+                location_ids=LOCATION_IDS,
+                start_time=datetime(2022, 5, 1),
+                end_time=datetime(2022, 5, 5),
+                parameter_ids=PARAMETER_IDS,
+            ),
+        )
+
+
+@pytest.fixture(scope="module")
+def results():
+    return asyncio.run(_gather_requests())
+
+
+def test_timezone_id(results):
+    assert results[0] == "GMT+01:00"
+
+
+def test_parameters(results):
+    assert not results[1].empty
+
+
+def test_qualifiers(results):
+    assert "productie" in results[2].index
+
+
+def test_time_series(results):
+    time_series_set = results[3]
+    assert not time_series_set.empty
+    assert all([i in LOCATION_IDS for i in time_series_set.location_ids])
+
+
+@pytest.mark.parametrize("parallel", [False, True])
+def test_time_series_planning(parallel):
+    """Check batches and time windows are planned with and without parallel, offline"""
+    from stubs import AsyncStubSession
+
+    session = AsyncStubSession()
+
+    async def _get_time_series():
+        async with AsyncApi(url="http://localhost/", session=session, validate="skip") as api:
+            return await api.get_time_series(
+                filter_id="WDB_OW_KGM",
+                location_ids=LOCATION_IDS,
+                parameter_ids=PARAMETER_IDS[1:],
+                start_time=datetime(2022, 5, 1),
+                end_time=datetime(2022, 5, 5),
+                max_series_per_request=1,
+                time_window=timedelta(days=2),
+                parallel=parallel,
+            )
+
+    time_series_set = asyncio.run(_get_time_series())
+    assert len(session.requests) == 4
+    assert sorted(i["startTime"][0] for i in session.requests) == [
+        "2022-05-01T00:00:00Z",
+        "2022-05-01T00:00:00Z",
+        "2022-05-03T00:00:00Z",
+        "2022-05-03T00:00:00Z",
+    ]
+    assert sorted(time_series_set.location_ids) == sorted(LOCATION_IDS)
+    assert len(time_series_set) == 2
+
+
+def test_time_series_incomplete():
+    """Check a failing batch raises instead of returning the other batches, offline"""
+    from fewspy.utils.planning import IncompleteResultError
+    from fewspy.utils.resilience import RetryPolicy
+    from stubs import AsyncStubSession, StubResponse, pi_json_response, query_dict
+
+    def handler(params):
+        if LOCATION_IDS[1] in query_dict(params)["locationIds"]:
+            return StubResponse(status=503)
+        return pi_json_response(params)
+
+    async def _get_time_series(parallel):
+        session = AsyncStubSession(handler, delay=lambda params: 0)
+        retry = RetryPolicy(retries=1, backoff_factor=0)
+        async with AsyncApi(
+            url="http://localhost/", session=session, validate="skip", retry=retry
+        ) as api:
+            return await api.get_time_series(
+                filter_id="WDB_OW_KGM",
+                location_ids=LOCATION_IDS,
+                parameter_ids=PARAMETER_IDS[1:],
+                max_series_per_request=1,
+                parallel=parallel,
+            )
+
+    for parallel in [False, True]:
+        with pytest.raises(IncompleteResultError):
+            asyncio.run(_get_time_series(parallel))
@@ -1,6 +1,10 @@
 from datetime import datetime
+import asyncio
 import pytest
 
+from fewspy.wrappers.get_time_series_async import _fetch_all_async
+from stubs import AsyncStubSession, query_dict
+
 
 LOCATION_IDS = ["NL34.HL.KGM156.HWZ1", "NL34.HL.KGM156.LWZ1"]
 PARAMETER_IDS = ["Q [m3/s] [NVT] [OW]", "WATHTE [m] [NAP] [OW]"]
@@ -46,3 +50,40 @@ def test_location_ids(time_series_set):
 
 def test_qualifier_ids(time_series_set):
     assert time_series_set.qualifier_ids == ["productie"]
+
+
+def _fetch_all_offline(session, n_requests, **kwargs):
+    """Request every location n_requests / 2 times from session, the first location slowest"""
+    requests_parameters = [
+        {"filterId": "WDB_OW_KGM", "locationIds": [LOCATION_IDS[i % 2]]} for i in range(n_requests)
+    ]
+    return asyncio.run(
+        _fetch_all_async(session, "http://localhost/timeseries", requests_parameters, **kwargs)
+    )
+
+
+def _slow_first_location(params):
+    return 0.05 if query_dict(params)["locationIds"] == [LOCATION_IDS[0]] else 0.01
+
+
+def test_max_concurrency():
+    session = AsyncStubSession(delay=_slow_first_location)
+    result = _fetch_all_offline(session, 8, max_concurrency=3)
+    assert session.max_in_flight == 3
+    assert len(session.requests) == 8
+
+    # results in order of requests, although responses complete out of order
+    assert [i.location_ids for i in result] == [[LOCATION_IDS[i % 2]] for i in range(8)]
+
+
+def test_executor():
+    """Check responses are parsed in a process pool, results in order of requests"""
+    from concurrent.futures import ProcessPoolExecutor
+    import multiprocessing
+
+    session = AsyncStubSession(delay=_slow_first_location)
+    mp_context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=2, mp_context=mp_context) as executor:
+        result = _fetch_all_offline(session, 4, max_concurrency=2, executor=executor)
+    assert [i.location_ids for i in result] == [[LOCATION_IDS[i % 2]] for i in range(4)]
+    assert all(len(i.time_series[0]) == 390 for i in result)
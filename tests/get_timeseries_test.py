@@ -1,6 +1,10 @@
 from datetime import datetime
 import pytest
 
+from fewspy.utils.planning import IncompleteResultError
+from fewspy.wrappers.get_time_series import get_time_series
+from stubs import StubResponse, StubSession, pi_json_response, query_dict
+
 kwargs = dict(
     filter_id="WDB_OW_KGM",
     location_ids=["NL34.HL.KGM156.HWZ1", "NL34.HL.KGM156.LWZ1"],
@@ -46,3 +50,28 @@ def test_location_ids(timeseriesset):
 
 def test_qualifier_ids(timeseriesset):
     assert timeseriesset.qualifier_ids == ["productie"]
+
+
+def _failing_location(location_id):
+    """Handler responding with a server error for requests of location_id"""
+
+    def handler(params):
+        if location_id in query_dict(params).get("locationIds", []):
+            return StubResponse(status=500, content=b"error")
+        return pi_json_response(params)
+
+    return handler
+
+
+def test_incomplete_result():
+    session = StubSession(_failing_location(kwargs["location_ids"][1]))
+    with pytest.raises(IncompleteResultError) as error:
+        get_time_series(
+            "http://localhost/timeseries", session=session, max_series_per_request=2, **kwargs
+        )
+    assert len(session.requests) == 2
+    assert error.value.failed_parameters[0]["locationIds"] == kwargs["location_ids"][1:]
+
+    # a request that is not split returns an empty set, as before
+    session = StubSession(_failing_location(kwargs["location_ids"][1]))
+    assert get_time_series("http://localhost/timeseries", session=session, **kwargs).empty
@@ -164,6 +164,22 @@ def test_netcdf_ts(xml_ts, nc_file):
     )
 
 
+def test_netcdf_from_content(data_dir, nc_file):
+    """Check NetCDF read from zipped content in memory to NetCDF read from file"""
+    from fewspy.io.read_netcdf import read_netcdf_from_content
+
+    nc_ts = fewspy.read_netcdf(nc_file, time_series_type="instantaneous")
+    with pytest.warns(UserWarning, match="time_series_type"):
+        content_ts = read_netcdf_from_content(
+            (data_dir / "io" / "sample.zip").read_bytes()
+        )
+
+    assert len(content_ts.time_series) == len(nc_ts.time_series)
+    for content_series, nc_series in zip(content_ts.time_series, nc_ts.time_series):
+        assert content_series.header == nc_series.header
+        assert content_series.events.equals(nc_series.events)
+
+
 def test_parquet_ts(tmp_path, xml_ts):
     """Check json time-series to xml-timeseries
 
@@ -234,3 +250,84 @@ def test_parquet_ts(tmp_path, xml_ts):
         .events[["value"]]
         .equals(xml_ts.time_series[1].events[["value"]])
     )
+
+
+def test_json_chunks_ts(data_dir, json_ts):
+    """Check json time-series parsed from small chunks to json time-series"""
+    content = (data_dir / "io" / "sample.json").read_bytes()
+    chunks = (content[i : i + 7] for i in range(0, len(content), 7))
+    chunks_ts = fewspy.io.read_json.read_json_from_chunks(chunks)
+
+    assert chunks_ts.version == json_ts.version
+    assert chunks_ts.time_zone == json_ts.time_zone
+    assert len(chunks_ts) == len(json_ts)
+    for chunks_series, json_series in zip(chunks_ts.time_series, json_ts.time_series):
+        assert chunks_series.header == json_series.header
+        assert chunks_series.events.equals(json_series.events)
+
+
+def test_json_chunks_numbers():
+    """Check numbers split at every chunk boundary, at the top level and inside the series"""
+    content = (
+        b'{"version":"1.34","timeZone":1.5,"timeSeries":[{"header":{"type":"instantaneous",'
+        b'"locationId":"loc","parameterId":"par","timeStep":{"unit":"nonequidistant"},'
+        b'"startDate":{"date":"2022-01-01","time":"00:00:00"},'
+        b'"endDate":{"date":"2022-01-01","time":"01:00:00"},"missVal":-999.0},'
+        b'"events":[{"date":"2022-01-01","time":"00:00:00","value":12.25,"flag":0},'
+        b'{"date":"2022-01-01","time":"01:00:00","value":-1.5e-3,"flag":2}]}]}'
+    )
+    expected = list(fewspy.io.read_json.iter_pi_json([content]))
+    assert expected[1] == ("timeZone", 1.5)
+    for chunk_size in range(1, len(content) + 1):
+        chunks = [content[i : i + chunk_size] for i in range(0, len(content), chunk_size)]
+        assert list(fewspy.io.read_json.iter_pi_json(chunks)) == expected
+
+
+def test_iter_xml(data_dir, xml_ts):
+    """Check xml time-series iterated one by one to xml time-series"""
+    with open(data_dir / "io" / "sample.xml", "rb") as src:
+        time_series = list(fewspy.io.read_xml.iter_xml(src))
+
+    assert len(time_series) == len(xml_ts)
+    for iter_series, xml_series in zip(time_series, xml_ts.time_series):
+        assert iter_series.header == xml_series.header
+        assert iter_series.events.equals(xml_series.events)
+
+
+def test_xml_without_series():
+    """Check the version of a PI XML document without timeZone and series"""
+    xml_string = '<TimeSeries xmlns="http://www.wldelft.nl/fews/PI" version="1.34"/>'
+    xml_ts = fewspy.io.read_xml.read_xml_from_string(xml_string)
+    assert xml_ts.version == "1.34"
+    assert len(xml_ts) == 0
+
+
+def test_to_xml(tmp_path, xml_ts, json_ts):
+    """Check time-series written to xml and read again"""
+    for time_series_set in [xml_ts, json_ts]:
+        xml_file = tmp_path / "time_series.xml"
+        time_series_set.to_xml(xml_file)
+        xml_file_ts = fewspy.read_xml(xml_file)
+
+        assert xml_file_ts.version == time_series_set.version
+        assert xml_file_ts.time_zone == time_series_set.time_zone
+        assert len(xml_file_ts) == len(time_series_set)
+        for file_series, series in zip(xml_file_ts.time_series, time_series_set.time_series):
+            assert file_series.header == series.header
+            assert file_series.events.equals(series.events)
+
+
+@pytest.mark.parametrize("stream", [False, True])
+def test_to_json(tmp_path, xml_ts, json_ts, stream):
+    """Check time-series written to json and read again"""
+    for time_series_set in [xml_ts, json_ts]:
+        json_file = tmp_path / "time_series.json"
+        time_series_set.to_json(json_file)
+        json_file_ts = fewspy.read_json(json_file, stream=stream)
+
+        assert json_file_ts.version == time_series_set.version
+        assert json_file_ts.time_zone == time_series_set.time_zone
+        assert len(json_file_ts) == len(time_series_set)
+        for file_series, series in zip(json_file_ts.time_series, time_series_set.time_series):
+            assert file_series.header == series.header
+            assert file_series.events.equals(series.events)
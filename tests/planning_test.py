@@ -0,0 +1,98 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from fewspy.utils.planning import (
+    estimate_time_window,
+    plan_batches,
+    plan_time_windows,
+    time_step_to_seconds,
+)
+
+URL = "https://fews/FewsWebServices/rest/fewspiservice/v1/timeseries"
+PARAMETERS = {"filterId": "WDB_OW_KGM", "documentFormat": "PI_JSON"}
+LOCATION_IDS = [f"NL34.HL.KGM{i:03d}.HWZ1" for i in range(1000)]
+PARAMETER_IDS = ["Q [m3/s] [NVT] [OW]", "WATHTE [m] [NAP] [OW]"]
+
+
+def _requested(batches):
+    return sorted(
+        (location_id, parameter_id)
+        for batch in batches
+        for location_id in batch["locationIds"]
+        for parameter_id in batch["parameterIds"]
+    )
+
+
+def test_single_batch():
+    batches = plan_batches(URL, PARAMETERS, LOCATION_IDS[:10], PARAMETER_IDS)
+    assert len(batches) == 1
+    assert batches[0]["filterId"] == "WDB_OW_KGM"
+    assert batches[0]["locationIds"] == LOCATION_IDS[:10]
+
+
+def test_url_length_bound():
+    batches = plan_batches(URL, PARAMETERS, LOCATION_IDS, PARAMETER_IDS, max_url_length=2000)
+    assert len(batches) > 1
+    assert _requested(batches) == sorted(
+        (i, j) for i in LOCATION_IDS for j in PARAMETER_IDS
+    )
+
+
+def test_series_bound():
+    batches = plan_batches(
+        URL, PARAMETERS, LOCATION_IDS, PARAMETER_IDS, max_series_per_request=100
+    )
+    assert len(batches) == 20
+    assert all(
+        len(i["locationIds"]) * len(i["parameterIds"]) <= 100 for i in batches
+    )
+
+
+def test_no_ids():
+    batches = plan_batches(URL, PARAMETERS)
+    assert batches == [PARAMETERS]
+
+
+def test_time_step_to_seconds():
+    assert time_step_to_seconds({"unit": "minute", "multiplier": 15.0}) == 900
+    assert time_step_to_seconds({"unit": "hour"}) == 3600
+    assert time_step_to_seconds({"unit": "nonequidistant"}) is None
+
+
+def test_plan_time_windows():
+    windows = plan_time_windows(
+        datetime(2022, 1, 1), datetime(2022, 1, 10), timedelta(days=4)
+    )
+    assert [(i["startTime"], i["endTime"]) for i in windows] == [
+        ("2022-01-01T00:00:00Z", "2022-01-05T00:00:00Z"),
+        ("2022-01-05T00:00:00Z", "2022-01-09T00:00:00Z"),
+        ("2022-01-09T00:00:00Z", "2022-01-10T00:00:00Z"),
+    ]
+    assert plan_time_windows(datetime(2022, 1, 1), None, timedelta(days=4)) == [{}]
+
+
+def test_estimate_time_window():
+    time_steps = [{"unit": "minute", "multiplier": 10}, {"unit": "nonequidistant"}]
+    assert estimate_time_window(time_steps, max_events_per_request=288) == timedelta(
+        days=1
+    )
+    assert estimate_time_window([{"unit": "nonequidistant"}], 288) is None
+
+
+def test_plan_time_windows_not_positive():
+    for time_window in [timedelta(0), timedelta(days=-1)]:
+        with pytest.raises(ValueError, match="time_window"):
+            plan_time_windows(datetime(2022, 1, 1), datetime(2022, 1, 10), time_window)
+
+
+def test_estimate_time_window_minimum():
+    time_steps = [{"unit": "minute", "multiplier": 10}] * 500
+    with pytest.raises(ValueError, match="max_events_per_request"):
+        estimate_time_window(time_steps, max_events_per_request=0)
+
+    # a budget smaller than one event per series is rounded up to one time step
+    time_window = estimate_time_window(time_steps, max_events_per_request=1)
+    assert time_window == timedelta(minutes=10)
+    windows = plan_time_windows(datetime(2022, 1, 1), datetime(2022, 1, 1, 1), time_window)
+    assert len(windows) == 6
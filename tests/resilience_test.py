@@ -0,0 +1,135 @@
+import asyncio
+
+import pytest
+
+import fewspy.utils.session
+from fewspy.utils.resilience import CircuitBreaker, CircuitOpenError, RetryPolicy
+from fewspy.utils.session import http_get, http_get_async
+from stubs import AsyncStubSession, StubResponse, StubSession
+
+URL = "http://localhost/FewsWebServices/rest/fewspiservice/v1/timeseries"
+
+
+def test_retry_delay():
+    retry = RetryPolicy(backoff_factor=1, max_backoff=4)
+    assert all(0 <= retry.delay(0) <= 1 for _ in range(100))
+    assert all(0 <= retry.delay(10) <= 4 for _ in range(100))
+    assert retry.delay(0, retry_after="3") >= 3
+
+
+def test_circuit_breaker():
+    circuit_breaker = CircuitBreaker(failure_threshold=2, recovery_time=60)
+    circuit_breaker.record_failure()
+    assert circuit_breaker.state == "closed"
+    circuit_breaker.record_failure()
+    assert circuit_breaker.state == "open"
+    with pytest.raises(CircuitOpenError):
+        circuit_breaker.check("http://localhost")
+    circuit_breaker.record_success()
+    assert circuit_breaker.state == "closed"
+
+
+def test_circuit_breaker_half_open():
+    circuit_breaker = CircuitBreaker(failure_threshold=1, recovery_time=0)
+    circuit_breaker.record_failure()
+    assert circuit_breaker.state == "half-open"
+    assert circuit_breaker.allow_request()
+
+
+def test_circuit_breaker_single_trial():
+    from concurrent.futures import ThreadPoolExecutor
+
+    circuit_breaker = CircuitBreaker(failure_threshold=1, recovery_time=60)
+    circuit_breaker.record_failure()
+    circuit_breaker.opened_at -= 60
+    assert circuit_breaker.state == "half-open"
+
+    # one of the concurrent requests is the trial, the others are refused
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        allowed = list(executor.map(lambda _: circuit_breaker.allow_request(), range(8)))
+    assert allowed.count(True) == 1
+    with pytest.raises(CircuitOpenError):
+        circuit_breaker.check("http://localhost")
+
+    # a failed trial re-opens the circuit, a successful trial closes it
+    circuit_breaker.record_failure()
+    assert circuit_breaker.state == "open"
+    circuit_breaker.opened_at -= 60
+    assert circuit_breaker.allow_request()
+    circuit_breaker.record_success()
+    assert circuit_breaker.state == "closed"
+    assert all(circuit_breaker.allow_request() for _ in range(8))
+
+
+def _responses(*statuses, headers=None):
+    """Handler answering the requests with statuses in turn, the last status repeated"""
+    statuses = list(statuses)
+
+    def handler(params):
+        status = statuses.pop(0) if len(statuses) > 1 else statuses[0]
+        return StubResponse(status=status, headers=headers if status != 200 else None)
+
+    return handler
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Seconds slept by http_get, without sleeping"""
+    sleeps = []
+    monkeypatch.setattr(fewspy.utils.session.time, "sleep", sleeps.append)
+    return sleeps
+
+
+def test_http_get_retry(sleeps):
+    session = StubSession(_responses(503, 503, 200))
+    response = http_get(URL, session=session, retry=RetryPolicy(retries=3), stream=True)
+    assert response.status_code == 200
+    assert len(session.requests) == 3
+    assert len(sleeps) == 2
+
+    # discarded responses are closed, returning their connection to the pool
+    assert [i.closed for i in session.responses] == [True, True, False]
+
+
+def test_http_get_retry_after(sleeps):
+    session = StubSession(_responses(503, 200, headers={"Retry-After": "2"}))
+    retry = RetryPolicy(retries=3, backoff_factor=0)
+    assert http_get(URL, session=session, retry=retry).status_code == 200
+    assert sleeps == [2]
+
+
+def test_http_get_no_retry_client_error(sleeps):
+    session = StubSession(_responses(404))
+    circuit_breaker = CircuitBreaker(failure_threshold=1)
+    response = http_get(
+        URL, session=session, retry=RetryPolicy(retries=3), circuit_breaker=circuit_breaker
+    )
+    assert response.status_code == 404
+    assert len(session.requests) == 1
+    assert circuit_breaker.state == "closed"
+
+
+def test_http_get_circuit_opens(sleeps):
+    session = StubSession(_responses(503))
+    circuit_breaker = CircuitBreaker(failure_threshold=2, recovery_time=60)
+    with pytest.raises(CircuitOpenError):
+        http_get(
+            URL, session=session, retry=RetryPolicy(retries=5), circuit_breaker=circuit_breaker
+        )
+    assert len(session.requests) == 2
+
+
+def test_http_get_async():
+    retry = RetryPolicy(retries=5, backoff_factor=0)
+    session = AsyncStubSession(_responses(503, 200), delay=lambda params: 0)
+    response, _ = asyncio.run(http_get_async(session, URL, retry=retry))
+    assert response.status == 200
+    assert len(session.requests) == 2
+
+    session = AsyncStubSession(_responses(503), delay=lambda params: 0)
+    circuit_breaker = CircuitBreaker(failure_threshold=2, recovery_time=60)
+    with pytest.raises(CircuitOpenError):
+        asyncio.run(
+            http_get_async(session, URL, retry=retry, circuit_breaker=circuit_breaker)
+        )
+    assert len(session.requests) == 2
@@ -0,0 +1,15 @@
+from fewspy.utils.session import create_session
+
+
+def test_create_session():
+    session = create_session(pool_size=4)
+    for prefix in ["http://", "https://"]:
+        adapter = session.get_adapter(f"{prefix}localhost")
+        assert adapter._pool_maxsize == 4
+    assert session.headers["Connection"] == "keep-alive"
+
+
+def test_api_session(api):
+    with api.session.get(f"{api.url}timezoneid") as response:
+        assert response.ok
+    assert api.session.get_adapter(api.url).poolmanager.pools
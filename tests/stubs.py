@@ -0,0 +1,112 @@
+"""Offline stand-ins for requests and aiohttp sessions, answering requests from a handler."""
+
+import asyncio
+import json
+
+from config import DATA_DIR
+
+with open(DATA_DIR / "pi_time_series.json") as src:
+    PI_TIME_SERIES = json.load(src)
+
+
+def query_dict(params) -> dict:
+    """Request parameters as dict of lists, from a dict or a list of (key, value) tuples"""
+    items = params.items() if isinstance(params, dict) else (params or [])
+    query = {}
+    for key, value in items:
+        values = value if isinstance(value, (list, tuple)) else [value]
+        query.setdefault(key, []).extend(str(i) for i in values)
+    return query
+
+
+class StubResponse:
+    """Response with the attributes fewspy reads from requests and aiohttp responses"""
+
+    def __init__(self, status: int = 200, content: bytes = b"", headers: dict | None = None):
+        self.status = status
+        self.status_code = status
+        self.content = content
+        self.headers = headers or {}
+        self.url = "http://localhost/stub"
+        self.closed = False
+
+    @property
+    def ok(self) -> bool:
+        return self.status < 400
+
+    @property
+    def text(self) -> str:
+        return self.content.decode()
+
+    def close(self):
+        self.closed = True
+
+    def raise_for_status(self):
+        if not self.ok:
+            raise IOError(f"{self.status} error")
+
+    async def read(self) -> bytes:
+        return self.content
+
+
+def pi_json_response(params) -> StubResponse:
+    """PI_JSON response with the time series in pi_time_series.json of the requested locationIds"""
+    location_ids = query_dict(params).get("locationIds")
+    time_series = [
+        i
+        for i in PI_TIME_SERIES["timeSeries"]
+        if (location_ids is None) or (i["header"]["locationId"] in location_ids)
+    ]
+    content = {**PI_TIME_SERIES, "timeSeries": time_series}
+    return StubResponse(content=json.dumps(content).encode())
+
+
+class StubSession:
+    """requests.Session answering every GET with the next response of handler"""
+
+    def __init__(self, handler):
+        self.handler = handler
+        self.requests = []
+        self.responses = []
+
+    def get(self, url, params=None, **kwargs):
+        self.requests += [query_dict(params)]
+        self.responses += [self.handler(params)]
+        return self.responses[-1]
+
+
+class _StubRequest:
+    def __init__(self, session, params):
+        self.session = session
+        self.params = params
+
+    async def __aenter__(self):
+        self.session.in_flight += 1
+        self.session.max_in_flight = max(self.session.max_in_flight, self.session.in_flight)
+        try:
+            await asyncio.sleep(self.session.delay(self.params))
+            return self.session.handler(self.params)
+        except BaseException:
+            self.session.in_flight -= 1
+            raise
+
+    async def __aexit__(self, *args):
+        self.session.in_flight -= 1
+
+
+class AsyncStubSession:
+    """aiohttp.ClientSession answering every GET with handler after delay, counting requests in flight"""
+
+    def __init__(self, handler=pi_json_response, delay=lambda params: 0.01):
+        self.handler = handler
+        self.delay = delay
+        self.requests = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def get(self, url, params=None, **kwargs):
+        self.requests += [query_dict(params)]
+        return _StubRequest(self, params)
+
+    async def close(self):
+        pass
@@ -0,0 +1,35 @@
+import json
+import pytest
+from pathlib import Path
+
+from config import DATA_DIR
+from fewspy.cache import Manifest, TimeSeriesCache
+from fewspy.cache.manifest import FieldEndtry
+from fewspy.time_series import TimeSeriesSet
+
+PARAMETER_ID = "WATHTE [m] [NAP] [OW]"
+
+
+@pytest.fixture(scope="module")
+def cache(tmp_path_factory):
+    cache_dir = tmp_path_factory.mktemp("cache")
+    with open(DATA_DIR / "pi_time_series.json") as src:
+        time_series_set = TimeSeriesSet.from_dict(json.load(src))
+    time_series_set.to_netcdf(cache_dir / "20240101T000000" / "filter")
+    files = [FieldEndtry.from_file(i) for i in Path(cache_dir).glob("*/filter/*.nc")]
+    manifest = Manifest(
+        current_cache="20240101T000000", files=files, expected_file_count=len(files)
+    )
+    return TimeSeriesCache(manifest)
+
+
+def test_get_time_series_polars(cache):
+    pytest.importorskip("polars")
+    df = cache.get_time_series("filter", PARAMETER_ID)
+    polars_df = cache.get_time_series("filter", PARAMETER_ID, backend="polars")
+    assert polars_df.columns[1:] == list(df.columns.get_level_values("location_id"))
+    assert (polars_df["datetime"].to_numpy() == df.index.to_numpy()).all()
+    assert pytest.approx(polars_df.drop("datetime").to_numpy(), nan_ok=True) == df.to_numpy()
+
+    with pytest.raises(ValueError, match="backend"):
+        cache.get_time_series("filter", PARAMETER_ID, backend="arrow")
@@ -1,6 +1,10 @@
 from pathlib import Path
 import json
-from fewspy.time_series import TimeSeriesSet
+from dataclasses import replace
+import numpy as np
+import pandas as pd
+import pytest
+from fewspy.time_series import Events, TimeSeries, TimeSeriesSet, reliables
 
 DATA_PATH = Path(__file__).parent / "data"
 
@@ -41,3 +45,262 @@ def test_location_ids():
 
 def test_qualifier_ids():
     assert timeseriesset.qualifier_ids == ["validatie"]
+
+
+def test_concat_deduplicate():
+    first = TimeSeriesSet.from_dict(pi_time_series)
+    second = TimeSeriesSet.from_dict(pi_time_series)
+    concatenated = TimeSeriesSet.concat([first, second])
+    assert len(concatenated) == 4
+    stitched = TimeSeriesSet.concat([first, second], deduplicate=True)
+    assert len(stitched) == 2
+    assert stitched.time_series[0].events.equals(first.time_series[0].events)
+
+
+def test_events_from_dict():
+    pi_events = [
+        {"date": "2024-01-01", "time": "01:00:00", "value": "1.5", "flag": "0"},
+        {"date": "2024-01-01", "time": "01:15:00", "value": "-999.0", "flag": "8"},
+        {"date": "2024-01-01", "time": "01:30:00", "value": "2.5", "flag": "2"},
+    ]
+    events = Events.from_dict(pi_events, missing_value=-999.0, tz_offset=1.0)
+    assert list(events.index) == [
+        pd.Timestamp("2024-01-01 00:00:00"),
+        pd.Timestamp("2024-01-01 00:30:00"),
+    ]
+    assert list(events["value"]) == [1.5, 2.5]
+    assert list(events["flag"]) == [0, 2]
+    assert Events.from_dict([]).empty
+
+
+def test_columnar():
+    columnar = TimeSeriesSet.from_dict(pi_time_series, columnar=True)
+    assert len(columnar) == len(timeseriesset)
+    for i, j in zip(columnar.time_series, timeseriesset.time_series):
+        assert i.header == j.header
+        assert i.events.equals(j.events)
+    store = timeseriesset.to_columnar()
+    assert list(store.counts) == [len(i) for i in timeseriesset.time_series]
+    assert store[-1].events.equals(timeseriesset.time_series[-1].events)
+
+
+def test_columnar_missing_flags():
+    """Check flag dtypes of a columnar set with a time series without flags to a non-columnar set"""
+    pi_series = json.loads(json.dumps(pi_time_series))
+    for event in pi_series["timeSeries"][0]["events"]:
+        del event["flag"]
+    for compact in [False, True]:
+        expected = TimeSeriesSet.from_dict(pi_series, compact=compact)
+        columnar = TimeSeriesSet.from_dict(pi_series, columnar=True, compact=compact)
+        for i, j in zip(columnar.time_series, expected.time_series):
+            assert i.events["flag"].dtype == j.events["flag"].dtype
+            assert i.events.equals(j.events)
+
+
+def test_from_dict_without_validation():
+    trusted = TimeSeriesSet.from_dict(pi_time_series, validate=False)
+    for i, j in zip(trusted.time_series, timeseriesset.time_series):
+        assert i.header.__dict__ == j.header.__dict__
+        assert i.events.equals(j.events)
+
+
+def test_get_and_select():
+    time_series_set = TimeSeriesSet.from_dict(pi_time_series)
+    location_id = "NL34.HL.KGM156.LWZ1"
+    parameter_id = "WATHTE [m] [NAP] [OW]"
+    time_series = time_series_set.get(location_id, parameter_id, "validatie")
+    assert time_series.header.location_id == location_id
+    assert time_series_set.get(location_id, parameter_id) is None
+
+    selection = time_series_set.select(location_ids=location_id)
+    assert len(selection) == 1
+    assert selection.time_series[0] is time_series
+    assert len(time_series_set.select(qualifier_ids="validatie")) == 2
+    assert len(time_series_set.select(location_ids="unknown")) == 0
+
+    # add updates the index
+    time_series_set.add(
+        TimeSeries(header=replace(time_series.header, location_id="new"))
+    )
+    assert "new" in time_series_set.location_ids
+    assert time_series_set.get("new", parameter_id, ["validatie"]) is not None
+
+
+def test_get_after_in_place_changes():
+    time_series_set = TimeSeriesSet.from_dict(pi_time_series)
+    first, last = time_series_set.time_series[0], time_series_set.time_series[-1]
+    assert time_series_set.get(first.header.location_id, first.header.parameter_id, "validatie") is first
+
+    time_series_set.time_series.reverse()
+    assert time_series_set.select(location_ids=last.header.location_id).time_series == [last]
+    assert time_series_set.location_ids[0] == last.header.location_id
+
+    moved = TimeSeries(header=replace(first.header, location_id="moved"), events=first.events)
+    time_series_set.time_series[-1] = moved
+    assert time_series_set.get(first.header.location_id, first.header.parameter_id, "validatie") is None
+    assert time_series_set.get("moved", first.header.parameter_id, "validatie") is moved
+    assert "moved" in time_series_set.location_ids
+
+    time_series_set.time_series.sort(key=lambda i: i.header.location_id)
+    assert time_series_set.select(location_ids="moved").time_series == [moved]
+
+
+def test_to_df():
+    df = timeseriesset.to_df()
+    assert list(df.columns) == [
+        (i.header.location_id, i.header.parameter_id) for i in timeseriesset.time_series
+    ]
+    for i, time_series in enumerate(timeseriesset.time_series):
+        events = time_series.events.loc[time_series.events["flag"] < 6, "value"]
+        assert df.iloc[:, i].dropna().equals(events.rename(df.columns[i]))
+
+
+def test_to_df_reliables():
+    """Check to_df to concatenated reliables, the path it replaces"""
+    header = timeseriesset.time_series[0].header
+    datetimes = pd.date_range("2024-01-01", periods=4, freq="15min", name="datetime")
+    time_series = [
+        # missing flags
+        TimeSeries(
+            header=header,
+            events=pd.DataFrame(
+                {"value": [1.0, 2.0, 3.0, 4.0], "flag": [0.0, np.nan, 8.0, 2.0]}, index=datetimes
+            ),
+        ),
+        # no flag column
+        TimeSeries(
+            header=replace(header, location_id="unflagged"),
+            events=pd.DataFrame({"value": [5.0, 6.0]}, index=datetimes[1:3]),
+        ),
+    ]
+    df = TimeSeriesSet(time_series=time_series).to_df()
+    expected = pd.concat(
+        [reliables(i.events)["value"] for i in time_series], axis=1, sort=True
+    )
+    assert np.array_equal(df.to_numpy(), expected.to_numpy(), equal_nan=True)
+    assert df.index.equals(expected.index)
+
+    assert TimeSeriesSet().to_df().empty
+
+
+def test_lazy_events():
+    lazy = TimeSeriesSet.from_dict(pi_time_series, lazy=True)
+    assert not lazy.empty
+    assert all(i.lazy for i in lazy.time_series)
+    assert lazy.location_ids == timeseriesset.location_ids
+    for i, j in zip(lazy.time_series, timeseriesset.time_series):
+        assert i.events.equals(j.events)
+        assert not i.lazy
+
+
+def test_lazy_empty():
+    missing = json.loads(json.dumps(pi_time_series))
+    for time_series in missing["timeSeries"]:
+        for event in time_series["events"]:
+            event["value"] = time_series["header"]["missVal"]
+    lazy = TimeSeriesSet.from_dict(missing, lazy=True)
+    assert lazy.empty
+    assert all(i.lazy for i in lazy.time_series)
+    assert TimeSeriesSet.from_dict(missing).empty
+
+
+def test_compact():
+    compact = TimeSeriesSet.from_dict(pi_time_series, compact=True)
+    events = compact.time_series[0].events
+    assert events["value"].dtype == "float32"
+    assert events["flag"].dtype == "int8"
+    assert compact.time_series[0].header.parameter_id is (
+        compact.time_series[1].header.parameter_id
+    )
+    assert compact.memory_usage()["events"] < timeseriesset.memory_usage()["events"]
+
+
+def test_merge():
+    merged = TimeSeriesSet.from_dict(pi_time_series)
+    merged.merge(TimeSeriesSet.from_dict(pi_time_series))
+    assert len(merged) == 2
+    for i, j in zip(merged.time_series, timeseriesset.time_series):
+        assert i.events.equals(j.events)
+
+    # new time series are added
+    time_series = timeseriesset.time_series[0]
+    new = TimeSeriesSet(
+        time_series=[
+            TimeSeries(
+                header=replace(time_series.header, location_id="new"),
+                events=time_series.events,
+            )
+        ]
+    )
+    merged.merge(new)
+    assert len(merged) == 3
+    assert merged.get("new", time_series.header.parameter_id, "validatie") is not None
+
+
+def test_to_long_and_arrow():
+    long = timeseriesset.to_long()
+    assert list(long.columns) == [
+        "location_id",
+        "parameter_id",
+        "qualifier_id",
+        "datetime",
+        "value",
+        "flag",
+    ]
+    assert len(long) == sum(len(i) for i in timeseriesset.time_series)
+    assert set(long["location_id"]) == set(timeseriesset.location_ids)
+
+    table = timeseriesset.to_arrow()
+    assert table.num_rows == len(long)
+    assert table.schema.metadata[b"version"] == b"1.28"
+    assert table.column("value").to_pandas().equals(long["value"])
+
+
+def test_to_polars():
+    pytest.importorskip("polars")
+    df = timeseriesset.to_df()
+    wide = timeseriesset.to_polars()
+    assert wide.columns[1:] == [f"{i}/{j}/validatie" for i, j in df.columns]
+    assert np.array_equal(
+        wide.drop("datetime").to_numpy(), df.to_numpy(), equal_nan=True
+    )
+
+    long = timeseriesset.to_polars(how="long")
+    assert long.height == len(timeseriesset.to_long())
+
+
+def test_to_polars_qualifiers():
+    pytest.importorskip("polars")
+    time_series = timeseriesset.time_series[0]
+    time_series_set = TimeSeriesSet(
+        time_series=[
+            time_series,
+            TimeSeries(
+                header=replace(time_series.header, qualifier_id=["productie"]),
+                events=time_series.events,
+            ),
+        ]
+    )
+    wide = time_series_set.to_polars()
+    location_id, parameter_id = time_series.header.location_id, time_series.header.parameter_id
+    assert wide.columns[1:] == [
+        f"{location_id}/{parameter_id}/validatie",
+        f"{location_id}/{parameter_id}/productie",
+    ]
+    assert np.array_equal(
+        wide.drop("datetime").to_numpy(), time_series_set.to_df().to_numpy(), equal_nan=True
+    )
+
+
+def test_ipc(tmp_path):
+    content = timeseriesset.to_ipc()
+    ipc_file = tmp_path / "time_series.arrow"
+    timeseriesset.to_ipc(ipc_file)
+    for source in [content, ipc_file]:
+        time_series_set = TimeSeriesSet.from_ipc(source)
+        assert time_series_set.version == timeseriesset.version
+        assert time_series_set.time_zone == timeseriesset.time_zone
+        assert [i.header for i in time_series_set.time_series] == [
+            i.header for i in timeseriesset.time_series
+        ]
+        assert time_series_set.to_df().equals(timeseriesset.to_df())
@@ -0,0 +1,37 @@
+import pytest
+
+from fewspy import Api
+from fewspy.utils import url as url_module
+from fewspy.utils.url import normalize_url, validate_url
+
+UNREACHABLE_URL = "http://localhost:1/FewsWebServices/rest/fewspiservice/v1"
+
+
+def test_normalize_url():
+    assert normalize_url("https://fews/v1") == ("https://fews/v1/", True)
+    assert normalize_url("http://fews/v1/") == ("http://fews/v1/", False)
+
+
+def test_validate_url_memoized():
+    url, _ = normalize_url(UNREACHABLE_URL)
+    url_module._VALIDATED_URLS.add(url)
+    try:
+        assert validate_url(UNREACHABLE_URL) == (url, False)
+    finally:
+        url_module._VALIDATED_URLS.discard(url)
+
+
+def test_api_lazy():
+    api = Api(UNREACHABLE_URL, validate="lazy")
+    assert api.url.endswith("/")
+    assert not api._validated
+
+
+def test_api_skip():
+    api = Api(UNREACHABLE_URL, validate="skip")
+    assert api._validated
+
+
+def test_api_invalid_validate():
+    with pytest.raises(ValueError):
+        Api(UNREACHABLE_URL, validate="never")